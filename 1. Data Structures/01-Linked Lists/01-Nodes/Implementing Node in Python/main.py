@@ -2,11 +2,19 @@
 
 
 class Node:
+    # Store the attributes in fixed slots instead of a per-node __dict__, which makes every node smaller
+    __slots__ = ("value", "link_node")
+
     # Initialize a new node with a value and optional link to next node
     def __init__(self, value, link_node=None):
         self.value = value
         self.link_node = link_node
 
+    # Give a recycled node a new value and link, as if it had just been created (used by NodePool)
+    def reset(self, value, link_node=None):
+        self.value = value
+        self.link_node = link_node
+
     # Get the value stored in the node
     def get_value(self):
         return self.value
@@ -20,16 +28,88 @@ class Node:
         self.link_node = link_node
 
 
-node1 = Node("A")
-node2 = Node("B")
-node3 = Node("C")
-
-node1.set_link_node(node2)
-node2.set_link_node(node3)
-
-print(node1.get_value())  # A
-print(node1.get_link_node().get_value())  # B
-print(node2.get_link_node().get_value())  # C
+class NodePool:
+    # Keep unlinked nodes of one node class and hand them out again instead of creating new ones.
+    # Any node class with a reset method taking the same arguments as __init__ can be pooled.
+    def __init__(self, node_class=Node, max_free=1024):
+        self.node_class = node_class
+        self.max_free = max_free  # At most this many unused nodes are kept; the rest are left to the garbage collector
+        self.free_nodes = []
+        self.free_ids = set()  # id() of every node in free_nodes, to catch a node released twice
+
+        self.allocations = 0  # Nodes created because the pool was empty
+        self.reuses = 0  # Nodes handed out again from the pool
+        self.releases = 0  # Nodes given back to the pool
+        self.in_use = 0  # Nodes handed out and not released yet
+        self.high_water = 0  # Largest number of nodes in use at the same time
+
+    # Return a node initialized with the given arguments, reusing a released node when there is one
+    def acquire(self, *args):
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            self.free_ids.discard(id(node))
+            node.reset(*args)
+            self.reuses += 1
+        else:
+            node = self.node_class(*args)
+            self.allocations += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return node
+
+    # Take back a node that is no longer linked anywhere; the caller must not use it afterwards
+    def release(self, node):
+        if id(node) in self.free_ids:  # Pooled twice, the node would be handed out to two owners
+            raise ValueError("node was already released")
+
+        self.in_use -= 1
+        self.releases += 1
+        if len(self.free_nodes) < self.max_free:
+            node.reset(None)  # Drop the value and the links, so the pool keeps nothing else alive
+            self.free_nodes.append(node)
+            self.free_ids.add(id(node))
+
+    # Return the counters as a dictionary
+    def stats(self):
+        return {
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "releases": self.releases,
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+            "free": len(self.free_nodes),
+        }
+
+
+if __name__ == "__main__":
+    node1 = Node("A")
+    node2 = Node("B")
+    node3 = Node("C")
+
+    node1.set_link_node(node2)
+    node2.set_link_node(node3)
+
+    print(node1.get_value())  # A
+    print(node1.get_link_node().get_value())  # B
+    print(node2.get_link_node().get_value())  # C
+
+    # Recycling nodes with a NodePool
+    pool = NodePool()
+    first = pool.acquire("X")  # Created: the pool is empty
+    second = pool.acquire("Y", first)  # Created
+    pool.release(second)  # Unlinked and kept for reuse
+    third = pool.acquire("Z")  # Reused: the same object as second, with a new value
+
+    print(third is second, third.get_value(), third.get_link_node())  # True Z None
+    print(pool.stats())  # {'allocations': 2, 'reuses': 1, 'releases': 1, 'in_use': 2, 'high_water': 2, 'free': 0}
+
+    pool.release(first)
+    try:
+        pool.release(first)  # Already waiting in the pool: a second release would hand it out twice
+    except ValueError as error:
+        print("Error:", error)  # Error: node was already released
 
 # Output:
 
@@ -38,6 +118,9 @@ print(node2.get_link_node().get_value())  # C
 A
 B
 C
+True Z None
+{'allocations': 2, 'reuses': 1, 'releases': 1, 'in_use': 2, 'high_water': 2, 'free': 0}
+Error: node was already released
 
 """
 
@@ -68,6 +151,15 @@ Let's analyze the time and space complexity of the `Node` class and its methods.
    - This method sets the next node that this node links to.
    - **Time Complexity**: O(1) - It involves a single operation (assigning `link_node` to `self.link_node`).
 
+5. **`reset` Method**:
+   - This method gives a recycled node a new value and link.
+   - **Time Complexity**: O(1) - Two assignments, like `__init__`.
+
+6. **`NodePool.acquire` and `NodePool.release` Methods**:
+   - `acquire` pops a free node and resets it, or creates a new one when the pool is empty; `release` resets the node
+   and pushes it onto the free list.
+   - **Time Complexity**: O(1) - A list `pop` or `append` and a few counter updates.
+
 ---
 
 ### Space Complexity
@@ -88,6 +180,14 @@ Let's analyze the time and space complexity of the `Node` class and its methods.
    - This method does not use any additional space beyond what is already allocated for the node.
    - **Space Complexity**: O(1) - No additional space is required.
 
+5. **`__slots__`**:
+   - Without `__slots__`, every node keeps its attributes in its own `__dict__`. With `__slots__`, the two attributes
+   are stored in fixed places inside the object, so a node takes 48 bytes instead of about 88 on CPython 3.11.
+
+6. **`NodePool`**:
+   - **Space Complexity**: O(max_free) - The pool keeps at most `max_free` unused nodes; nodes released beyond that
+   are left to the garbage collector.
+
 ---
 
 ### Summary
@@ -198,4 +298,37 @@ Node 1 ('A')  --->  Node 2 ('B')  --->  Node 3 ('C')  --->  None
 
 By calling methods like `get_link_node()` and `get_value()`, you can access and manipulate data in this sequence.
 
+---
+
+### Recycling Nodes with `NodePool`
+
+Linked structures that grow and shrink all the time, like a linked queue or stack, create a new node for every
+insert and drop one for every removal. `NodePool` keeps the dropped nodes and hands them out again:
+
+1. **`acquire(*args)`**: takes a node from `free_nodes` and calls its `reset(*args)`, or creates a new
+   `node_class(*args)` when there is none. The arguments are the same as for the node class's `__init__`.
+2. **`release(node)`**: calls `node.reset(None)`, so the pooled node no longer keeps its value or its neighbours
+   alive, and puts it on `free_nodes` (unless `max_free` nodes are already waiting there). Releasing a node that is
+   already on `free_nodes` raises `ValueError`: it would be handed out twice, and two lists would share it.
+   `free_ids` holds the `id()` of every free node, so the check is a set lookup.
+3. **Counters**: `allocations` (new nodes), `reuses` (recycled nodes), `releases`, `in_use` and `high_water`, the
+   largest number of nodes in use at once. `stats()` returns them as a dictionary.
+
+```
+pool = NodePool()
+first = pool.acquire("X")          # allocations = 1
+second = pool.acquire("Y", first)  # allocations = 2, high_water = 2
+pool.release(second)               # free_nodes = [second]
+third = pool.acquire("Z")          # reuses = 1, third is second
+```
+
+- Any node class can be pooled if it has a `reset` method with the same parameters as `__init__`. The `Node` classes
+  of `LinkedList`, `DoublyLinkedList`, the linked `Queue` and the linked `Stack` have one, and those containers accept
+  a `node_pool` argument: `NodePool(module.Node)` for the container's own `Node` class.
+- A released node is reused for another value, so a node must only be released once it is unlinked and nothing
+  else refers to it. The containers do this themselves for the nodes they remove.
+- `pool_benchmark.py` measures the effect on all four containers. On CPython the pool removes most allocations and
+  garbage collector runs but saves little time, because creating a small object is already cheap; `max_free` has to
+  be at least the number of nodes released in a row, or most of them are dropped instead of reused.
+
 """
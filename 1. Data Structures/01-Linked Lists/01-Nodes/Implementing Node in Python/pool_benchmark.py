@@ -0,0 +1,161 @@
+# Benchmark: node churn in the linked Queue, linked Stack, LinkedList and DoublyLinkedList,
+# with a NodePool recycling the removed nodes and without one
+
+import gc
+import importlib.util
+import os
+import time
+
+DATA_STRUCTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
+ROUNDS = 10
+BURST = 100_000  # Each round inserts this many values, then removes them all again
+
+
+def load_module(name, *path):
+    # Import a main.py from another folder of the repository
+    spec = importlib.util.spec_from_file_location(name, os.path.join(DATA_STRUCTURES, *path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def churn(container, insert, remove):
+    # Fill the container with BURST values and empty it again, ROUNDS times
+    for _ in range(ROUNDS):
+        for value in range(BURST):
+            insert(container, value)
+        for _ in range(BURST):
+            remove(container)
+
+
+def measure(make_container, insert, remove):
+    # Return the time in seconds and the number of garbage collections that the churn caused
+    container = make_container()
+    collections_before = sum(stats["collections"] for stats in gc.get_stats())
+    start = time.perf_counter()
+    churn(container, insert, remove)
+    elapsed = time.perf_counter() - start
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+    return elapsed, collections
+
+
+if __name__ == "__main__":
+    nodes = load_module("nodes", "01-Linked Lists", "01-Nodes", "Implementing Node in Python", "main.py")
+    queue_module = load_module(
+        "linked_queue",
+        "02-Queues",
+        "02_Implementing Queues in Python",
+        "Implementing Queue Using a Linked List",
+        "main.py",
+    )
+    stack_module = load_module(
+        "linked_stack",
+        "03-Stacks",
+        "02_Implementing Stacks in Python",
+        "Implementing Stack Using a Linked List",
+        "main.py",
+    )
+    singly_module = load_module(
+        "singly_linked_list",
+        "01-Linked Lists",
+        "02-Singly Linked List",
+        "02-Implementing Singly Linked List in Python",
+        "main.py",
+    )
+    doubly_module = load_module(
+        "doubly_linked_list",
+        "01-Linked Lists",
+        "03-Doubly Linked List",
+        "Implementing Doubly Linked List in Python",
+        "main.py",
+    )
+
+    def remove_linked_list_head(linked_list):
+        # LinkedList has no remove_head; removing the head node's value is O(1)
+        linked_list.remove_node(linked_list.get_head_node().get_value())
+
+    cases = [
+        ("Queue", queue_module, queue_module.Queue, queue_module.Queue.enqueue, queue_module.Queue.dequeue),
+        ("Stack", stack_module, stack_module.Stack, stack_module.Stack.push, stack_module.Stack.pop),
+        (
+            "LinkedList",
+            singly_module,
+            singly_module.LinkedList,
+            singly_module.LinkedList.insert_end,
+            remove_linked_list_head,
+        ),
+        (
+            "DoublyLinkedList",
+            doubly_module,
+            doubly_module.DoublyLinkedList,
+            doubly_module.DoublyLinkedList.add_to_tail,
+            doubly_module.DoublyLinkedList.remove_head,
+        ),
+    ]
+
+    print(f"{ROUNDS:,} rounds of {BURST:,} inserts followed by {BURST:,} removals ({ROUNDS * BURST:,} nodes)")
+    print(
+        f"{'Container':<17} | {'Pool':<4} | {'Time (s)':>8} | {'GC runs':>7} | {'Allocations':>11} | "
+        f"{'Reuses':>9} | {'High water':>10}"
+    )
+    print("-" * 86)
+
+    for name, module, container_class, insert, remove in cases:
+        plain_time, plain_collections = measure(container_class, insert, remove)
+        print(
+            f"{name:<17} | {'no':<4} | {plain_time:>8.3f} | {plain_collections:>7,} | {ROUNDS * BURST:>11,} | "
+            f"{0:>9,} | {'-':>10}"
+        )
+
+        pool = nodes.NodePool(module.Node, max_free=BURST)  # Keep every removed node for the next round
+        pooled_time, pooled_collections = measure(lambda: container_class(node_pool=pool), insert, remove)
+        stats = pool.stats()
+        assert stats["in_use"] == 0 and stats["allocations"] + stats["reuses"] == ROUNDS * BURST
+        print(
+            f"{name:<17} | {'yes':<4} | {pooled_time:>8.3f} | {pooled_collections:>7,} | {stats['allocations']:>11,} | "
+            f"{stats['reuses']:>9,} | {stats['high_water']:>10,}"
+        )
+
+
+# Output:
+
+"""
+10 rounds of 100,000 inserts followed by 100,000 removals (1,000,000 nodes)
+Container         | Pool | Time (s) | GC runs | Allocations |    Reuses | High water
+--------------------------------------------------------------------------------------
+Queue             | no   |    1.042 |   1,421 |   1,000,000 |         0 |          -
+Queue             | yes  |    1.170 |     142 |     100,000 |   900,000 |    100,000
+Stack             | no   |    1.029 |   1,421 |   1,000,000 |         0 |          -
+Stack             | yes  |    0.915 |     142 |     100,000 |   900,000 |    100,000
+LinkedList        | no   |    1.395 |   1,421 |   1,000,000 |         0 |          -
+LinkedList        | yes  |    1.795 |     142 |     100,000 |   900,000 |    100,000
+DoublyLinkedList  | no   |    1.547 |   1,421 |   1,000,000 |         0 |          -
+DoublyLinkedList  | yes  |    1.728 |     142 |     100,000 |   900,000 |    100,000
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11. Each round fills the container with 100,000 values and empties it again, which is how a
+work queue behaves when producers and consumers take turns.
+
+- Without a pool every insert allocates a node, and the cyclic garbage collector runs about 1,400 times: it is
+triggered by the number of container objects created, not by the number freed, so a burst of 100,000 new nodes
+starts it over and over. With a pool sized to the burst, only the first round allocates, the later rounds reuse the
+900,000 released nodes, and the collector runs 10 times less.
+
+- The time barely moves, and the pool can even be slower. `acquire` and `release` are Python method calls, while
+CPython already keeps free lists of its own for small objects, so a `Node(...)` call is cheap. The saving in the
+collector roughly pays for the extra calls, no more. A pool pays off where the allocator is expensive (C, or objects
+with heavy constructors), not as a speedup for these classes in Python.
+
+- With the default `max_free=1024` the pool keeps only the last 1,024 released nodes, so almost every node of a
+100,000-value burst is allocated again; `max_free` should match the high-water mark the `stats()` report.
+With small bursts (a few hundred values) the collector hardly runs at all, and the pool only adds call overhead.
+
+- The clear memory win is `__slots__` on the node classes, which the pool does not need: a slotted node takes 48 bytes
+instead of about 88 bytes for a node with a `__dict__` (see the Big O notes of `main.py`).
+"""
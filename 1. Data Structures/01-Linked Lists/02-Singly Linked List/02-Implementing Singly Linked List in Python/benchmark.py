@@ -0,0 +1,79 @@
+# Benchmark: building a LinkedList with insert_end and extend
+
+import gc
+import time
+
+from main import LinkedList
+
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def build_with_insert_end(size):
+    # Append the values one at a time
+    ll = LinkedList()
+    for value in range(size):
+        ll.insert_end(value)
+    return ll
+
+
+def build_with_extend(size):
+    # Append all the values in one batch
+    ll = LinkedList()
+    ll.extend(range(size))
+    return ll
+
+
+def time_build(build, size):
+    # Return the time in seconds it takes to build a list of the given size
+    gc.collect()
+    start = time.perf_counter()
+    ll = build(size)
+    elapsed = time.perf_counter() - start
+
+    assert len(ll) == size
+    del ll
+    return elapsed
+
+
+if __name__ == "__main__":
+    print(f"{'Elements':>12} | {'insert_end (s)':>14} | {'ns/element':>10} | {'extend (s)':>10} | {'ns/element':>10}")
+    print("-" * 68)
+
+    for size in SIZES:
+        insert_end_time = time_build(build_with_insert_end, size)
+        extend_time = time_build(build_with_extend, size)
+
+        print(
+            f"{size:>12,} | {insert_end_time:>14.3f} | {insert_end_time / size * 1e9:>10.0f} | "
+            f"{extend_time:>10.3f} | {extend_time / size * 1e9:>10.0f}"
+        )
+
+
+# Output:
+
+"""
+    Elements | insert_end (s) | ns/element | extend (s) | ns/element
+--------------------------------------------------------------------
+      10,000 |          0.004 |        417 |      0.003 |        313
+     100,000 |          0.053 |        533 |      0.045 |        451
+   1,000,000 |          0.949 |        949 |      0.894 |        894
+  10,000,000 |         10.709 |       1071 |     10.569 |       1057
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- A list 1000 times larger takes about 2500 times longer to build, so the build time grows linearly (the time per
+element rises only slightly, because the garbage collector has more objects to scan and the nodes no longer fit in the
+CPU cache). Before `tail_node` was added, every `insert_end` walked the whole list, so building a list of `n` elements
+took O(n²) time: one million elements needed about 5 * 10^11 node visits.
+
+- `extend` is a little faster than calling `insert_end` in a loop because it avoids one method call per value and
+updates `tail_node` and `length` only once for the whole batch. Most of the remaining cost is creating the `Node` objects.
+
+- The absolute numbers depend on the machine and the Python version. Garbage collection is left enabled, as it would be
+in a real program, so the largest sizes include some collector work.
+"""
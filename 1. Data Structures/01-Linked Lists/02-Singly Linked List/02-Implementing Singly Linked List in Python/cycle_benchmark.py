@@ -0,0 +1,92 @@
+# Benchmark: Brent's cycle_info against Floyd's has_cycle + find_cycle_start
+
+import time
+
+from main import LinkedList
+
+# (tail length, cycle length): the number of nodes before the cycle and the number of nodes in it
+SHAPES = [
+    (1_000_000, 10),
+    (10, 1_000_000),
+    (500_000, 500_000),
+    (2_000_000, 2_000_000),
+]
+REPEATS = 3  # Each call is timed this many times and the best run is kept
+
+
+def build_cycle(tail_length, cycle_length):
+    # Build a list whose last node links back to the node at position `tail_length`
+    ll = LinkedList()
+    ll.extend(range(tail_length + cycle_length))
+
+    cycle_start = ll.get_head_node()
+    for _ in range(tail_length):
+        cycle_start = cycle_start.get_next_node()
+    ll.tail_node.set_next_node(cycle_start)
+
+    return ll
+
+
+def best_time(operation):
+    # Return the result of the operation and its best time in milliseconds over a few runs
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = operation()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings) * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'Tail':>10} | {'Cycle':>10} | {'has_cycle + find_cycle_start (ms)':>33} | {'cycle_info (ms)':>15} | {'Speedup':>7}")
+    print("-" * 89)
+
+    for tail_length, cycle_length in SHAPES:
+        ll = build_cycle(tail_length, cycle_length)
+
+        floyd_result, floyd_time = best_time(lambda: (ll.has_cycle(), ll.find_cycle_start()))
+        brent_result, brent_time = best_time(ll.cycle_info)
+
+        assert floyd_result == (True, tail_length)
+        assert brent_result == (True, tail_length, cycle_length, tail_length)
+
+        print(
+            f"{tail_length:>10,} | {cycle_length:>10,} | {floyd_time:>33.1f} | {brent_time:>15.1f} | "
+            f"{floyd_time / brent_time:>6.1f}x"
+        )
+
+        ll.tail_node.set_next_node(None)  # Break the cycle so the nodes can be freed
+        del ll
+
+
+# Output:
+
+"""
+      Tail |      Cycle | has_cycle + find_cycle_start (ms) | cycle_info (ms) | Speedup
+-----------------------------------------------------------------------------------------
+ 1,000,000 |         10 |                             603.3 |           188.6 |    3.2x
+        10 |  1,000,000 |                             610.9 |           248.9 |    2.5x
+   500,000 |    500,000 |                             289.3 |           167.4 |    1.7x
+ 2,000,000 |  2,000,000 |                            1104.2 |           711.0 |    1.6x
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Calling `has_cycle` and then `find_cycle_start` runs Floyd's detection loop twice, and every step of that loop
+follows three links (one for the slow pointer, two for the fast one). `cycle_info` runs Brent's detection loop once,
+which follows a single link per step, and also returns the cycle length and the tail length that the Floyd methods
+do not compute at all (getting the cycle length from them would take one more lap around the cycle).
+
+- The gain is largest for a long tail and a short cycle. Along the tail, the two Floyd calls follow about eight links
+per node (three in each detection loop, two more when `find_cycle_start` walks back from the head), while
+`cycle_info` follows about three (one in the detection loop, two in the second phase).
+
+- For tail and cycle of similar size, both algorithms visit a number of nodes proportional to `tail + cycle`, so the
+difference comes down to the smaller number of link follows per step.
+
+- Part of the gap is plain Python overhead: `cycle_info` compares nodes with `is`, which does not look up `__eq__`.
+"""
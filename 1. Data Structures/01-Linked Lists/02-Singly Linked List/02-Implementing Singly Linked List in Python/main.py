@@ -1,12 +1,27 @@
 # Implementation in Python:
 
+import copy
+import heapq
+from collections import deque
+from itertools import islice
+
+SEARCH_POLICIES = ("static", "move_to_front", "transpose")
+
 
 class Node:
+    # Fixed attributes instead of a per-node __dict__, so every node is smaller
+    __slots__ = ("value", "next_node")
+
     def __init__(self, value, next_node=None):
         # Initialize a node with a value and an optional next_node reference
         self.value = value
         self.next_node = next_node
 
+    def reset(self, value, next_node=None):
+        # Reinitialize a recycled node (used by a NodePool)
+        self.value = value
+        self.next_node = next_node
+
     def get_value(self):
         # Return the value of the node
         return self.value
@@ -25,9 +40,60 @@ class Node:
 
 
 class LinkedList:
-    def __init__(self, value=None):
+    def __init__(self, value=None, indexed=False, search_policy=None, node_pool=None):
+        # Optional NodePool(Node) that hands out nodes for inserts and takes back the nodes this list removes
+        self.node_pool = node_pool
+
         # Initialize the linked list with a head node if a value is provided
-        self.head_node = Node(value) if value is not None else None
+        self.head_node = None
+        if value is not None:
+            self.head_node = Node(value) if node_pool is None else node_pool.acquire(value)
+        # Keep a reference to the last node and a node count for O(1) appends and len()
+        self.tail_node = self.head_node
+        self.length = 1 if self.head_node is not None else 0
+
+        # Optional index for O(1) search and remove_node (values must be hashable):
+        # value_index maps each value to the node holding it, or to a deque of nodes in list order if it is repeated,
+        # and prev_nodes maps each node to the node before it (None for the head node)
+        self.value_index = {} if indexed else None
+        self.prev_nodes = {} if indexed else None
+        if indexed and self.head_node is not None:
+            self._index_node(self.head_node, None)
+
+        # Optional self-organizing search: "move_to_front" or "transpose" move a found node towards the head,
+        # "static" leaves the order alone; all three count hits, misses and the depth of every hit
+        if search_policy is not None and search_policy not in SEARCH_POLICIES:
+            raise ValueError(f"search_policy must be one of {SEARCH_POLICIES}")
+        if search_policy is not None and indexed:
+            raise ValueError("an indexed list finds values without traversal, so it takes no search_policy")
+        self.search_policy = search_policy
+        self.reset_search_stats()
+
+    def __len__(self):
+        # Return the number of nodes in the linked list
+        return self.length
+
+    def _index_node(self, node, prev_node, at_front=False):
+        # Record a newly linked node in the value index and the predecessor map
+        value = node.get_value()
+        nodes = self.value_index.get(value)
+        if nodes is None:
+            # Most values occur once, so the node is stored without a container
+            self.value_index[value] = node
+        else:
+            if not isinstance(nodes, deque):
+                # The second node with this value: switch to a deque
+                nodes = self.value_index[value] = deque((nodes,))
+            if at_front:
+                nodes.appendleft(node)
+            else:
+                nodes.append(node)
+        self.prev_nodes[node] = prev_node
+
+    def _release_node(self, node):
+        # Give an unlinked node back to the node pool; nothing may refer to it any more
+        if self.node_pool is not None:
+            self.node_pool.release(node)
 
     def get_head_node(self):
         # Return the head node of the linked list
@@ -35,35 +101,87 @@ class LinkedList:
 
     def insert_beginning(self, new_value):
         # Insert a new node at the beginning of the linked list
-        new_node = Node(new_value)
+        new_node = Node(new_value) if self.node_pool is None else self.node_pool.acquire(new_value)
 
         new_node.set_next_node(self.head_node)
         self.head_node = new_node
 
+        if self.value_index is not None:
+            # The old head node now comes after the new node
+            if new_node.get_next_node() is not None:
+                self.prev_nodes[new_node.get_next_node()] = new_node
+            self._index_node(new_node, None, at_front=True)
+
+        if self.tail_node is None:
+            # If the list was empty, the new node is also the tail node
+            self.tail_node = new_node
+        self.length += 1
+
     def insert_end(self, value):
         # Insert a new node at the end of the linked list
-        new_node = Node(value)
+        new_node = Node(value) if self.node_pool is None else self.node_pool.acquire(value)
+
+        if self.value_index is not None:
+            self._index_node(new_node, self.tail_node)
 
         if self.head_node is None:
             # If the list is empty, set the new node as the head node
             self.head_node = new_node
+        else:
+            # Link the new node after the tail node, no traversal needed
+            self.tail_node.set_next_node(new_node)
+
+        self.tail_node = new_node
+        self.length += 1
+
+    def extend(self, values):
+        # Insert every value from an iterable at the end of the linked list
+        first_node = None
+        last_node = None
+        count = 0
+        make_node = Node if self.node_pool is None else self.node_pool.acquire
+
+        # Link the whole batch into a chain of its own first
+        for value in values:
+            new_node = make_node(value)
+            if last_node is None:
+                first_node = new_node
+            else:
+                last_node.set_next_node(new_node)
+
+            if self.value_index is not None:
+                self._index_node(new_node, last_node if last_node is not None else self.tail_node)
+
+            last_node = new_node
+            count += 1
+
+        if first_node is None:
             return
 
-        # Traverse to the end of the list
-        current_node = self.head_node
-        while current_node.get_next_node():
-            current_node = current_node.get_next_node()
+        # Attach the chain after the tail node in a single step
+        if self.head_node is None:
+            self.head_node = first_node
+        else:
+            self.tail_node.set_next_node(first_node)
 
-        # Set the new node as the next node of the last node
-        current_node.set_next_node(new_node)
+        self.tail_node = last_node
+        self.length += count
 
     def remove_node(self, value_to_remove):
         # Remove the first node with the specified value
+        if self.value_index is not None:
+            self._remove_indexed(value_to_remove)
+            return
+
         current_node = self.head_node
 
         if current_node and current_node.get_value() == value_to_remove:
             # If the head node is the one to be removed, update the head node
             self.head_node = current_node.get_next_node()
+            if self.head_node is None:
+                self.tail_node = None
+            self.length -= 1
+            self._release_node(current_node)
             return
 
         # Traverse the list to find the node to remove
@@ -73,46 +191,281 @@ class LinkedList:
             if next_node.get_value() == value_to_remove:
                 # Skip the node to remove by updating the next node reference
                 current_node.set_next_node(next_node.get_next_node())
+                if next_node is self.tail_node:
+                    # The removed node was the last one, so its predecessor is the new tail
+                    self.tail_node = current_node
+                self.length -= 1
+                self._release_node(next_node)
                 return
 
             current_node = next_node
 
-    def stringify_list(self):
-        # Return a string representation of the linked list
-        string_list = ""
+    def _remove_indexed(self, value_to_remove):
+        # Remove the first node with the specified value using the index, without traversal
+        nodes = self.value_index.get(value_to_remove)
+        if nodes is None:
+            return
+
+        if isinstance(nodes, deque):
+            # The first node in list order is at the left end of the deque
+            node_to_remove = nodes.popleft()
+            if len(nodes) == 1:
+                self.value_index[value_to_remove] = nodes[0]
+        else:
+            node_to_remove = nodes
+            del self.value_index[value_to_remove]
+
+        self._unlink_indexed(node_to_remove)
+
+    def _unlink_indexed(self, node_to_remove):
+        # Unlink a node whose predecessor is known from the predecessor map
+        prev_node = self.prev_nodes.pop(node_to_remove)
+        next_node = node_to_remove.get_next_node()
+
+        # Skip the node to remove by linking its neighbours
+        if prev_node is None:
+            self.head_node = next_node
+        else:
+            prev_node.set_next_node(next_node)
+
+        if next_node is not None:
+            self.prev_nodes[next_node] = prev_node
+        else:
+            self.tail_node = prev_node
+
+        self.length -= 1
+        self._release_node(node_to_remove)
+
+    def remove_all(self, values):
+        # Remove every node holding one of the given values (which must be hashable), return how many were removed
+        values_to_remove = set(values)
+
+        if self.value_index is None:
+            # One pass over the list with an O(1) set lookup per node
+            return self.remove_where(values_to_remove.__contains__)
+
+        # The index already knows every node holding each value, so no traversal is needed
+        removed_count = 0
+        for value in values_to_remove:
+            nodes = self.value_index.pop(value, None)
+            if nodes is None:
+                continue
+            for node_to_remove in nodes if isinstance(nodes, deque) else (nodes,):
+                self._unlink_indexed(node_to_remove)
+                removed_count += 1
+
+        return removed_count
+
+    def remove_where(self, predicate):
+        # Remove every node whose value satisfies the predicate in a single pass, return how many were removed
+        removed_nodes = []
+        prev_node = None
+        current_node = self.head_node
+
+        try:
+            while current_node is not None:
+                next_node = current_node.get_next_node()
+
+                if predicate(current_node.get_value()):
+                    # Skip the node by linking its predecessor to its successor
+                    if prev_node is None:
+                        self.head_node = next_node
+                    else:
+                        prev_node.set_next_node(next_node)
 
+                    if self.value_index is not None:
+                        del self.prev_nodes[current_node]
+                        if next_node is not None:
+                            self.prev_nodes[next_node] = prev_node
+
+                    removed_nodes.append(current_node)
+                else:
+                    prev_node = current_node
+
+                current_node = next_node
+        finally:
+            # Also runs if the predicate raises, so the length, tail and index match the nodes unlinked so far
+            if current_node is None:
+                # The whole list was visited: the last node kept is the new tail node
+                self.tail_node = prev_node
+            self.length -= len(removed_nodes)
+
+            if self.value_index is not None and removed_nodes:
+                # Drop the removed nodes from the index, keeping the remaining nodes in list order
+                removed = set(removed_nodes)
+                for value in {node.get_value() for node in removed_nodes}:
+                    nodes = self.value_index[value]
+                    kept_nodes = [node for node in nodes if node not in removed] if isinstance(nodes, deque) else []
+                    if len(kept_nodes) > 1:
+                        self.value_index[value] = deque(kept_nodes)
+                    elif kept_nodes:
+                        self.value_index[value] = kept_nodes[0]
+                    else:
+                        del self.value_index[value]
+
+            if self.node_pool is not None:
+                for node in removed_nodes:
+                    self.node_pool.release(node)
+
+        return len(removed_nodes)
+
+    def __iter__(self):
+        # Yield the values from head to tail
         current_node = self.head_node
         while current_node:
-            if current_node.get_value() is not None:
-                string_list += str(current_node.get_value()) + " -> "
+            yield current_node.get_value()
             current_node = current_node.get_next_node()
 
-        return string_list[:-4] if string_list else "Empty List"
+    def stringify_list(self):
+        # Return a string representation of the linked list, joined in a single pass
+        string_list = " -> ".join(str(value) for value in self if value is not None)
+        return string_list if string_list else "Empty List"
+
+    def write_to(self, fileobj, chunk_size=1024):
+        # Stream the string representation to a file, joining `chunk_size` values per write
+        strings = (str(value) for value in self if value is not None)
+        separator = ""
+
+        while True:
+            chunk = list(islice(strings, chunk_size))
+            if not chunk:
+                break
+            fileobj.write(separator + " -> ".join(chunk))
+            separator = " -> "
+
+        if not separator:
+            # Nothing was written, so the list is empty
+            fileobj.write("Empty List")
+
+    def preview(self, limit):
+        # Return the string representation of the first `limit` values, stopping the traversal there
+        strings = list(islice((str(value) for value in self if value is not None), limit + 1))
+        if len(strings) > limit:
+            # There are more values than the limit
+            strings[limit:] = ["..."]
+
+        return " -> ".join(strings) if strings else "Empty List"
+
+    def __getstate__(self):
+        # Return the values as a flat list, head to tail (used by pickle and copy)
+        return list(self)
+
+    def __setstate__(self, values):
+        # Rebuild the nodes from a flat list of values, one at a time
+        self.extend(values)
+
+    def __reduce__(self):
+        # Pickle the class, the indexed flag, the search policy and a flat list of values instead of the chain of
+        # nodes, which pickle would otherwise follow recursively through next_node (RecursionError on long lists)
+        return self.__class__, (None, self.value_index is not None, self.search_policy), self.__getstate__()
+
+    def __deepcopy__(self, memo):
+        # Deep-copy the values one by one into a new list, without recursing through the nodes
+        copied = self.__class__(indexed=self.value_index is not None, search_policy=self.search_policy)
+        memo[id(self)] = copied
+        copied.extend(copy.deepcopy(value, memo) for value in self)
+        return copied
 
     def search(self, value):
         # Search for a node with the specified value
+        if self.value_index is not None:
+            # Only values that are in the list have an entry in the index
+            return value in self.value_index
+        if self.search_policy is not None:
+            return self._search_self_organizing(value)
+
+        current_node = self.head_node
+        while current_node:
+            if current_node.get_value() == value:
+                return True
+            current_node = current_node.get_next_node()
+
+        return False
+
+    def _search_self_organizing(self, value):
+        # Search while remembering the two nodes before the current one, then apply the search policy on a hit
+        prev_prev_node = None
+        prev_node = None
         current_node = self.head_node
+        depth = 1
+
         while current_node:
             if current_node.get_value() == value:
+                self.search_hits += 1
+                self.hit_depth_total += depth
+
+                if prev_node is not None:
+                    if self.search_policy == "move_to_front":
+                        self._move_to_front(prev_node, current_node)
+                    elif self.search_policy == "transpose":
+                        self._swap_with_prev(prev_prev_node, prev_node, current_node)
                 return True
+
+            prev_prev_node = prev_node
+            prev_node = current_node
             current_node = current_node.get_next_node()
+            depth += 1
 
+        self.search_misses += 1
         return False
 
+    def _move_to_front(self, prev_node, node):
+        # Unlink a node that is not the head node and link it in again as the head node
+        prev_node.set_next_node(node.get_next_node())
+        if node is self.tail_node:
+            self.tail_node = prev_node
+
+        node.set_next_node(self.head_node)
+        self.head_node = node
+
+    def _swap_with_prev(self, prev_prev_node, prev_node, node):
+        # Move a node one step towards the head by swapping it with the node before it
+        if prev_prev_node is None:
+            self.head_node = node
+        else:
+            prev_prev_node.set_next_node(node)
+
+        prev_node.set_next_node(node.get_next_node())
+        node.set_next_node(prev_node)
+        if node is self.tail_node:
+            self.tail_node = prev_node
+
+    def reset_search_stats(self):
+        # Set the search counters back to zero, for example after a warm-up
+        self.search_hits = 0
+        self.search_misses = 0
+        self.hit_depth_total = 0  # Sum over all hits of the number of nodes compared (1 for the head node)
+
+    def average_hit_depth(self):
+        # Return the average number of nodes compared per successful search, or 0.0 before the first hit
+        return self.hit_depth_total / self.search_hits if self.search_hits else 0.0
+
     def reverse(self):
         # Reverse the linked list
         prev = None
 
+        # The current head node becomes the tail node after reversing
+        self.tail_node = self.head_node
+
         current = self.head_node
         while current:
             next_node = current.get_next_node()
             current.set_next_node(prev)
+            if self.value_index is not None:
+                # The old next node is now the node before the current one
+                self.prev_nodes[current] = next_node
             prev = current
             current = next_node
 
         # Update the head node to the new first node
         self.head_node = prev
 
+        if self.value_index is not None:
+            # List order is reversed, so the order of the nodes for each value is too
+            for nodes in self.value_index.values():
+                if isinstance(nodes, deque):
+                    nodes.reverse()
+
     def find_middle(self):
         # Find the middle node of the linked list using the two-pointer technique
         slow = self.head_node
@@ -164,6 +517,50 @@ class LinkedList:
 
         return slow.get_value()
 
+    def cycle_info(self):
+        # Return (has_cycle, cycle start value, cycle length, tail length) using Brent's algorithm.
+        # The tail length is the number of nodes before the cycle (the whole list if there is no cycle).
+        if self.head_node is None:
+            return False, None, 0, 0
+
+        # The tortoise waits at a node while the hare walks up to `power` steps ahead of it.
+        # If the hare comes back to the tortoise, the number of steps it took is the cycle length.
+        power = 1
+        cycle_length = 1
+        visited_count = 1  # Number of nodes the hare has moved past
+        tortoise = self.head_node
+        hare = self.head_node.get_next_node()
+
+        while hare is not tortoise:
+            if hare is None:
+                # The hare reached the end of the list, so there is no cycle
+                return False, None, 0, visited_count
+
+            if power == cycle_length:
+                # Teleport the tortoise to the hare and double the distance the hare may walk
+                tortoise = hare
+                power *= 2
+                cycle_length = 0
+
+            hare = hare.get_next_node()
+            cycle_length += 1
+            visited_count += 1
+
+        # Start a second pointer `cycle_length` nodes ahead of the head node:
+        # walking both one step at a time, they meet at the first node of the cycle
+        tortoise = self.head_node
+        hare = self.head_node
+        for _ in range(cycle_length):
+            hare = hare.get_next_node()
+
+        tail_length = 0
+        while tortoise is not hare:
+            tortoise = tortoise.get_next_node()
+            hare = hare.get_next_node()
+            tail_length += 1
+
+        return True, tortoise.get_value(), cycle_length, tail_length
+
     def remove_duplicates(self):
         # Remove duplicate values from the linked list
         if not self.head_node:
@@ -179,60 +576,305 @@ class LinkedList:
             if next_node.get_value() in seen_values:
                 # Remove the duplicate node
                 current_node.set_next_node(next_node.get_next_node())
+                self.length -= 1
+
+                if self.value_index is not None:
+                    del self.prev_nodes[next_node]
+                    if next_node.get_next_node() is not None:
+                        self.prev_nodes[next_node.get_next_node()] = current_node
+                self._release_node(next_node)
             else:
                 # Add the new value to the set and move to the next node
                 seen_values.add(next_node.get_value())
                 current_node = next_node
 
+        # The last node kept is the new tail node
+        self.tail_node = current_node
 
-# Example Usage
+        if self.value_index is not None:
+            # Only the first node of each value is kept, so every value is back to a single node
+            for value, nodes in self.value_index.items():
+                if isinstance(nodes, deque):
+                    self.value_index[value] = nodes[0]
 
-ll = LinkedList()
+    def sort(self, key=None, reverse=False):
+        # Sort the list in place with a stable bottom-up merge sort that relinks the existing nodes
+        if self.length < 2:
+            return
 
-ll.insert_end(1)
-ll.insert_end(2)
-ll.insert_end(3)
-ll.insert_end(4)
-ll.insert_end(5)
+        width = 1
+        while width < self.length:
+            # Merge neighbouring sorted runs of `width` nodes into runs of `2 * width` nodes
+            placeholder = Node(None)  # Temporary node in front of the merged runs
+            merged_tail = placeholder
+            current_node = self.head_node
+
+            while current_node is not None:
+                left_run = current_node
+                right_run = self._split_run(left_run, width)
+                current_node = self._split_run(right_run, width)
+                merged_tail = self._merge_runs(left_run, right_run, merged_tail, key, reverse)
+
+            self.head_node = placeholder.get_next_node()
+            width *= 2
+
+        self.tail_node = merged_tail
+
+        if self.value_index is not None:
+            # The nodes moved, so rebuild the predecessor map and the list order of the index
+            self.value_index.clear()
+            self.prev_nodes.clear()
+            prev_node = None
+            current_node = self.head_node
+            while current_node is not None:
+                self._index_node(current_node, prev_node)
+                prev_node = current_node
+                current_node = current_node.get_next_node()
+
+    @staticmethod
+    def _split_run(run_head, width):
+        # Cut the run after `width` nodes and return the head of the rest of the list
+        current_node = run_head
+        for _ in range(width - 1):
+            if current_node is None:
+                return None
+            current_node = current_node.get_next_node()
 
-print("Original List:")
-print(ll.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+        if current_node is None:
+            return None
 
-# Test Searching
-print("\nSearch for 3:", ll.search(3))  # Output: True
-print("Search for 10:", ll.search(10))  # Output: False
+        rest = current_node.get_next_node()
+        current_node.set_next_node(None)
+        return rest
 
-# Test Finding Middle Node
-print("\nMiddle Node:", ll.find_middle())  # Output: 3
+    @staticmethod
+    def _merge_runs(left_run, right_run, merged_tail, key, reverse):
+        # Link two sorted runs after merged_tail and return the last node of the merged run
+        while left_run is not None and right_run is not None:
+            left_key = left_run.get_value() if key is None else key(left_run.get_value())
+            right_key = right_run.get_value() if key is None else key(right_run.get_value())
 
-# Test Reversing
-ll.reverse()
-print("\nReversed List:")
-print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
+            # Take from the right run only if it must come strictly first, which keeps the sort stable
+            take_right = right_key > left_key if reverse else right_key < left_key
 
-# Test Cycle Detection
-print("\nCycle Detected:", ll.has_cycle())  # Output: False
+            if take_right:
+                merged_tail.set_next_node(right_run)
+                right_run = right_run.get_next_node()
+            else:
+                merged_tail.set_next_node(left_run)
+                left_run = left_run.get_next_node()
+            merged_tail = merged_tail.get_next_node()
 
-# Creating a cycle manually
-ll.get_head_node().get_next_node().get_next_node().set_next_node(
-    ll.get_head_node()
-)  # Cycle at node 1
-print("Cycle Detected after introducing cycle:", ll.has_cycle())  # Output: True
-print("Cycle Start Node:", ll.find_cycle_start())  # Output: 1
+        # Attach whatever is left of either run and move to its last node
+        merged_tail.set_next_node(left_run if left_run is not None else right_run)
+        while merged_tail.get_next_node() is not None:
+            merged_tail = merged_tail.get_next_node()
 
-# Remove cycle for further testing
-ll.get_head_node().get_next_node().get_next_node().set_next_node(None)
+        return merged_tail
 
-# Test Removing Duplicates
-ll.insert_end(3)
-ll.insert_end(4)
-ll.insert_end(4)
-print("\nList before removing duplicates:")
-print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1 -> 3 -> 4 -> 4
 
-ll.remove_duplicates()
-print("\nList after removing duplicates:")
-print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
+def _walk_nodes(current_node):
+    # Yield the nodes of a chain, reading each next node before the node is handed out to be relinked
+    while current_node is not None:
+        next_node = current_node.get_next_node()
+        yield current_node
+        current_node = next_node
+
+
+def _take_nodes(linked_list):
+    # Detach all the nodes from a linked list, leaving it empty, and return a generator over them
+    head_node = linked_list.head_node
+
+    linked_list.head_node = None
+    linked_list.tail_node = None
+    linked_list.length = 0
+    if linked_list.value_index is not None:
+        linked_list.value_index.clear()
+        linked_list.prev_nodes.clear()
+
+    return _walk_nodes(head_node)
+
+
+def merge_sorted(*lists, key=None, reverse=False):
+    # Merge already-sorted linked lists into one new sorted LinkedList through a heap.
+    # The nodes are moved, not copied, so the input lists are left empty.
+    merged = LinkedList()
+
+    def node_key(node):
+        return node.get_value() if key is None else key(node.get_value())
+
+    # heapq.merge keeps one node per input list on a heap of size k, and it is stable
+    node_streams = [_take_nodes(linked_list) for linked_list in lists]
+    for node in heapq.merge(*node_streams, key=node_key, reverse=reverse):
+        if merged.tail_node is None:
+            merged.head_node = node
+        else:
+            merged.tail_node.set_next_node(node)
+        merged.tail_node = node
+        merged.length += 1
+
+    if merged.tail_node is not None:
+        merged.tail_node.set_next_node(None)
+
+    return merged
+
+
+# Example Usage
+if __name__ == "__main__":
+    import io
+    import pickle
+
+    ll = LinkedList()
+
+    ll.insert_end(1)
+    ll.insert_end(2)
+    ll.insert_end(3)
+    ll.insert_end(4)
+    ll.insert_end(5)
+
+    print("Original List:")
+    print(ll.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+    print("Length:", len(ll))  # Output: 5
+
+    # Test Searching
+    print("\nSearch for 3:", ll.search(3))  # Output: True
+    print("Search for 10:", ll.search(10))  # Output: False
+
+    # Test Finding Middle Node
+    print("\nMiddle Node:", ll.find_middle())  # Output: 3
+
+    # Test Reversing
+    ll.reverse()
+    print("\nReversed List:")
+    print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
+
+    # Test Cycle Detection
+    print("\nCycle Detected:", ll.has_cycle())  # Output: False
+    print("Cycle Info:", ll.cycle_info())  # Output: (False, None, 0, 5)
+
+    # Creating a cycle manually
+    third_node = ll.get_head_node().get_next_node().get_next_node()
+    fourth_node = third_node.get_next_node()
+    third_node.set_next_node(ll.get_head_node())  # Cycle back to node 5
+    print("Cycle Detected after introducing cycle:", ll.has_cycle())  # Output: True
+    print("Cycle Start Node:", ll.find_cycle_start())  # Output: 5
+    print("Cycle Info:", ll.cycle_info())  # Output: (True, 5, 3, 0), the cycle is 5 -> 4 -> 3 -> 5
+
+    # Remove cycle for further testing by restoring the original link
+    third_node.set_next_node(fourth_node)
+
+    # A cycle that starts further down the list
+    ll.tail_node.set_next_node(fourth_node)  # 5 -> 4 -> 3 -> 2 -> 1 -> 2 -> ...
+    print("Cycle Info with a tail:", ll.cycle_info())  # Output: (True, 2, 2, 3)
+    ll.tail_node.set_next_node(None)
+
+    # Test Removing Duplicates
+    ll.insert_end(3)
+    ll.insert_end(4)
+    ll.insert_end(4)
+    print("\nList before removing duplicates:")
+    print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1 -> 3 -> 4 -> 4
+
+    ll.remove_duplicates()
+    print("\nList after removing duplicates:")
+    print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
+    print("Length:", len(ll))  # Output: 5
+
+    # Test Bulk Insertion
+    ll.extend([6, 7, 8])
+    print("\nList after extending with [6, 7, 8]:")
+    print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1 -> 6 -> 7 -> 8
+    print("Length:", len(ll))  # Output: 8
+
+    # Removing the last node moves the tail back
+    ll.remove_node(8)
+    ll.insert_end(9)
+    print("\nList after removing 8 and inserting 9 at the end:")
+    print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1 -> 6 -> 7 -> 9
+
+    # Test Bulk Removal
+    ids_ll = LinkedList()
+    ids_ll.extend([10, 11, 12, 10, 13, 14, 11])
+    removed_count = ids_ll.remove_all({10, 11, 99})  # Every 10 and 11, in one pass
+    print("\nAfter removing all 10s and 11s:", ids_ll.stringify_list())  # Output: 12 -> 13 -> 14
+    print("Removed:", removed_count)  # Output: 4
+
+    removed_count = ids_ll.remove_where(lambda value: value % 2 == 0)
+    print("After removing the even values:", ids_ll.stringify_list())  # Output: 13
+    print("Removed:", removed_count)  # Output: 2
+
+    # Test Indexed Mode
+    indexed_ll = LinkedList(indexed=True)
+    indexed_ll.extend(["a", "b", "c", "b"])
+    print("\nIndexed List:")
+    print(indexed_ll.stringify_list())  # Output: a -> b -> c -> b
+    print("Search for 'c':", indexed_ll.search("c"))  # Output: True (found through the index)
+
+    indexed_ll.remove_node("b")  # Removes the first "b" without traversing the list
+    print("After removing 'b':", indexed_ll.stringify_list())  # Output: a -> c -> b
+
+    indexed_ll.reverse()
+    indexed_ll.remove_node("b")  # After reversing, the first "b" is the head node
+    print("After reversing and removing 'b':", indexed_ll.stringify_list())  # Output: c -> a
+    print("Search for 'b':", indexed_ll.search("b"))  # Output: False
+
+    # Test Self-Organizing Search
+    mtf_ll = LinkedList(search_policy="move_to_front")
+    mtf_ll.extend(["a", "b", "c", "d", "e"])
+    mtf_ll.search("d")  # Found at depth 4, then moved to the front
+    mtf_ll.search("d")  # Found at depth 1
+    mtf_ll.search("z")  # A miss leaves the order alone
+    print("\nMove-to-front after searching 'd':", mtf_ll.stringify_list())  # Output: d -> a -> b -> c -> e
+    print("Hits:", mtf_ll.search_hits, "Misses:", mtf_ll.search_misses)  # Output: Hits: 2 Misses: 1
+    print("Average hit depth:", mtf_ll.average_hit_depth())  # Output: 2.5
+
+    transpose_ll = LinkedList(search_policy="transpose")
+    transpose_ll.extend(["a", "b", "c", "d", "e"])
+    transpose_ll.search("d")  # Swapped with "c", one step closer to the head
+    transpose_ll.search("d")  # Swapped with "b"
+    print("Transpose after searching 'd' twice:", transpose_ll.stringify_list())  # Output: a -> d -> b -> c -> e
+
+    # Test Sorting
+    unsorted_ll = LinkedList()
+    unsorted_ll.extend([4, 1, 3, 5, 2])
+    unsorted_ll.sort()
+    print("\nSorted List:", unsorted_ll.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+
+    words_ll = LinkedList()
+    words_ll.extend(["pear", "fig", "apple", "kiwi"])
+    words_ll.sort(key=len, reverse=True)  # Stable: "pear" stays before "kiwi"
+    print("Sorted by length:", words_ll.stringify_list())  # Output: apple -> pear -> kiwi -> fig
+
+    # Test Merging Sorted Lists
+    shard_1 = LinkedList()
+    shard_1.extend([1, 4, 7])
+    shard_2 = LinkedList()
+    shard_2.extend([2, 5, 8])
+    shard_3 = LinkedList()
+    shard_3.extend([3, 6, 9])
+    merged_ll = merge_sorted(shard_1, shard_2, shard_3)
+    print("\nMerged List:", merged_ll.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+    print("Shards after merging:", len(shard_1), len(shard_2), len(shard_3))  # Output: 0 0 0
+
+    # Test Iterating, Previewing and Streaming
+    print("\nValues:", list(merged_ll))  # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print("Preview:", merged_ll.preview(3))  # Output: 1 -> 2 -> 3 -> ...
+
+    output_file = io.StringIO()  # Any object with a write() method, such as an open file
+    merged_ll.write_to(output_file, chunk_size=4)
+    print("Streamed:", output_file.getvalue())  # Output: 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+
+    # Test Pickling and Copying a long list (the nodes are not pickled one inside the other)
+    long_ll = LinkedList()
+    long_ll.extend(range(100_000))
+    restored_ll = pickle.loads(pickle.dumps(long_ll))
+    print("\nRestored from pickle:", restored_ll.preview(3))  # Output: 0 -> 1 -> 2 -> ...
+    print("Length:", len(restored_ll))  # Output: 100000
+
+    copied_ll = copy.deepcopy(words_ll)
+    copied_ll.insert_end("plum")
+    print("Deep copy:", copied_ll.stringify_list())  # Output: apple -> pear -> kiwi -> fig -> plum
+    print("Original:", words_ll.stringify_list())  # Output: apple -> pear -> kiwi -> fig
 
 
 # Output:
@@ -240,6 +882,7 @@ print(ll.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
 """
 Original List:
 1 -> 2 -> 3 -> 4 -> 5
+Length: 5
 
 Search for 3: True
 Search for 10: False
@@ -250,14 +893,57 @@ Reversed List:
 5 -> 4 -> 3 -> 2 -> 1
 
 Cycle Detected: False
+Cycle Info: (False, None, 0, 5)
 Cycle Detected after introducing cycle: True
 Cycle Start Node: 5
+Cycle Info: (True, 5, 3, 0)
+Cycle Info with a tail: (True, 2, 2, 3)
 
 List before removing duplicates:
-5 -> 4 -> 3 -> 3 -> 4 -> 4
+5 -> 4 -> 3 -> 2 -> 1 -> 3 -> 4 -> 4
 
 List after removing duplicates:
-5 -> 4 -> 3
+5 -> 4 -> 3 -> 2 -> 1
+Length: 5
+
+List after extending with [6, 7, 8]:
+5 -> 4 -> 3 -> 2 -> 1 -> 6 -> 7 -> 8
+Length: 8
+
+List after removing 8 and inserting 9 at the end:
+5 -> 4 -> 3 -> 2 -> 1 -> 6 -> 7 -> 9
+
+After removing all 10s and 11s: 12 -> 13 -> 14
+Removed: 4
+After removing the even values: 13
+Removed: 2
+
+Indexed List:
+a -> b -> c -> b
+Search for 'c': True
+After removing 'b': a -> c -> b
+After reversing and removing 'b': c -> a
+Search for 'b': False
+
+Move-to-front after searching 'd': d -> a -> b -> c -> e
+Hits: 2 Misses: 1
+Average hit depth: 2.5
+Transpose after searching 'd' twice: a -> d -> b -> c -> e
+
+Sorted List: 1 -> 2 -> 3 -> 4 -> 5
+Sorted by length: apple -> pear -> kiwi -> fig
+
+Merged List: 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+Shards after merging: 0 0 0
+
+Values: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+Preview: 1 -> 2 -> 3 -> ...
+Streamed: 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+
+Restored from pickle: 0 -> 1 -> 2 -> ...
+Length: 100000
+Deep copy: apple -> pear -> kiwi -> fig -> plum
+Original: apple -> pear -> kiwi -> fig
 
 """
 
@@ -308,7 +994,7 @@ List after removing duplicates:
 - **Time Complexity**: O(1)
 - **Space Complexity**: O(1)
 
-- Explanation: Initializing the `head_node` is a constant-time operation.
+- Explanation: Initializing the `head_node`, `tail_node` and `length` is a constant-time operation.
 
 ---
 
@@ -330,11 +1016,11 @@ which is a constant-time operation.
 ---
 
 #### 4. **`insert_end`**
-- **Time Complexity**: O(n)
+- **Time Complexity**: O(1)
 - **Space Complexity**: O(1)
 
-- Explanation: In the worst case, you need to traverse the entire list to find the last node, which takes O(n) time.
-The space complexity is constant because only a fixed number of variables are used.
+- Explanation: The list keeps a reference to its last node (`tail_node`), so the new node is linked directly after it
+without traversing the list. Building a list of `n` elements with `insert_end` therefore takes O(n) time instead of O(n²).
 
 ---
 
@@ -343,7 +1029,11 @@ The space complexity is constant because only a fixed number of variables are us
 - **Space Complexity**: O(1)
 
 - Explanation: In the worst case, you need to traverse the entire list to find the node to remove, which takes O(n) time.
-The space complexity is constant because no additional data structures are used.
+The space complexity is constant because no additional data structures are used. Keeping `tail_node` and `length`
+up to date adds only constant work.
+
+- **Indexed mode** (`LinkedList(indexed=True)`): O(1) amortized. The node is found through `value_index` and its
+predecessor through `prev_nodes`, so it is unlinked without any traversal.
 
 ---
 
@@ -352,7 +1042,13 @@ The space complexity is constant because no additional data structures are used.
 - **Space Complexity**: O(n)
 
 - Explanation: You need to traverse the entire list to build the string representation, which takes O(n) time.
-The space complexity is O(n) because the string grows linearly with the number of nodes.
+The values are joined in a single pass with `str.join`, so every character is copied once. (Building the string with
+repeated `+=` can copy the whole string on every step, which is O(n²).) The space complexity is O(n) because the
+result grows linearly with the number of nodes.
+
+- **`__iter__`**: O(n) for a full traversal, O(1) per value and O(1) extra space.
+- **`write_to`**: O(n) time and O(chunk_size) space: only one chunk of text exists at a time.
+- **`preview`**: O(limit) time and space, however long the list is.
 
 ---
 
@@ -363,6 +1059,11 @@ The space complexity is O(n) because the string grows linearly with the number o
 - Explanation: In the worst case, you need to traverse the entire list to find the value, which takes O(n) time.
 The space complexity is constant because no additional data structures are used.
 
+- **Indexed mode**: O(1) on average, because the search is a single dictionary lookup in `value_index`.
+
+- **Self-organizing mode** (`search_policy`): still O(n) in the worst case, but a hit at depth `d` costs O(d), and
+moving the found node costs O(1) on top. See item 20.
+
 ---
 
 #### 8. **`reverse`**
@@ -399,6 +1100,10 @@ The space complexity is constant because only two pointers are used.
 - Explanation: Detecting the cycle and finding its start involves traversing the list with two pointers,
 which takes O(n) time. The space complexity is constant because only a fixed number of variables are used.
 
+- **`cycle_info`**: O(μ + λ) time and O(1) space, where `μ` is the tail length and `λ` the cycle length (O(n) in total).
+Brent's hare follows one link per step and finds the cycle length directly, so a single call replaces
+`has_cycle` + `find_cycle_start` and also reports both lengths. See `cycle_benchmark.py` for the measured numbers.
+
 ---
 
 #### 12. **`remove_duplicates`**
@@ -410,6 +1115,107 @@ seen values, which can grow up to the size of the list in the worst case (if all
 
 ---
 
+#### 13. **`__len__`**
+- **Time Complexity**: O(1)
+- **Space Complexity**: O(1)
+
+- Explanation: The node count is kept in `length` and updated by every method that adds or removes nodes,
+so it is returned without counting the nodes.
+
+---
+
+#### 14. **`extend`**
+- **Time Complexity**: O(k)
+- **Space Complexity**: O(k)
+
+- Explanation: The `k` new values are linked into a chain in a single pass, and the chain is attached after
+`tail_node` in constant time. The space is the `k` new nodes themselves.
+
+---
+
+#### 15. **Indexed mode** (`indexed=True`)
+- **Space Complexity**: O(n) extra
+
+- Explanation: `value_index` holds one entry per distinct value and `prev_nodes` one entry per node, so the index
+roughly doubles the memory of the list. Every insert and removal updates the index in O(1); `reverse` and
+`remove_duplicates` stay O(n) because they already visit every node. Values must be hashable in this mode.
+
+---
+
+#### 16. **`sort`**
+- **Time Complexity**: O(n log n)
+- **Space Complexity**: O(1)
+
+- Explanation: The bottom-up merge sort makes `log n` passes over the list, merging runs of width 1, 2, 4, ... Each pass
+visits every node a constant number of times. The nodes are relinked in place, so apart from one temporary placeholder
+node no extra memory is used (a top-down merge sort would need O(log n) recursion stack, and copying to a Python list
+would need O(n)). In indexed mode the index is rebuilt afterwards in O(n).
+
+---
+
+#### 17. **`merge_sorted`**
+- **Time Complexity**: O(N log k)
+- **Space Complexity**: O(k)
+
+- Explanation: `N` is the total number of nodes and `k` the number of lists. `heapq.merge` keeps one node from each list
+on a heap of size `k`; every node is pushed and popped once at O(log k) each. The nodes are moved into the result,
+so the only extra memory is the heap.
+
+---
+
+#### 18. **`remove_all` and `remove_where`**
+- **Time Complexity**: O(n + k)
+- **Space Complexity**: O(k + r)
+
+- Explanation: `k` values are put in a set, then one pass over the `n` nodes unlinks every node that matches, each
+checked with an O(1) set lookup (or one call to the predicate). `r` is the number of removed nodes. Calling
+`remove_node` once per value would instead cost O(n * k) and remove only the first match of each value.
+
+- **Indexed mode**: `remove_all` needs no traversal at all: O(k + r), because `value_index` already holds every node
+with each value. `remove_where` still makes one pass, since the predicate must see every value.
+
+---
+
+#### 19. **Pickling and copying** (`__getstate__`, `__setstate__`, `__reduce__`, `__deepcopy__`)
+- **Time Complexity**: O(n)
+- **Space Complexity**: O(n)
+
+- Explanation: The list is saved as a flat list of its values and rebuilt with `extend`, so both directions are a
+single pass. Without these methods, `pickle` and `copy.deepcopy` would follow `next_node` recursively, one call level
+per node, and raise `RecursionError` on lists with more than about 1,000 nodes.
+
+---
+
+#### 20. **Self-organizing search** (`search_policy="move_to_front"` or `"transpose"`)
+- **Time Complexity**: O(d) per search, where `d` is the depth of the hit (O(n) for a miss)
+- **Space Complexity**: O(1)
+
+- Explanation: The search remembers the two nodes before the current one, so the found node can be relinked in
+O(1): `_move_to_front` makes it the head node, and `_swap_with_prev` swaps it with the node before it. When a few
+values get most of the searches, they gather near the head and the average depth drops far below `n / 2`.
+Move-to-front adapts at once but lets a single rare search push a cold value to the head; transpose moves a value
+one step per hit, so it adapts slowly but keeps the hot values at the front once they are there.
+
+- `search_hits`, `search_misses`, `hit_depth_total` and `average_hit_depth()` measure how well the policy works;
+`"static"` keeps the order and only counts. See `search_benchmark.py` for Zipf-distributed queries.
+
+---
+
+#### 21. **Node pool** (`node_pool=NodePool(Node)`)
+- **Time Complexity**: O(1) per node, the same as without a pool
+- **Space Complexity**: O(max_free) for the released nodes the pool keeps
+
+- Explanation: Inserts take their nodes from the pool with `acquire`, and every method that unlinks a node
+(`remove_node`, `remove_all`, `remove_where`, `remove_duplicates`) hands it back with `release`. A list that grows
+and shrinks all the time then reuses its nodes instead of allocating new ones. `__slots__` on `Node` makes every node
+about half the size, with or without a pool.
+
+- The pool is shared state, not part of the list's value: pickling and `deepcopy` build the copy with plain nodes
+and without a pool. See `pool_benchmark.py` in the `01-Nodes` folder for the effect on allocations and garbage
+collections.
+
+---
+
 ### Summary Table
 
 | Method               | Time Complexity | Space Complexity |
@@ -417,24 +1223,41 @@ seen values, which can grow up to the size of the list in the worst case (if all
 | `__init__`           | O(1)            | O(1)             |
 | `get_head_node`      | O(1)            | O(1)             |
 | `insert_beginning`   | O(1)            | O(1)             |
-| `insert_end`         | O(n)            | O(1)             |
+| `insert_end`         | O(1)            | O(1)             |
 | `remove_node`        | O(n)            | O(1)             |
 | `stringify_list`     | O(n)            | O(n)             |
+| `__iter__`           | O(n)            | O(1)             |
+| `write_to`           | O(n)            | O(chunk_size)    |
+| `preview`            | O(limit)        | O(limit)         |
 | `search`             | O(n)            | O(1)             |
+| `remove_node` (indexed) | O(1) amortized | O(1)          |
+| `search` (indexed)   | O(1) average    | O(1)             |
+| `search` (self-organizing) | O(d)      | O(1)             |
+| `sort`               | O(n log n)      | O(1)             |
+| `merge_sorted`       | O(N log k)      | O(k)             |
 | `reverse`            | O(n)            | O(1)             |
 | `find_middle`        | O(n)            | O(1)             |
 | `has_cycle`          | O(n)            | O(1)             |
 | `find_cycle_start`   | O(n)            | O(1)             |
+| `cycle_info`         | O(n)            | O(1)             |
 | `remove_duplicates`  | O(n)            | O(n)             |
+| `__len__`            | O(1)            | O(1)             |
+| `extend`             | O(k)            | O(k)             |
+| `remove_all`         | O(n + k)        | O(k + r)         |
+| `remove_all` (indexed) | O(k + r)      | O(k)             |
+| `remove_where`       | O(n)            | O(r)             |
+| pickle / `deepcopy`  | O(n)            | O(n)             |
+| `acquire` / `release` (pooled) | O(1) | O(1)        |
 
 ---
 
 ### Key Takeaways
 
-- Most operations that involve traversing the list (e.g., `insert_end`, `remove_node`, `search`, `reverse`, etc.)
+- Most operations that involve traversing the list (e.g., `remove_node`, `search`, `reverse`, etc.)
 have a **time complexity of O(n)**.
 
-- Operations that modify the head of the list (e.g., `insert_beginning`) have a **time complexity of O(1)**.
+- Operations that modify the head or the tail of the list (e.g., `insert_beginning`, `insert_end`) have a
+**time complexity of O(1)**, because both ends are referenced directly.
 
 - The **space complexity** is generally O(1) for most operations, except for `stringify_list` and `remove_duplicates`,
 which use additional space proportional to the size of the list.
@@ -598,94 +1421,96 @@ def insert_end(self, value):
 ```
     if self.head_node is None:  # Step 2: If list is empty
         self.head_node = new_node  # Make new_node the head
-        return
 ```
-- If the **list is empty** (`self.head_node is None`),  
-  - The new node becomes the **head** of the linked list.
-  - The function **returns immediately**, since the node has been added.
+- If the **list is empty** (`self.head_node is None`), the new node becomes the **head** of the linked list.
 
 ---
 
 ```
-    current_node = self.head_node  # Step 3: Start from the head node
+    else:
+        self.tail_node.set_next_node(new_node)  # Step 3: Link last node to new node
 ```
-- If the list **is not empty**,  
-  - We start from the **head node** and traverse the list.
+- If the list **is not empty**, we already know the **last node**: it is stored in `self.tail_node`.
+- We **set its `next_node`** to point to the new node. No traversal is needed.
 
 ---
 
 ```
-    while current_node.get_next_node():  # Step 4: Traverse to the last node
-        current_node = current_node.get_next_node()
+    self.tail_node = new_node  # Step 4: The new node is the new tail
+    self.length += 1  # Step 5: Count the new node
 ```
-- This **loop moves through** each node in the linked list.  
-- It stops when it reaches the **last node**, which is the node whose `next_node` is `None`.  
+- The new node is now the **last node**, so `tail_node` is moved to it.
+- The node count (`length`) grows by one, which is what `len(ll)` returns.
 
 ---
 
-```
-    current_node.set_next_node(new_node)  # Step 5: Link last node to new node
-```
-- Once the **last node** is found,  
-  - We **set its `next_node`** to point to the new node.  
-- Now, the new node is **added at the end** of the list.
+## **Why keep a `tail_node`?**
+
+Without a tail reference, every call has to walk from `head_node` to the last node, so building a list of `n` elements
+costs `1 + 2 + ... + n`, which is **O(n²)**. With `tail_node`, each append is **O(1)** and building the list is **O(n)**.
+
+The price is that every method that changes the end of the list must keep `tail_node` (and `length`) correct:
+
+- `insert_beginning` sets `tail_node` when the list was empty.
+- `remove_node` moves `tail_node` back to the previous node when the last node is removed.
+- `reverse` sets `tail_node` to the old head node.
+- `remove_duplicates` sets `tail_node` to the last node it keeps.
 
 ---
 
 ## **Example Walkthrough**
 
-Let’s see how this works with an example.
-
-### **Step 1: Create an Empty Linked List**
 ```
 ll = LinkedList()
+ll.insert_end(1)  # head -> 1, tail -> 1
+ll.insert_end(2)  # 1 -> 2, tail -> 2 (linked directly after the old tail)
+ll.insert_end(3)  # 1 -> 2 -> 3, tail -> 3
+len(ll)           # 3
 ```
-- `head_node` is `None` because the list is empty.
 
 ---
 
-### **Step 2: Insert `1`**
-```
-ll.insert_end(1)
+## **Bulk Insertion with `extend(self, values)`**
+
 ```
-- Since the list is **empty**, the new node with value `1` becomes the **head**.
-- **List after operation**:  
-  ```
-  1
-  ```
+def extend(self, values):
+    first_node = None
+    last_node = None
+    count = 0
 
----
+    for value in values:
+        new_node = Node(value)
+        if last_node is None:
+            first_node = new_node
+        else:
+            last_node.set_next_node(new_node)
+        last_node = new_node
+        count += 1
+
+    if first_node is None:
+        return
 
-### **Step 3: Insert `2`**
-```
-ll.insert_end(2)
+    if self.head_node is None:
+        self.head_node = first_node
+    else:
+        self.tail_node.set_next_node(first_node)
+
+    self.tail_node = last_node
+    self.length += count
 ```
-- The method starts at `head_node` (which contains `1`).
-- Since `1` is the **only node**, we **set its `next_node`** to the new node `2`.
-- **List after operation**:
-  ```
-  1 -> 2
-  ```
 
----
+- The values are first linked into a **chain of their own** (`first_node -> ... -> last_node`).
+- The whole chain is then attached after `tail_node` in **one step**, and `tail_node` and `length` are updated once.
+- Adding `k` values costs **O(k)**, no matter how long the list already is.
 
-### **Step 4: Insert `3`**
 ```
-ll.insert_end(3)
+ll.extend([4, 5, 6])  # 1 -> 2 -> 3 -> 4 -> 5 -> 6
 ```
-- The method starts at `head_node` (which contains `1`).
-- It moves to the **next node** (`2`), which is the last node.
-- It **sets `2.next_node` to `3`**.
-- **List after operation**:
-  ```
-  1 -> 2 -> 3
-  ```
-
----
 
 ## **Final Thoughts**
 - If the list is **empty**, we **set the head** to the new node.
-- If the list has **nodes**, we **traverse** to the last node and **attach** the new node at the end.
+- If the list has **nodes**, we **attach** the new node after the tail node in constant time.
+
 
 # =========================================================================================================================== #
 
@@ -707,11 +1532,15 @@ def remove_node(self, value_to_remove):
 ```
     if current_node and current_node.get_value() == value_to_remove:
         self.head_node = current_node.get_next_node()  # Move head to next node
+        if self.head_node is None:
+            self.tail_node = None  # The list is now empty
+        self.length -= 1
         return
 ```
 - If the **head node** itself has the value we need to remove:
   - We update `self.head_node` to the **next node**.
   - This effectively **removes the head node** from the list.
+  - If it was the only node, the list is empty and `tail_node` is cleared too.
   - **Function returns early** (no need to continue).
 
 ---
@@ -740,10 +1569,14 @@ if next_node.get_value() == value_to_remove:
 ### **Step 4: Remove the Node**
 ```
 current_node.set_next_node(next_node.get_next_node())  # Skip node
+if next_node is self.tail_node:
+    self.tail_node = current_node  # The previous node is the new tail
+self.length -= 1
 return
 ```
 - We **skip the node** by making `current_node.next_node` point to `next_node.next_node`.  
 - This effectively removes `next_node` from the list.
+- If the removed node was the **tail**, `current_node` becomes the new tail.
 - The function **returns early** after removal.
 
 ---
@@ -808,6 +1641,27 @@ ll.remove_node(1)
 - Otherwise, we **traverse the list**, find the first match, and **skip that node**.
 - The method **removes only the first occurrence** of the value.
 
+---
+
+## **Recycling Removed Nodes (`node_pool`)**
+
+`LinkedList(node_pool=pool)` takes its nodes from a `NodePool` (see the `01-Nodes` folder) created for this
+module's `Node` class, and gives back every node it unlinks:
+
+```
+pool = NodePool(Node)
+ll = LinkedList(node_pool=pool)
+ll.extend([1, 2, 3])   # 3 allocations
+ll.remove_node(2)      # the node of 2 goes back to the pool
+ll.insert_end(4)       # reuses that node: Node.reset(4)
+```
+
+- `Node.reset(value, next_node=None)` turns a recycled node into a fresh one, and `release` resets a node to `None` before
+  it waits in the pool, so a removed value is not kept alive by the pool.
+- A released node is reused for another value, so code outside the list must not hold on to a node after removing
+  its value (for example a node returned by `get_head_node()`).
+- Without a pool (the default), nodes are created with `Node(value)` and freed by Python as before.
+
 # =========================================================================================================================== #
 
                                                 stringify_list(self)
@@ -815,100 +1669,99 @@ ll.remove_node(1)
 This method **creates a string representation of the linked list**, which helps us see the contents of the list
 in a readable format.
 
-### **Method Explanation**
+### **Walking the List: `__iter__`**
 ```
-def stringify_list(self):
-    string_list = ""  # Initialize an empty string
-    current_node = self.head_node  # Start with the head node
+def __iter__(self):
+    current_node = self.head_node
+    while current_node:
+        yield current_node.get_value()
+        current_node = current_node.get_next_node()
 ```
-1. **`string_list = ""`**:  
-   We start with an empty string `string_list`. This will hold the final string representation of the linked list.
-
-2. **`current_node = self.head_node`**:  
-   The `current_node` starts at the **head node** of the linked list. We will use this to traverse the list.
+- `__iter__` is a **generator**: it hands out one value at a time, from the head node to the tail node.
+- It makes the list work with `for value in ll`, `list(ll)`, and every function that accepts an iterable.
 
 ---
 
+### **Method Explanation**
 ```
-while current_node:  # Traverse the linked list
-    string_list += str(current_node.get_value()) + " -> "  # Add node's value to the string
-    current_node = current_node.get_next_node()  # Move to the next node
+def stringify_list(self):
+    string_list = " -> ".join(str(value) for value in self if value is not None)
+    return string_list if string_list else "Empty List"
 ```
-3. **`while current_node:`**:  
-   This loop will run as long as `current_node` is not `None` (i.e., it hasn't reached the end of the list).
+1. **`str(value) for value in self if value is not None`**:  
+   Walks the list through `__iter__` and converts every value to a string, skipping `None` values.
 
-4. **`string_list += str(current_node.get_value()) + " -> "`**:  
-   - For each node, we get its **value** using `current_node.get_value()`.
-   - We **convert** the value to a string (in case it’s not a string).
-   - We then add the node’s value followed by `" -> "` to the `string_list`.  
-     This creates the visual "link" between nodes in the string.
+2. **`" -> ".join(...)`**:  
+   Puts `" -> "` **between** the values, so there is no trailing separator to slice off.
+   `join` first collects the pieces, adds up their lengths, and then copies every piece **once** into the result.
 
-5. **`current_node = current_node.get_next_node()`**:  
-   After adding the current node’s value, we move to the **next node** by updating `current_node`.
+3. **`if string_list else "Empty List"`**:  
+   If the list is empty, it returns `"Empty List"`.
 
 ---
 
-```
-return string_list[:-4] if string_list else "Empty List"
-```
-6. **`string_list[:-4]`**:  
-   After the loop finishes, `string_list` will have a trailing `" -> "` at the end.  
-   We **remove** the last four characters (`" -> "`) using slicing: `[:-4]`.
+### **Why not `string_list += ...`?**
 
-7. **`if string_list else "Empty List"`**:  
-   - If `string_list` is empty (i.e., the list is empty), it returns `"Empty List"`.
-   - Otherwise, it returns the final string representation of the linked list.
+Python strings are **immutable**, so `string_list += str(value) + " -> "` may have to create a new string and copy
+everything built so far. For `n` nodes this copies about `n²/2` characters in total, which is **quadratic**: on a
+list with millions of nodes it dominates the running time and creates huge temporary strings. `join` does the same
+job in **linear** time.
 
 ---
 
-## **Example Walkthrough**
+### **Streaming and Previewing**
 
-Let’s walk through an example.
+```
+def write_to(self, fileobj, chunk_size=1024):
+    strings = (str(value) for value in self if value is not None)
+    separator = ""
 
-### **Example 1: A List with Nodes**
+    while True:
+        chunk = list(islice(strings, chunk_size))
+        if not chunk:
+            break
+        fileobj.write(separator + " -> ".join(chunk))
+        separator = " -> "
 ```
-ll = LinkedList()
-ll.insert_end(1)
-ll.insert_end(2)
-ll.insert_end(3)
+- `write_to` writes the same text as `stringify_list` to any object with a `write()` method (an open file, a socket
+  wrapper, `io.StringIO`, ...), **without ever building the whole string**.
+- `islice` takes the next `chunk_size` strings from the generator, so at most one chunk is in memory at a time.
+- The separator is written **before** every chunk except the first one.
+
 ```
+def preview(self, limit):
+    strings = list(islice((str(value) for value in self if value is not None), limit + 1))
+    if len(strings) > limit:
+        strings[limit:] = ["..."]
+    return " -> ".join(strings) if strings else "Empty List"
+```
+- `preview` stops the traversal after `limit + 1` values, so it costs O(limit) even on a huge list.
+- Taking **one extra** value tells us whether more values follow; if so, it is replaced by `"..."`.
 
-- **Initial list**:  
-  ```
-  1 -> 2 -> 3
-  ```
+---
 
-- When we call `ll.stringify_list()`, it performs the following:
-  - Starts with `current_node` as the **head node** (`1`).
-  
-  - Adds `1` to `string_list`:  
-    `"1 -> "`
-    
-  - Moves to the next node (`2`), adds `2`:  
-    `"1 -> 2 -> "`
-    
-  - Moves to the next node (`3`), adds `3`:  
-    `"1 -> 2 -> 3 -> "`
-    
-  - The loop ends because `current_node` is now `None`.
-  
-  - We slice off the last `" -> "`, resulting in:  
-    `"1 -> 2 -> 3"`
+## **Example Walkthrough**
 
-### **Example 2: An Empty List**
 ```
-empty_ll = LinkedList()
+ll = LinkedList()
+ll.extend([1, 2, 3, 4])
+
+ll.stringify_list()  # "1 -> 2 -> 3 -> 4"
+ll.preview(2)        # "1 -> 2 -> ..."
+
+with open("list.txt", "w") as output_file:
+    ll.write_to(output_file, chunk_size=2)  # Writes "1 -> 2", then " -> 3 -> 4"
 ```
 
-- **List is empty**:  
-  The `stringify_list` method returns `"Empty List"`.
+- For an empty list, `stringify_list` and `preview` return `"Empty List"`, and `write_to` writes `"Empty List"`.
 
 ---
 
 ## **Final Thoughts**
-- The method **traverses the linked list** node by node, appending each node's value to a string.
-- The final result is a string representation of the list (e.g., `"1 -> 2 -> 3"`).
-- If the list is empty, it returns `"Empty List"`.
+- `__iter__` walks the linked list node by node and yields each value.
+- `stringify_list` joins the values in a single pass (e.g., `"1 -> 2 -> 3"`).
+- `write_to` streams the same text in chunks, and `preview` stops after the first `limit` values.
+
 
 # =========================================================================================================================== #
 
@@ -1009,6 +1862,36 @@ print(ll.search(4))  # Output: False
 - It checks if each node's value matches the one we are looking for.
 - If it finds a match, it returns `True`. If it doesn't, it returns `False`.
 
+---
+
+## **Self-Organizing Search (`search_policy`)**
+
+When a few values are searched for much more often than the others, the list can reorder itself so that those values
+end up near the head node, where the search finds them after a few steps:
+
+```
+ll = LinkedList(search_policy="move_to_front")  # or "transpose", or "static" to only count
+```
+
+- **`_search_self_organizing(value)`** walks like `search`, but keeps `prev_node` and `prev_prev_node`, the two nodes
+  before the current one. On a hit it applies the policy, which only changes a few links:
+  - **`"move_to_front"`**: `_move_to_front` unlinks the node and links it in again as the head node.
+    Searching `d` in `a -> b -> c -> d -> e` gives `d -> a -> b -> c -> e`.
+  - **`"transpose"`**: `_swap_with_prev` swaps the node with the node before it.
+    Searching `d` in `a -> b -> c -> d -> e` gives `a -> b -> d -> c -> e`.
+- If the found node was the tail node, `tail_node` moves to the node that is now last.
+- A miss does not change the order.
+
+The list also counts what happens, so you can check that the policy helps:
+
+- **`search_hits`** and **`search_misses`**: the number of successful and failed searches.
+- **`hit_depth_total`**: for every hit, the number of nodes compared (1 if the value was in the head node).
+- **`average_hit_depth()`**: `hit_depth_total / search_hits`. Without a policy, it is about `n / 2` for uniform
+  queries; with a good policy and skewed queries it is much smaller.
+- **`reset_search_stats()`**: sets the counters back to zero.
+
+An indexed list finds values without walking, so combining `indexed=True` with a `search_policy` raises `ValueError`.
+
 # =========================================================================================================================== #
 
                                                 reverse(self)
@@ -1598,6 +2481,79 @@ Let’s walk through an example with a linked list that has a cycle:
 - The second loop finds the start of the cycle by resetting `slow` to the head and moving both `slow` and `fast`
 pointers one step at a time until they meet at the start of the cycle.
 
+# =========================================================================================================================== #
+
+                                                    cycle_info(self)
+
+`cycle_info` answers everything about a cycle in **one call**:
+
+```
+has_cycle, start_value, cycle_length, tail_length = ll.cycle_info()
+```
+
+- `has_cycle`: `True` if the list contains a cycle.
+- `start_value`: the value of the first node of the cycle (`None` if there is no cycle).
+- `cycle_length`: the number of nodes in the cycle (`0` if there is no cycle).
+- `tail_length`: the number of nodes before the cycle, or the length of the whole list if there is no cycle.
+
+### **Phase 1: Brent's Algorithm Finds the Cycle Length**
+
+```
+while hare is not tortoise:
+    if hare is None:
+        return False, None, 0, visited_count
+
+    if power == cycle_length:
+        tortoise = hare
+        power *= 2
+        cycle_length = 0
+
+    hare = hare.get_next_node()
+    cycle_length += 1
+    visited_count += 1
+```
+
+- Instead of moving both pointers, the **tortoise waits** while the **hare** walks up to `power` steps (1, 2, 4, 8, ...).
+- When the hare has walked `power` steps without meeting the tortoise, the tortoise **teleports** to the hare, `power`
+  doubles and the step counter starts again.
+- Once `power` is at least the cycle length and both pointers are inside the cycle, the hare walks around the cycle
+  and comes back to the waiting tortoise. The number of steps it took is exactly the **cycle length**.
+- If the hare reaches `None`, the list has an end, so there is no cycle; `visited_count` is then the list length.
+
+### **Phase 2: Finding Where the Cycle Starts**
+
+```
+tortoise = self.head_node
+hare = self.head_node
+for _ in range(cycle_length):
+    hare = hare.get_next_node()
+
+while tortoise is not hare:
+    tortoise = tortoise.get_next_node()
+    hare = hare.get_next_node()
+    tail_length += 1
+```
+
+- The hare starts `cycle_length` nodes ahead of the tortoise. Moving both one step at a time keeps them exactly one
+  lap apart, so they meet at the **first node of the cycle**, after walking the tail.
+- The number of steps taken is the **tail length**.
+
+### **Why Brent Instead of Floyd?**
+
+- Floyd's fast pointer follows two links per step and the slow one follows another, while Brent's hare follows only
+  **one**. Brent's algorithm usually finds the cycle with fewer link follows.
+- `has_cycle` followed by `find_cycle_start` runs the Floyd detection loop **twice** and still does not know the
+  cycle length. `cycle_info` detects the cycle once and returns all four answers.
+
+### **Example**
+
+```
+5 -> 4 -> 3 -> 2 -> 1
+               ^    |
+               |____|
+```
+`cycle_info()` returns `(True, 2, 2, 3)`: the cycle `2 -> 1 -> 2` has 2 nodes and starts after the 3 nodes `5, 4, 3`.
+
 # =========================================================================================================================== #
 
                                             remove_duplicates(self)
@@ -1771,4 +2727,208 @@ Duplicates (the second `2` and `1`) have been removed.
 - If it encounters a node with a duplicate value, it skips that node by adjusting the `next` pointer.
 - The final result is a linked list with unique values, and the duplicates are removed.
 
+# =========================================================================================================================== #
+
+                                            Indexed Mode: LinkedList(indexed=True)
+
+By default `search` and `remove_node` walk the list from `head_node`, which is O(n). When a program does many
+membership checks and removals by value, the list can be created with `indexed=True`:
+
+```
+ll = LinkedList(indexed=True)
+```
+
+Two dictionaries are then kept next to the nodes:
+
+1. **`value_index`** maps each value to the node holding it.
+   - Most values occur once, so the node itself is the entry. A `deque` takes 760 bytes even for one node,
+     more than ten times the node.
+   - When a second node gets the same value, the entry becomes a `deque` of its nodes **in list order**.
+     `insert_end` and `extend` append the new node on the right; `insert_beginning` appends it on the left, because it
+     becomes the first occurrence.
+   - When removals leave one node in the deque, the entry goes back to being that node.
+
+2. **`prev_nodes`** maps each node to the node **before** it (`None` for the head node).
+   - A singly linked node only knows its next node, but removing it means changing its predecessor's `next_node`.
+   - With `prev_nodes`, the predecessor is found in O(1) instead of by walking from the head.
+
+### **Searching**
+
+```
+if self.value_index is not None:
+    return value in self.value_index
+```
+
+- Only values that are in the list have an entry, so the search is one dictionary lookup.
+
+### **Removing** (`_remove_indexed`)
+
+```
+node_to_remove = nodes.popleft()  # First occurrence in list order
+prev_node = self.prev_nodes.pop(node_to_remove)
+next_node = node_to_remove.get_next_node()
+```
+
+- The first node with the value is the entry itself, or the left end of its deque if the value is repeated.
+- Its predecessor is linked to its successor (or `head_node` moves if it had no predecessor),
+  and the successor's entry in `prev_nodes` is updated. If there is no successor, the predecessor becomes `tail_node`.
+
+### **Keeping the Index Consistent**
+
+- `reverse` swaps every node's predecessor with its old next node while it flips the links, and reverses each deque,
+  because the list order of equal values is reversed too.
+- `remove_duplicates` drops the removed nodes from `prev_nodes` and replaces each deque with its left (first) node.
+
+**Example:**
+```
+ll = LinkedList(indexed=True)
+ll.extend(["a", "b", "c", "b"])
+ll.remove_node("b")  # a -> c -> b, no traversal
+ll.search("c")       # True, no traversal
+```
+
+The trade-off is memory: the index adds about one dictionary entry per node, and values must be hashable.
+
+# =========================================================================================================================== #
+
+                                        sort(self, key=None, reverse=False) and merge_sorted(*lists)
+
+## **Sorting Without Copying**
+
+Copying the values into a Python list, sorting it and rebuilding the nodes needs a second copy of the data.
+`sort` instead **relinks the existing nodes** with a **bottom-up merge sort**:
+
+1. Treat the list as runs of `width = 1` node, which are sorted by definition.
+2. Walk the list, cut off two neighbouring runs (`_split_run`) and merge them into one sorted run (`_merge_runs`),
+   linking the result after the previous merged run.
+3. Double `width` and repeat until one run covers the whole list.
+
+```
+width 1:  4 | 1 | 3 | 5 | 2   ->   1 4 | 3 5 | 2
+width 2:  1 4 | 3 5 | 2       ->   1 3 4 5 | 2
+width 4:  1 3 4 5 | 2         ->   1 2 3 4 5
+```
+
+- It is **bottom-up** (no recursion), so it needs no call stack, only a few node references.
+- `_merge_runs` takes a node from the right run only if it must come **strictly** before the left one, so equal
+  values keep their original order: the sort is **stable**, with or without `reverse=True`.
+- `key` works as in `list.sort`: values are compared by `key(value)`.
+- The last merged node becomes `tail_node`. In indexed mode, `value_index` and `prev_nodes` are rebuilt.
+
+## **Merging Sorted Lists**
+
+```
+merged_ll = merge_sorted(shard_1, shard_2, shard_3)
+```
+
+- `merge_sorted` takes any number of **already sorted** lists and returns one new sorted `LinkedList`.
+- `heapq.merge` keeps the current first node of every list on a heap, so picking the next smallest node costs
+  O(log k) for `k` lists, and the whole merge costs **O(N log k)**.
+- The nodes are **moved**, not copied: `_take_nodes` detaches them from each input list (leaving it empty), and
+  `_walk_nodes` reads each node's next node before the node is relinked into the result.
+
+# =========================================================================================================================== #
+
+                                    remove_all(self, values) and remove_where(self, predicate)
+
+## **Removing Many Values in One Pass**
+
+Calling `remove_node` for each of `k` values walks the list `k` times, O(n * k), and removes only the first node
+with each value. `remove_where` unlinks **every** matching node in a **single pass** and returns how many it removed:
+
+```
+prev_node = None
+current_node = self.head_node
+
+while current_node is not None:
+    next_node = current_node.get_next_node()
+
+    if predicate(current_node.get_value()):
+        # Skip the node by linking its predecessor to its successor
+        if prev_node is None:
+            self.head_node = next_node
+        else:
+            prev_node.set_next_node(next_node)
+        ...
+    else:
+        prev_node = current_node
+
+    current_node = next_node
+
+self.tail_node = prev_node
+```
+
+- `prev_node` is always the **last node kept**, so a run of matching nodes is skipped one node at a time without
+  losing the link to the rest of the list. Matching head nodes simply move `head_node` forward.
+- When the walk ends, the last node kept is the new `tail_node`, and `length` drops by the number of removed nodes.
+- `remove_all(values)` puts the values in a **set** and calls `remove_where(values_to_remove.__contains__)`, so each
+  node is checked with an O(1) lookup: O(n + k) in total.
+
+## **With the Index**
+
+- In indexed mode, `remove_all` does not traverse the list: `value_index.pop(value)` returns the node or the deque
+  of nodes holding the value, and `_unlink_indexed` unlinks each one through `prev_nodes`, just like `remove_node` does for a single node.
+- `remove_where` keeps `prev_nodes` up to date while it walks, then drops the removed nodes from their entries in
+  `value_index`.
+- The length, the tail and the index are updated in a `finally` block. If the predicate raises partway, the nodes
+  unlinked so far stay removed, and `len`, `tail_node` and `value_index` still match the list.
+
+**Example:**
+```
+ll = LinkedList()
+ll.extend([10, 11, 12, 10, 13, 14, 11])
+ll.remove_all({10, 11, 99})                  # Returns 4, leaving 12 -> 13 -> 14
+ll.remove_where(lambda value: value % 2 == 0)  # Returns 2, leaving 13
+```
+
+# =========================================================================================================================== #
+
+                                Pickling and Copying: __getstate__, __setstate__, __reduce__, __deepcopy__
+
+## **Why the Default Fails**
+
+By default, `pickle` and `copy.deepcopy` save an object by saving each of its attributes. `head_node` is a `Node`
+whose `next_node` is another `Node`, and so on: saving the list means saving the first node, which means saving the
+second node **inside** it, and so on. Each node adds a level of recursion, so a list with more than about 1,000 nodes
+raises `RecursionError`.
+
+## **Saving a Flat List of Values**
+
+```
+def __getstate__(self):
+    return list(self)
+
+def __setstate__(self, values):
+    self.extend(values)
+
+def __reduce__(self):
+    return self.__class__, (None, self.value_index is not None), self.__getstate__()
+```
+
+- `__reduce__` tells `pickle` how to rebuild the list: call `LinkedList(None, indexed)` to create an empty list with
+  the same mode, then call `__setstate__` with the saved state.
+- The state is `list(self)`: the values from head to tail, collected by the iterative `__iter__`. The nodes, the tail
+  reference, the length and the index are **not** saved; `extend` rebuilds all of them.
+- `copy.copy` also goes through `__reduce__`, so a shallow copy gets new nodes holding the same values.
+
+## **Deep Copies**
+
+```
+def __deepcopy__(self, memo):
+    copied = self.__class__(indexed=self.value_index is not None)
+    memo[id(self)] = copied
+    copied.extend(copy.deepcopy(value, memo) for value in self)
+    return copied
+```
+
+- The new list is registered in `memo` **before** the values are copied, so a value that refers back to the list is
+  copied as a reference to the new list instead of looping forever.
+- Only the values are deep-copied, one at a time; the nodes are created fresh by `extend`.
+
+**Example:**
+```
+restored_ll = pickle.loads(pickle.dumps(long_ll))  # Works for millions of nodes
+copied_ll = copy.deepcopy(words_ll)                # Changing the copy leaves the original alone
+```
+
 """
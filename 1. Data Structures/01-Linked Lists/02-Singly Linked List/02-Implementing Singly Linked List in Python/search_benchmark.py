@@ -0,0 +1,97 @@
+# Benchmark: self-organizing search policies against the static list on Zipf-distributed queries
+
+import random
+import time
+
+from main import LinkedList
+
+SIZE = 1_000
+QUERIES = 50_000
+ZIPF_EXPONENTS = [0.8, 1.0, 1.2]  # Larger exponents concentrate the queries on fewer hot values
+POLICIES = ["static", "move_to_front", "transpose"]
+
+
+def zipf_queries(exponent, rng):
+    # Draw QUERIES values where the value of rank k is searched with a weight of 1 / k ** exponent.
+    # The ranks are given to the values in a random order, so the hot values are spread over the list.
+    ranked_values = list(range(SIZE))
+    rng.shuffle(ranked_values)
+    weights = [1 / rank**exponent for rank in range(1, SIZE + 1)]
+    return rng.choices(ranked_values, weights=weights, k=QUERIES)
+
+
+def run(policy, queries):
+    # Search every query in a fresh list and return the elapsed time in seconds and the average hit depth
+    ll = LinkedList(search_policy=policy)
+    ll.extend(range(SIZE))
+
+    start = time.perf_counter()
+    for value in queries:
+        ll.search(value)
+    elapsed = time.perf_counter() - start
+
+    assert ll.search_hits == QUERIES
+    return elapsed, ll.average_hit_depth()
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    print(f"{SIZE:,} values, {QUERIES:,} queries per run")
+    print(f"{'Zipf s':>6} | {'Policy':<13} | {'Time (s)':>8} | {'Avg hit depth':>13} | {'Speedup':>7}")
+    print("-" * 60)
+
+    for exponent in ZIPF_EXPONENTS:
+        queries = zipf_queries(exponent, rng)
+        static_time = None
+
+        for policy in POLICIES:
+            elapsed, depth = run(policy, queries)
+            if static_time is None:
+                static_time = elapsed
+            print(
+                f"{exponent:>6} | {policy:<13} | {elapsed:>8.3f} | {depth:>13.1f} | "
+                f"{static_time / elapsed:>6.1f}x"
+            )
+        print("-" * 60)
+
+
+# Output:
+
+"""
+1,000 values, 50,000 queries per run
+Zipf s | Policy        | Time (s) | Avg hit depth | Speedup
+------------------------------------------------------------
+   0.8 | static        |    3.815 |         528.6 |    1.0x
+   0.8 | move_to_front |    1.957 |         286.8 |    1.9x
+   0.8 | transpose     |    2.997 |         407.4 |    1.3x
+------------------------------------------------------------
+   1.0 | static        |    4.574 |         546.7 |    1.0x
+   1.0 | move_to_front |    1.519 |         184.6 |    3.0x
+   1.0 | transpose     |    2.623 |         319.8 |    1.7x
+------------------------------------------------------------
+   1.2 | static        |    3.169 |         403.2 |    1.0x
+   1.2 | move_to_front |    0.851 |         104.3 |    3.7x
+   1.2 | transpose     |    1.370 |         223.5 |    2.3x
+------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- The time of a search is proportional to the depth of the hit, so the speedup follows the drop in the average
+hit depth. The static depth depends only on where the hot values happen to sit in the list (about `n / 2` on average).
+
+- The more skewed the queries, the more the policies gain: with `s = 1.2` the 10 hottest of the 1,000 values get more than
+half of all queries, and move-to-front keeps them within the first few nodes.
+
+- Move-to-front wins on every stream here because it adapts at once: a value moves to the head after one hit.
+Transpose moves a value one step per hit, so over 50,000 queries the hot values are still on their way to the front.
+Transpose is better when the hot set is stable and the stream is long, because a single search for a cold value
+cannot push it in front of all the hot ones.
+
+- Every run starts from the same order and uses the same queries, and every query is a hit, so the table compares
+the policies only.
+"""
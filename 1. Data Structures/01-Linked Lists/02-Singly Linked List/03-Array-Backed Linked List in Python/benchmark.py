@@ -0,0 +1,114 @@
+# Benchmark: memory per element of ArrayLinkedList against the Node-based LinkedList
+
+import gc
+import importlib.util
+import os
+import tracemalloc
+
+from main import ArrayLinkedList
+
+SIZE = 1_000_000
+
+
+def load_linked_list():
+    # Import LinkedList from the Node-based implementation in the neighbouring folder
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "02-Implementing Singly Linked List in Python",
+        "main.py",
+    )
+    spec = importlib.util.spec_from_file_location("singly_linked_list", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.LinkedList
+
+
+def bytes_per_element(build, values):
+    # Measure how many bytes the structure allocates for each element.
+    # The values are created before tracing starts, so only the container itself is counted.
+    gc.collect()
+    tracemalloc.start()
+    container = build(values)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(container) == len(values)
+    del container
+    return current / len(values), peak / len(values)
+
+
+if __name__ == "__main__":
+    LinkedList = load_linked_list()
+
+    def node_list(values):
+        ll = LinkedList()
+        ll.extend(values)
+        return ll
+
+    def array_list(values):
+        al = ArrayLinkedList()
+        al.extend(values)
+        return al
+
+    def packed_array_list(values):
+        al = ArrayLinkedList(typecode="q")
+        al.extend(values)
+        return al
+
+    workloads = {
+        "small ints": list(range(SIZE)),
+        "short strings": [f"id{i}" for i in range(SIZE)],
+    }
+    builders = {
+        "LinkedList (Node)": node_list,
+        "ArrayLinkedList": array_list,
+        'ArrayLinkedList("q")': packed_array_list,
+    }
+
+    print(f"{SIZE:,} elements")
+    print(f"{'Workload':<14} | {'Structure':<22} | {'bytes/element':>13} | {'peak bytes/element':>18}")
+    print("-" * 76)
+
+    for workload, values in workloads.items():
+        for name, build in builders.items():
+            if name == 'ArrayLinkedList("q")' and not isinstance(values[0], int):
+                continue  # A typed array can only hold numbers
+
+            current, peak = bytes_per_element(build, values)
+            print(f"{workload:<14} | {name:<22} | {current:>13.1f} | {peak:>18.1f}")
+
+
+# Output:
+
+"""
+1,000,000 elements
+Workload       | Structure              | bytes/element | peak bytes/element
+----------------------------------------------------------------------------
+small ints     | LinkedList (Node)      |          48.0 |               48.0
+small ints     | ArrayLinkedList        |          16.6 |               16.6
+small ints     | ArrayLinkedList("q")   |          16.4 |               16.4
+short strings  | LinkedList (Node)      |          48.0 |               48.0
+short strings  | ArrayLinkedList        |          16.6 |               16.6
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Only the memory allocated by the container is measured: the values already exist before tracing starts,
+just as they would when a program moves existing objects into a list.
+
+- Each `Node` is a full Python object, so the `Node`-based list pays for the object header, the garbage collector
+header and two attribute slots on every element: 48 bytes on CPython 3.11 with `__slots__`, and about 90 bytes
+without them, when every instance gets its own `__dict__`.
+
+- `ArrayLinkedList` keeps one 8-byte reference per value in a list and one 8-byte index in an `array`, so it needs
+about 16 bytes per element plus the spare capacity that lists and arrays keep for cheap appends. That is about
+**3 times less** memory than the `Node`-based list.
+
+- With `typecode="q"`, small ints are stored unboxed in the array. The ints in the workload already exist, so the
+saving shown here is the same as for the plain list; in a real program the int objects themselves could be freed too.
+"""
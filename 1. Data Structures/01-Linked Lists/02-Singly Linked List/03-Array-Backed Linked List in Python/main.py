@@ -0,0 +1,332 @@
+# Implementation in Python:
+
+from array import array
+
+NULL_INDEX = -1  # Marks "no next node", like None does for Node.next_node
+
+
+class ArrayLinkedList:
+    def __init__(self, typecode=None):
+        # Store the list in two parallel columns instead of one Node object per value:
+        # values[i] is the value of slot i and next_indices[i] is the slot that follows it.
+        # With a typecode (for example "q" for ints) values are packed into an array,
+        # otherwise any Python object can be stored in a plain list.
+        self.typecode = typecode
+        self.values = array(typecode) if typecode is not None else []
+        self.next_indices = array("q")
+
+        self.head_index = NULL_INDEX  # Slot of the first node
+        self.tail_index = NULL_INDEX  # Slot of the last node
+        self.free_index = NULL_INDEX  # First slot of the free list
+        self.length = 0
+
+    def __len__(self):
+        # Return the number of nodes in the linked list
+        return self.length
+
+    def _allocate(self, value, next_index):
+        # Take a slot from the free list, or grow both columns by one slot
+        if self.free_index != NULL_INDEX:
+            index = self.free_index
+            self.free_index = self.next_indices[index]  # Free slots are chained through next_indices
+            self.values[index] = value
+            self.next_indices[index] = next_index
+        else:
+            index = len(self.next_indices)
+            self.values.append(value)
+            self.next_indices.append(next_index)
+
+        self.length += 1
+        return index
+
+    def _release(self, index):
+        # Put a slot back on the free list so a later insert can reuse it
+        if self.typecode is None:
+            self.values[index] = None  # Drop the reference so the value can be freed
+
+        self.next_indices[index] = self.free_index
+        self.free_index = index
+        self.length -= 1
+
+    def get_head_index(self):
+        # Return the slot of the head node
+        return self.head_index
+
+    def insert_beginning(self, new_value):
+        # Insert a new node at the beginning of the linked list
+        self.head_index = self._allocate(new_value, self.head_index)
+
+        if self.tail_index == NULL_INDEX:
+            # If the list was empty, the new node is also the tail node
+            self.tail_index = self.head_index
+
+    def insert_end(self, value):
+        # Insert a new node at the end of the linked list
+        new_index = self._allocate(value, NULL_INDEX)
+
+        if self.head_index == NULL_INDEX:
+            # If the list is empty, set the new node as the head node
+            self.head_index = new_index
+        else:
+            # Link the new node after the tail node
+            self.next_indices[self.tail_index] = new_index
+
+        self.tail_index = new_index
+
+    def extend(self, values):
+        # Insert every value from an iterable at the end of the linked list
+        for value in values:
+            self.insert_end(value)
+
+    def remove_node(self, value_to_remove):
+        # Remove the first node with the specified value
+        values = self.values
+        next_indices = self.next_indices
+        current_index = self.head_index
+
+        if current_index != NULL_INDEX and values[current_index] == value_to_remove:
+            # If the head node is the one to be removed, update the head node
+            self.head_index = next_indices[current_index]
+            if self.head_index == NULL_INDEX:
+                self.tail_index = NULL_INDEX
+            self._release(current_index)
+            return
+
+        # Traverse the list to find the node to remove
+        while current_index != NULL_INDEX and next_indices[current_index] != NULL_INDEX:
+            next_index = next_indices[current_index]
+
+            if values[next_index] == value_to_remove:
+                # Skip the node to remove by updating the next index
+                next_indices[current_index] = next_indices[next_index]
+                if next_index == self.tail_index:
+                    self.tail_index = current_index
+                self._release(next_index)
+                return
+
+            current_index = next_index
+
+    def __iter__(self):
+        # Yield the values from head to tail
+        values = self.values
+        next_indices = self.next_indices
+        current_index = self.head_index
+
+        while current_index != NULL_INDEX:
+            yield values[current_index]
+            current_index = next_indices[current_index]
+
+    def stringify_list(self):
+        # Return a string representation of the linked list
+        string_list = " -> ".join(str(value) for value in self if value is not None)
+        return string_list if string_list else "Empty List"
+
+    def search(self, value):
+        # Search for a node with the specified value
+        values = self.values
+        next_indices = self.next_indices
+        current_index = self.head_index
+
+        while current_index != NULL_INDEX:
+            if values[current_index] == value:
+                return True
+            current_index = next_indices[current_index]
+
+        return False
+
+    def reverse(self):
+        # Reverse the linked list by flipping the next indices
+        next_indices = self.next_indices
+        prev_index = NULL_INDEX
+
+        self.tail_index = self.head_index
+
+        current_index = self.head_index
+        while current_index != NULL_INDEX:
+            next_index = next_indices[current_index]
+            next_indices[current_index] = prev_index
+            prev_index = current_index
+            current_index = next_index
+
+        self.head_index = prev_index
+
+    def find_middle(self):
+        # Find the middle node of the linked list using the two-pointer technique
+        next_indices = self.next_indices
+        slow = self.head_index
+        fast = self.head_index
+
+        while fast != NULL_INDEX and next_indices[fast] != NULL_INDEX:
+            slow = next_indices[slow]
+            fast = next_indices[next_indices[fast]]
+
+        return self.values[slow] if slow != NULL_INDEX else None
+
+    def has_cycle(self):
+        # Check if the linked list has a cycle using the two-pointer technique
+        next_indices = self.next_indices
+        slow = self.head_index
+        fast = self.head_index
+
+        while fast != NULL_INDEX and next_indices[fast] != NULL_INDEX:
+            slow = next_indices[slow]
+            fast = next_indices[next_indices[fast]]
+
+            if slow == fast:
+                return True
+
+        return False
+
+    def remove_duplicates(self):
+        # Remove duplicate values from the linked list
+        if self.head_index == NULL_INDEX:
+            return
+
+        values = self.values
+        next_indices = self.next_indices
+
+        # Use a set to keep track of seen values
+        seen_values = {values[self.head_index]}
+        current_index = self.head_index
+
+        while next_indices[current_index] != NULL_INDEX:
+            next_index = next_indices[current_index]
+            if values[next_index] in seen_values:
+                # Remove the duplicate node and recycle its slot
+                next_indices[current_index] = next_indices[next_index]
+                self._release(next_index)
+            else:
+                seen_values.add(values[next_index])
+                current_index = next_index
+
+        # The last node kept is the new tail node
+        self.tail_index = current_index
+
+
+# Example Usage
+if __name__ == "__main__":
+    al = ArrayLinkedList(typecode="q")  # Values are packed as 64-bit integers
+
+    al.extend([1, 2, 3, 4, 5])
+    print("Original List:")
+    print(al.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+    print("Columns:", list(al.values), list(al.next_indices))
+
+    # Test Searching
+    print("\nSearch for 3:", al.search(3))  # Output: True
+    print("Search for 10:", al.search(10))  # Output: False
+
+    # Test Finding Middle Node
+    print("\nMiddle Node:", al.find_middle())  # Output: 3
+
+    # Test Reversing
+    al.reverse()
+    print("\nReversed List:")
+    print(al.stringify_list())  # Output: 5 -> 4 -> 3 -> 2 -> 1
+
+    # Test Cycle Detection
+    print("\nCycle Detected:", al.has_cycle())  # Output: False
+
+    # Test Removing and Reusing Slots
+    al.remove_node(3)
+    print("\nAfter removing 3:", al.stringify_list())  # Output: 5 -> 4 -> 2 -> 1
+    print("Free slot:", al.free_index)  # Output: 2
+
+    al.insert_beginning(6)  # Reuses slot 2 instead of growing the columns
+    print("After inserting 6 at the beginning:", al.stringify_list())  # Output: 6 -> 5 -> 4 -> 2 -> 1
+    print("Slots used:", len(al.next_indices))  # Output: 5
+
+    # Test Removing Duplicates
+    al.insert_end(4)
+    al.insert_end(6)
+    print("\nList before removing duplicates:")
+    print(al.stringify_list())  # Output: 6 -> 5 -> 4 -> 2 -> 1 -> 4 -> 6
+
+    al.remove_duplicates()
+    print("\nList after removing duplicates:")
+    print(al.stringify_list())  # Output: 6 -> 5 -> 4 -> 2 -> 1
+    print("Length:", len(al))  # Output: 5
+
+    # Any Python object can be stored when no typecode is given
+    words = ArrayLinkedList()
+    words.extend(["red", "green", "blue"])
+    words.remove_node("green")
+    print("\nWords:", words.stringify_list())  # Output: red -> blue
+
+
+# Output:
+
+"""
+Original List:
+1 -> 2 -> 3 -> 4 -> 5
+Columns: [1, 2, 3, 4, 5] [1, 2, 3, 4, -1]
+
+Search for 3: True
+Search for 10: False
+
+Middle Node: 3
+
+Reversed List:
+5 -> 4 -> 3 -> 2 -> 1
+
+Cycle Detected: False
+
+After removing 3: 5 -> 4 -> 2 -> 1
+Free slot: 2
+After inserting 6 at the beginning: 6 -> 5 -> 4 -> 2 -> 1
+Slots used: 5
+
+List before removing duplicates:
+6 -> 5 -> 4 -> 2 -> 1 -> 4 -> 6
+
+List after removing duplicates:
+6 -> 5 -> 4 -> 2 -> 1
+Length: 5
+
+Words: red -> blue
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+### ArrayLinkedList Class
+
+| Method               | Time Complexity | Space Complexity |
+|----------------------|-----------------|------------------|
+| `__init__`           | O(1)            | O(1)             |
+| `_allocate`          | O(1) amortized  | O(1)             |
+| `_release`           | O(1)            | O(1)             |
+| `insert_beginning`   | O(1) amortized  | O(1)             |
+| `insert_end`         | O(1) amortized  | O(1)             |
+| `extend`             | O(k)            | O(k)             |
+| `remove_node`        | O(n)            | O(1)             |
+| `stringify_list`     | O(n)            | O(n)             |
+| `search`             | O(n)            | O(1)             |
+| `reverse`            | O(n)            | O(1)             |
+| `find_middle`        | O(n)            | O(1)             |
+| `has_cycle`          | O(n)            | O(1)             |
+| `remove_duplicates`  | O(n)            | O(n)             |
+
+- The time complexities are the same as for the `Node`-based `LinkedList`: a "pointer" is now an integer index into
+the `next_indices` column instead of a reference to a `Node` object.
+
+- Inserts are **amortized O(1)** because growing a Python list or an `array` occasionally copies the whole column.
+When the free list is not empty, the insert reuses a slot and never grows the columns.
+
+### Memory per Element
+
+- A `Node` object with `__slots__` costs 48 bytes on 64-bit CPython 3.11 (about 90 without `__slots__`, where every
+instance has its own `__dict__`), before counting the value. See `benchmark.py` for the measured numbers.
+
+- `ArrayLinkedList` stores one 8-byte next index per element, plus either one 8-byte reference in a list
+(`typecode=None`) or the raw item size in an array (8 bytes for `typecode="q"`). Small ints stored with `"q"` are
+unboxed, so a list of ints costs about **16 bytes per element**.
+
+- Removed slots are kept on a **free list** and reused by later inserts, so the columns never shrink. The memory used
+is proportional to the largest number of elements the list has ever held.
+"""
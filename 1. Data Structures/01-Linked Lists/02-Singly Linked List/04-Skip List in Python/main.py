@@ -0,0 +1,224 @@
+# Implementation in Python:
+
+import random
+
+
+class SkipListNode:
+    def __init__(self, value, level):
+        # Initialize a node with a value and one next_node reference per level
+        self.value = value
+        self.next_nodes = [None] * level
+
+    def get_value(self):
+        # Return the value of the node
+        return self.value
+
+    def get_next_node(self, level=0):
+        # Return the next node on the given level (level 0 is the full linked list)
+        return self.next_nodes[level]
+
+    def set_next_node(self, next_node, level=0):
+        # Set the next node on the given level
+        self.next_nodes[level] = next_node
+
+    def get_level(self):
+        # Return the number of levels this node takes part in
+        return len(self.next_nodes)
+
+    def __str__(self):
+        # Return a string representation of the node
+        return f"Node({self.value})"
+
+
+class SkipList:
+    MAX_LEVEL = 32  # Enough levels for far more than 2^32 elements with p = 0.5
+
+    def __init__(self, probability=0.5, seed=None):
+        # The head node holds no value and takes part in every level
+        self.head_node = SkipListNode(None, self.MAX_LEVEL)
+        self.level = 1  # Number of levels currently in use
+        self.length = 0
+        self.probability = probability
+        self.random = random.Random(seed)
+
+    def __len__(self):
+        # Return the number of values in the skip list
+        return self.length
+
+    def get_head_node(self):
+        # Return the first node holding a value (level 0 is an ordinary sorted linked list)
+        return self.head_node.get_next_node(0)
+
+    def _random_level(self):
+        # Flip a coin until it comes up tails: each extra level is taken with the given probability
+        level = 1
+        while level < self.MAX_LEVEL and self.random.random() < self.probability:
+            level += 1
+        return level
+
+    def _find_predecessors(self, value):
+        # For every level, find the last node whose value is smaller than the given value
+        update = [self.head_node] * self.MAX_LEVEL
+        current_node = self.head_node
+
+        for level in range(self.level - 1, -1, -1):
+            next_node = current_node.get_next_node(level)
+            while next_node is not None and next_node.get_value() < value:
+                current_node = next_node
+                next_node = current_node.get_next_node(level)
+            update[level] = current_node
+
+        return update
+
+    def insert(self, value):
+        # Insert a value while keeping the list sorted (equal values are kept, newest first)
+        update = self._find_predecessors(value)
+        new_level = self._random_level()
+
+        if new_level > self.level:
+            # The new levels start from the head node
+            self.level = new_level
+
+        new_node = SkipListNode(value, new_level)
+        for level in range(new_level):
+            new_node.set_next_node(update[level].get_next_node(level), level)
+            update[level].set_next_node(new_node, level)
+
+        self.length += 1
+
+    def search(self, value):
+        # Return True if the value is in the skip list
+        candidate = self._find_predecessors(value)[0].get_next_node(0)
+        return candidate is not None and candidate.get_value() == value
+
+    def remove(self, value):
+        # Remove one node with the specified value, return True if a node was removed
+        update = self._find_predecessors(value)
+        node_to_remove = update[0].get_next_node(0)
+
+        if node_to_remove is None or node_to_remove.get_value() != value:
+            return False
+
+        # Unlink the node on every level it takes part in
+        for level in range(node_to_remove.get_level()):
+            update[level].set_next_node(node_to_remove.get_next_node(level), level)
+
+        # Drop levels that no longer hold any node
+        while self.level > 1 and self.head_node.get_next_node(self.level - 1) is None:
+            self.level -= 1
+
+        self.length -= 1
+        return True
+
+    def range(self, start=None, stop=None):
+        # Yield the values v with start <= v < stop in sorted order
+        if start is None:
+            current_node = self.head_node.get_next_node(0)
+        else:
+            current_node = self._find_predecessors(start)[0].get_next_node(0)
+
+        while current_node is not None and (stop is None or current_node.get_value() < stop):
+            yield current_node.get_value()
+            current_node = current_node.get_next_node(0)
+
+    def __iter__(self):
+        # Yield every value in sorted order
+        return self.range()
+
+    def stringify_list(self):
+        # Return a string representation of the skip list
+        string_list = " -> ".join(str(value) for value in self)
+        return string_list if string_list else "Empty List"
+
+
+# Example Usage
+if __name__ == "__main__":
+    skip_list = SkipList(seed=7)
+
+    for value in [30, 10, 50, 20, 40, 60, 20]:
+        skip_list.insert(value)
+
+    print("Skip List:")
+    print(skip_list.stringify_list())  # Output: 10 -> 20 -> 20 -> 30 -> 40 -> 50 -> 60
+    print("Length:", len(skip_list))  # Output: 7
+
+    # Test Searching
+    print("\nSearch for 40:", skip_list.search(40))  # Output: True
+    print("Search for 45:", skip_list.search(45))  # Output: False
+
+    # Test Range Iteration
+    print("\nValues in [20, 50):", list(skip_list.range(20, 50)))  # Output: [20, 20, 30, 40]
+    print("Values from 45:", list(skip_list.range(45)))  # Output: [50, 60]
+
+    # Test Removing
+    skip_list.remove(20)
+    skip_list.remove(60)
+    print("\nAfter removing 20 and 60:")
+    print(skip_list.stringify_list())  # Output: 10 -> 20 -> 30 -> 40 -> 50
+    print("Remove 99:", skip_list.remove(99))  # Output: False
+
+    # Level 0 is an ordinary sorted linked list, walked with the usual accessors
+    print("\nLevels:")
+    node = skip_list.get_head_node()
+    while node is not None:
+        print(f"{node} has {node.get_level()} level(s)")
+        node = node.get_next_node()
+
+
+# Output:
+
+"""
+Skip List:
+10 -> 20 -> 20 -> 30 -> 40 -> 50 -> 60
+Length: 7
+
+Search for 40: True
+Search for 45: False
+
+Values in [20, 50): [20, 20, 30, 40]
+Values from 45: [50, 60]
+
+After removing 20 and 60:
+10 -> 20 -> 30 -> 40 -> 50
+Remove 99: False
+
+Levels:
+Node(10) has 2 level(s)
+Node(20) has 6 level(s)
+Node(30) has 3 level(s)
+Node(40) has 3 level(s)
+Node(50) has 3 level(s)
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+A skip list is a sorted linked list (level 0) with extra "express lanes" on top of it. Every node is promoted to the
+next level with probability `p` (0.5 by default), so level `i` holds about `n * p^i` nodes and there are about
+`log(n)` levels. A search starts on the highest level and drops one level each time the next node would overshoot,
+visiting about `1 / p` nodes per level.
+
+| Method                | Time Complexity (expected) | Worst Case | Space Complexity |
+|-----------------------|----------------------------|------------|------------------|
+| `__init__`            | O(1)                       | O(1)       | O(1)             |
+| `_random_level`       | O(1)                       | O(log n)   | O(1)             |
+| `_find_predecessors`  | O(log n)                   | O(n)       | O(1)             |
+| `insert`              | O(log n)                   | O(n)       | O(1)             |
+| `search`              | O(log n)                   | O(n)       | O(1)             |
+| `remove`              | O(log n)                   | O(n)       | O(1)             |
+| `range`               | O(log n + k)               | O(n)       | O(1)             |
+| `stringify_list`      | O(n)                       | O(n)       | O(n)             |
+
+- `k` is the number of values yielded by `range`.
+- The worst case only happens if the coin flips are extremely unlucky; it does not depend on the order of the input,
+unlike an unbalanced binary search tree.
+- **Space**: each node has on average `1 / (1 - p)` next references (2 for p = 0.5), so the whole list uses O(n) space.
+The `update` list in `_find_predecessors` has a fixed size of `MAX_LEVEL`, so it counts as O(1).
+
+Compare this with keeping a sorted `LinkedList`, where every ordered insert and every lookup must walk the list: O(n).
+"""
@@ -0,0 +1,123 @@
+# Benchmark: traversal time and memory of UnrolledLinkedList against the Node-based LinkedList
+
+import gc
+import importlib.util
+import os
+import time
+import tracemalloc
+
+from main import UnrolledLinkedList
+
+SIZE = 1_000_000
+CAPACITIES = [8, 64, 256]
+REPEATS = 3  # Each traversal is timed this many times and the best run is kept
+
+
+def load_linked_list():
+    # Import LinkedList from the Node-based implementation in the neighbouring folder
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "02-Implementing Singly Linked List in Python",
+        "main.py",
+    )
+    spec = importlib.util.spec_from_file_location("singly_linked_list", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.LinkedList
+
+
+def build_and_measure(build, values):
+    # Build the structure and return it with the bytes it allocated per element
+    gc.collect()
+    tracemalloc.start()
+    container = build(values)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return container, current / len(values)
+
+
+def best_time(operation):
+    # Return the best time in milliseconds over a few runs
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+if __name__ == "__main__":
+    LinkedList = load_linked_list()
+    values = list(range(SIZE))
+    missing_value = -1  # search has to visit every element
+
+    def node_list(values):
+        ll = LinkedList()
+        ll.extend(values)
+        return ll
+
+    builders = {"LinkedList (Node)": node_list}
+    for capacity in CAPACITIES:
+
+        def unrolled_list(values, capacity=capacity):
+            ull = UnrolledLinkedList(capacity=capacity)
+            ull.extend(values)
+            return ull
+
+        builders[f"Unrolled (B={capacity})"] = unrolled_list
+
+    print(f"{SIZE:,} elements")
+    print(
+        f"{'Structure':<18} | {'bytes/element':>13} | {'search (ms)':>11} | "
+        f"{'stringify (ms)':>14} | {'find_middle (ms)':>16}"
+    )
+    print("-" * 85)
+
+    for name, build in builders.items():
+        container, memory = build_and_measure(build, values)
+
+        search_time = best_time(lambda: container.search(missing_value))
+        stringify_time = best_time(container.stringify_list)
+        middle_time = best_time(container.find_middle)
+
+        print(f"{name:<18} | {memory:>13.1f} | {search_time:>11.1f} | {stringify_time:>14.1f} | {middle_time:>16.2f}")
+        del container
+
+
+# Output:
+
+"""
+1,000,000 elements
+Structure          | bytes/element | search (ms) | stringify (ms) | find_middle (ms)
+-------------------------------------------------------------------------------------
+LinkedList (Node)  |          48.0 |        88.9 |          336.6 |            98.32
+Unrolled (B=8)     |          26.0 |        27.4 |          194.3 |            14.34
+Unrolled (B=64)    |          10.3 |        12.6 |          228.3 |             3.30
+Unrolled (B=256)   |           8.9 |        11.5 |          159.2 |             0.24
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- `search` looks for a value that is not in the list, so both structures visit every element. The unrolled list is
+**3 to 8 times faster** because it follows one pointer per block and scans each block with `value in values`, which
+runs in C over contiguous references.
+
+- `find_middle` skips whole blocks by their length, so it gets faster as the blocks get bigger: with `B = 256` it only
+visits about 2,000 nodes instead of 500,000.
+
+- Both `stringify_list` methods join the values in a single pass, so their time is mostly spent converting one
+million ints to strings; the unrolled list only saves the pointer chasing, which is a small part of it.
+
+- Memory: a block of `B` references costs 8 bytes per value plus the node and list overhead shared by the whole block.
+With `B = 64` the list needs about **4.5 times less** memory than one 48-byte `Node` per value. Very small blocks (`B = 8`) lose
+part of the saving to per-block overhead, while very large blocks make `insert_beginning` and `remove_node` shift more
+values inside a block. `B = 64` is a good default.
+
+- Choose by workload: `LinkedList` when the program holds on to individual nodes or splices them, `UnrolledLinkedList`
+when it mostly appends, scans and searches.
+"""
@@ -0,0 +1,367 @@
+# Implementation in Python:
+
+
+class UnrolledNode:
+    def __init__(self, values=None, next_node=None):
+        # Initialize a node with a block of values and an optional next_node reference
+        self.values = values if values is not None else []
+        self.next_node = next_node
+
+    def get_values(self):
+        # Return the block of values stored in the node
+        return self.values
+
+    def get_next_node(self):
+        # Return the next node in the linked list
+        return self.next_node
+
+    def set_next_node(self, next_node):
+        # Set the next node in the linked list
+        self.next_node = next_node
+
+    def __str__(self):
+        # Return a string representation of the node
+        return f"Node({self.values})"
+
+
+class UnrolledLinkedList:
+    def __init__(self, capacity=64):
+        # Each node holds up to `capacity` values; a node is kept at least half full when possible
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+
+        self.capacity = capacity
+        self.head_node = None
+        self.tail_node = None
+        self.length = 0
+
+    def __len__(self):
+        # Return the number of values in the linked list
+        return self.length
+
+    def get_head_node(self):
+        # Return the head node of the linked list
+        return self.head_node
+
+    def insert_beginning(self, new_value):
+        # Insert a value at the beginning of the linked list
+        if self.head_node is None or len(self.head_node.get_values()) >= self.capacity:
+            # Start a new block in front when the head block is full
+            self.head_node = UnrolledNode([new_value], self.head_node)
+            if self.tail_node is None:
+                self.tail_node = self.head_node
+        else:
+            self.head_node.get_values().insert(0, new_value)
+
+        self.length += 1
+
+    def insert_end(self, value):
+        # Insert a value at the end of the linked list
+        if self.tail_node is None or len(self.tail_node.get_values()) >= self.capacity:
+            # Start a new block at the end when the tail block is full, so appended blocks stay full
+            new_node = UnrolledNode([value])
+            if self.tail_node is None:
+                self.head_node = new_node
+            else:
+                self.tail_node.set_next_node(new_node)
+            self.tail_node = new_node
+        else:
+            self.tail_node.get_values().append(value)
+
+        self.length += 1
+
+    def extend(self, values):
+        # Insert every value from an iterable at the end of the linked list
+        for value in values:
+            self.insert_end(value)
+
+    def insert(self, position, new_value):
+        # Insert a value so that it ends up at the given position (0 is the head)
+        if position <= 0 or self.head_node is None:
+            self.insert_beginning(new_value)
+            return
+        if position >= self.length:
+            self.insert_end(new_value)
+            return
+
+        # Skip whole blocks until the block holding the position
+        current_node = self.head_node
+        while position > len(current_node.get_values()):
+            position -= len(current_node.get_values())
+            current_node = current_node.get_next_node()
+
+        current_node.get_values().insert(position, new_value)
+        self.length += 1
+
+        if len(current_node.get_values()) > self.capacity:
+            self._split(current_node)
+
+    def _split(self, node):
+        # Move the second half of an overfull block into a new node right after it
+        values = node.get_values()
+        half = len(values) // 2
+
+        new_node = UnrolledNode(values[half:], node.get_next_node())
+        del values[half:]
+        node.set_next_node(new_node)
+
+        if node is self.tail_node:
+            self.tail_node = new_node
+
+    def _rebalance(self, prev_node, node):
+        # Keep a block from getting too empty after a removal by merging with or borrowing from its neighbour
+        values = node.get_values()
+
+        if not values:
+            # Unlink the empty node
+            next_node = node.get_next_node()
+            if prev_node is None:
+                self.head_node = next_node
+            else:
+                prev_node.set_next_node(next_node)
+            if node is self.tail_node:
+                self.tail_node = prev_node
+            return
+
+        next_node = node.get_next_node()
+        if next_node is None or len(values) >= self.capacity // 2:
+            return
+
+        next_values = next_node.get_values()
+        if len(values) + len(next_values) <= self.capacity:
+            # Both blocks fit in one: merge the next node into this one
+            values.extend(next_values)
+            node.set_next_node(next_node.get_next_node())
+            if next_node is self.tail_node:
+                self.tail_node = node
+        else:
+            # Borrow values from the next node until this block is half full again
+            count = self.capacity // 2 - len(values)
+            values.extend(next_values[:count])
+            del next_values[:count]
+
+    def remove_node(self, value_to_remove):
+        # Remove the first occurrence of the specified value
+        prev_node = None
+        current_node = self.head_node
+
+        while current_node is not None:
+            values = current_node.get_values()
+            if value_to_remove in values:
+                values.remove(value_to_remove)
+                self.length -= 1
+                self._rebalance(prev_node, current_node)
+                return
+
+            prev_node = current_node
+            current_node = current_node.get_next_node()
+
+    def __iter__(self):
+        # Yield the values from head to tail, one block at a time
+        current_node = self.head_node
+        while current_node is not None:
+            yield from current_node.get_values()
+            current_node = current_node.get_next_node()
+
+    def stringify_list(self):
+        # Return a string representation of the linked list
+        string_list = " -> ".join(str(value) for value in self if value is not None)
+        return string_list if string_list else "Empty List"
+
+    def search(self, value):
+        # Search for a value, checking a whole block at a time
+        current_node = self.head_node
+        while current_node is not None:
+            if value in current_node.get_values():
+                return True
+            current_node = current_node.get_next_node()
+
+        return False
+
+    def reverse(self):
+        # Reverse the order of the blocks and the values inside each block
+        prev = None
+
+        self.tail_node = self.head_node
+
+        current = self.head_node
+        while current is not None:
+            current.get_values().reverse()
+            next_node = current.get_next_node()
+            current.set_next_node(prev)
+            prev = current
+            current = next_node
+
+        self.head_node = prev
+
+    def find_middle(self):
+        # Return the middle value (the second one for an even length), skipping whole blocks
+        if self.length == 0:
+            return None
+
+        position = self.length // 2
+        current_node = self.head_node
+        while position >= len(current_node.get_values()):
+            position -= len(current_node.get_values())
+            current_node = current_node.get_next_node()
+
+        return current_node.get_values()[position]
+
+    def has_cycle(self):
+        # Check if the chain of blocks has a cycle using the two-pointer technique
+        slow = self.head_node
+        fast = self.head_node
+
+        while fast and fast.get_next_node():
+            slow = slow.get_next_node()
+            fast = fast.get_next_node().get_next_node()
+
+            if slow == fast:
+                return True
+
+        return False
+
+    def remove_duplicates(self):
+        # Remove duplicate values, then repack the remaining values into full blocks
+        seen_values = set()
+        unique_values = []
+
+        for value in self:
+            if value not in seen_values:
+                seen_values.add(value)
+                unique_values.append(value)
+
+        self.head_node = None
+        self.tail_node = None
+        self.length = 0
+        self.extend(unique_values)
+
+
+# Example Usage
+if __name__ == "__main__":
+
+    def blocks(unrolled_list):
+        # Collect the block of every node to show how the values are grouped
+        result = []
+        node = unrolled_list.get_head_node()
+        while node is not None:
+            result.append(node.get_values())
+            node = node.get_next_node()
+        return result
+
+    ull = UnrolledLinkedList(capacity=4)
+
+    ull.extend([1, 2, 3, 4, 5, 6, 7, 8, 9])
+    print("Original List:")
+    print(ull.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+    print("Blocks:", blocks(ull))  # Output: [[1, 2, 3, 4], [5, 6, 7, 8], [9]]
+
+    # Test Searching
+    print("\nSearch for 7:", ull.search(7))  # Output: True
+    print("Search for 10:", ull.search(10))  # Output: False
+
+    # Test Finding Middle Value
+    print("\nMiddle Value:", ull.find_middle())  # Output: 5
+
+    # Test Positional Insert (splits the full block)
+    ull.insert(2, 99)
+    print("\nAfter inserting 99 at position 2:")
+    print(ull.stringify_list())  # Output: 1 -> 2 -> 99 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+    print("Blocks:", blocks(ull))  # Output: [[1, 2], [99, 3, 4], [5, 6, 7, 8], [9]]
+
+    # Test Removing (merges the blocks that became too empty)
+    ull.remove_node(99)
+    ull.remove_node(1)
+    ull.remove_node(2)
+    print("\nAfter removing 99, 1 and 2:")
+    print(ull.stringify_list())  # Output: 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+    print("Blocks:", blocks(ull))  # Output: [[3, 4], [5, 6, 7, 8], [9]]
+
+    # Test Reversing
+    ull.reverse()
+    print("\nReversed List:")
+    print(ull.stringify_list())  # Output: 9 -> 8 -> 7 -> 6 -> 5 -> 4 -> 3
+
+    # Test Removing Duplicates
+    ull.insert_beginning(3)
+    ull.insert_end(9)
+    print("\nList before removing duplicates:")
+    print(ull.stringify_list())  # Output: 3 -> 9 -> 8 -> 7 -> 6 -> 5 -> 4 -> 3 -> 9
+
+    ull.remove_duplicates()
+    print("\nList after removing duplicates:")
+    print(ull.stringify_list())  # Output: 3 -> 9 -> 8 -> 7 -> 6 -> 5 -> 4
+    print("Length:", len(ull))  # Output: 7
+
+
+# Output:
+
+"""
+Original List:
+1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+Blocks: [[1, 2, 3, 4], [5, 6, 7, 8], [9]]
+
+Search for 7: True
+Search for 10: False
+
+Middle Value: 5
+
+After inserting 99 at position 2:
+1 -> 2 -> 99 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+Blocks: [[1, 2], [99, 3, 4], [5, 6, 7, 8], [9]]
+
+After removing 99, 1 and 2:
+3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9
+Blocks: [[3, 4], [5, 6, 7, 8], [9]]
+
+Reversed List:
+9 -> 8 -> 7 -> 6 -> 5 -> 4 -> 3
+
+List before removing duplicates:
+3 -> 9 -> 8 -> 7 -> 6 -> 5 -> 4 -> 3 -> 9
+
+List after removing duplicates:
+3 -> 9 -> 8 -> 7 -> 6 -> 5 -> 4
+Length: 7
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+`n` is the number of values and `B` is the block capacity. There are about `n / B` nodes (at least `n / B` and, since
+blocks are kept at least half full, at most about `2n / B`).
+
+| Method               | Time Complexity | Space Complexity |
+|----------------------|-----------------|------------------|
+| `__init__`           | O(1)            | O(1)             |
+| `insert_beginning`   | O(B)            | O(1)             |
+| `insert_end`         | O(1) amortized  | O(1)             |
+| `extend`             | O(k)            | O(k)             |
+| `insert`             | O(n / B + B)    | O(B)             |
+| `_split`             | O(B)            | O(B)             |
+| `_rebalance`         | O(B)            | O(1)             |
+| `remove_node`        | O(n)            | O(1)             |
+| `stringify_list`     | O(n)            | O(n)             |
+| `search`             | O(n)            | O(1)             |
+| `reverse`            | O(n)            | O(1)             |
+| `find_middle`        | O(n / B)        | O(1)             |
+| `has_cycle`          | O(n / B)        | O(1)             |
+| `remove_duplicates`  | O(n)            | O(n)             |
+
+- The big-O classes of `search`, `remove_node` and `stringify_list` are the same as for `LinkedList`, but the constant is
+much smaller: the list follows one pointer per **block** instead of one per value, and the membership test inside a
+block (`value in values`) runs in C over a contiguous array of references.
+
+- `find_middle` and positional `insert` only count blocks until the right one, so they skip `B` values per step.
+
+- `insert_beginning` shifts the values of the head block (`list.insert(0, ...)`), which costs O(B); with a small,
+fixed `B` this is a constant.
+
+- **Space**: each value costs one 8-byte reference in a block, plus the node and list overhead shared by the `B`
+values of the block, instead of a whole `Node` object per value.
+"""
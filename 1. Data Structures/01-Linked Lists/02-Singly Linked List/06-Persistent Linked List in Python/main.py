@@ -0,0 +1,229 @@
+# Implementation in Python:
+
+import copy
+
+
+class PersistentNode:
+    def __init__(self, value, next_node=None):
+        # Initialize a node with a value and an optional next_node reference.
+        # A node never changes after it is created, so any number of list versions can share it.
+        self.value = value
+        self.next_node = next_node
+
+    def get_value(self):
+        # Return the value of the node
+        return self.value
+
+    def get_next_node(self):
+        # Return the next node in the linked list
+        return self.next_node
+
+    def __str__(self):
+        # Return a string representation of the node
+        return f"Node({self.value})"
+
+
+class PersistentLinkedList:
+    def __init__(self, values=()):
+        # Build the first version of the list from an iterable of values, linking from the last value backwards
+        head_node = None
+        length = 0
+        for value in reversed(list(values)):
+            head_node = PersistentNode(value, head_node)
+            length += 1
+
+        self.head_node = head_node
+        self.length = length
+
+    @classmethod
+    def _from_head(cls, head_node, length):
+        # Wrap an existing chain of nodes in a new version without copying it
+        version = cls.__new__(cls)
+        version.head_node = head_node
+        version.length = length
+        return version
+
+    def __len__(self):
+        # Return the number of nodes in this version
+        return self.length
+
+    def get_head_node(self):
+        # Return the head node of this version
+        return self.head_node
+
+    def insert_beginning(self, new_value):
+        # Return a new version with the value in front; the whole old list becomes its shared tail
+        return self._from_head(PersistentNode(new_value, self.head_node), self.length + 1)
+
+    def remove_beginning(self):
+        # Return a new version without the head node; it is simply the old list from the second node on
+        if self.head_node is None:
+            return self
+        return self._from_head(self.head_node.get_next_node(), self.length - 1)
+
+    def _rebuild_prefix(self, prefix_values, shared_tail, length):
+        # Copy the values in front of a change onto the unchanged tail, which is shared with this version
+        head_node = shared_tail
+        for value in reversed(prefix_values):
+            head_node = PersistentNode(value, head_node)
+        return self._from_head(head_node, length)
+
+    def remove_node(self, value_to_remove):
+        # Return a new version without the first node with the specified value.
+        # Only the nodes before it are copied; the nodes after it are shared.
+        prefix_values = []
+        current_node = self.head_node
+
+        while current_node is not None and current_node.get_value() != value_to_remove:
+            prefix_values.append(current_node.get_value())
+            current_node = current_node.get_next_node()
+
+        if current_node is None:
+            # The value is not in the list, so this version can be reused as it is
+            return self
+
+        return self._rebuild_prefix(prefix_values, current_node.get_next_node(), self.length - 1)
+
+    def insert_end(self, value):
+        # Return a new version with the value at the end; every node has to be copied, because the old tail
+        # node must keep pointing to None for the old version
+        return self._rebuild_prefix(list(self), PersistentNode(value), self.length + 1)
+
+    def __iter__(self):
+        # Yield the values from head to tail
+        current_node = self.head_node
+        while current_node is not None:
+            yield current_node.get_value()
+            current_node = current_node.get_next_node()
+
+    def stringify_list(self):
+        # Return a string representation of this version
+        string_list = " -> ".join(str(value) for value in self if value is not None)
+        return string_list if string_list else "Empty List"
+
+    def search(self, value):
+        # Search for a node with the specified value
+        current_node = self.head_node
+        while current_node is not None:
+            if current_node.get_value() == value:
+                return True
+            current_node = current_node.get_next_node()
+
+        return False
+
+    def reverse(self):
+        # Return a new, reversed version; the old version keeps its order
+        return self.__class__(reversed(list(self)))
+
+    def __reduce__(self):
+        # Pickle a flat list of values instead of the chain of nodes, which pickle would otherwise follow recursively
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo):
+        # Deep-copy the values one by one into a new chain of nodes, without recursing through the nodes
+        copied = self._from_head(None, 0)
+        memo[id(self)] = copied  # Register the copy first, in case a value refers back to the list
+
+        filled = self.__class__(copy.deepcopy(value, memo) for value in self)
+        copied.head_node, copied.length = filled.head_node, filled.length
+        return copied
+
+
+# Example Usage
+if __name__ == "__main__":
+    version_1 = PersistentLinkedList([3, 4, 5])
+    print("Version 1:", version_1.stringify_list())  # Output: 3 -> 4 -> 5
+
+    # Every change returns a new version and leaves the old one alone
+    version_2 = version_1.insert_beginning(2)
+    version_3 = version_2.insert_beginning(1)
+    print("Version 2:", version_2.stringify_list())  # Output: 2 -> 3 -> 4 -> 5
+    print("Version 3:", version_3.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+    print("Version 1 is unchanged:", version_1.stringify_list())  # Output: 3 -> 4 -> 5
+
+    # The versions share their tails instead of copying them
+    second_node_of_3 = version_3.get_head_node().get_next_node()
+    second_node_of_2 = version_2.get_head_node().get_next_node()
+    print("\nVersion 3 shares version 2:", second_node_of_3 is version_2.get_head_node())  # Output: True
+    print("Version 2 shares version 1:", second_node_of_2 is version_1.get_head_node())  # Output: True
+
+    # Removing copies only the nodes in front of the removed one
+    version_4 = version_3.remove_node(3)
+    print("\nVersion 4 (3 removed):", version_4.stringify_list())  # Output: 1 -> 2 -> 4 -> 5
+    print("Version 3 is unchanged:", version_3.stringify_list())  # Output: 1 -> 2 -> 3 -> 4 -> 5
+
+    shared_node = version_4.get_head_node().get_next_node().get_next_node()
+    print("Node 4 is shared:", shared_node is version_1.get_head_node().get_next_node())  # Output: True
+
+    # Removing the head node costs nothing: the result is the old list from the second node on
+    version_5 = version_4.remove_beginning()
+    print("\nVersion 5 (head removed):", version_5.stringify_list())  # Output: 2 -> 4 -> 5
+    print("Length of version 5:", len(version_5))  # Output: 3
+
+    # Other operations
+    print("\nSearch for 4 in version 5:", version_5.search(4))  # Output: True
+    print("Version 5 reversed:", version_5.reverse().stringify_list())  # Output: 5 -> 4 -> 2
+    print("Version 5 with 6 at the end:", version_5.insert_end(6).stringify_list())  # Output: 2 -> 4 -> 5 -> 6
+    print("Version 5 is unchanged:", version_5.stringify_list())  # Output: 2 -> 4 -> 5
+
+
+# Output:
+
+"""
+Version 1: 3 -> 4 -> 5
+Version 2: 2 -> 3 -> 4 -> 5
+Version 3: 1 -> 2 -> 3 -> 4 -> 5
+Version 1 is unchanged: 3 -> 4 -> 5
+
+Version 3 shares version 2: True
+Version 2 shares version 1: True
+
+Version 4 (3 removed): 1 -> 2 -> 4 -> 5
+Version 3 is unchanged: 1 -> 2 -> 3 -> 4 -> 5
+Node 4 is shared: True
+
+Version 5 (head removed): 2 -> 4 -> 5
+Length of version 5: 3
+
+Search for 4 in version 5: True
+Version 5 reversed: 5 -> 4 -> 2
+Version 5 with 6 at the end: 2 -> 4 -> 5 -> 6
+Version 5 is unchanged: 2 -> 4 -> 5
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity | Space Complexity (new nodes) |
+|----------------------|-----------------|------------------------------|
+| `__init__`           | O(n)            | O(n)                         |
+| `_from_head`         | O(1)            | O(1)                         |
+| `insert_beginning`   | O(1)            | O(1)                         |
+| `remove_beginning`   | O(1)            | O(1)                         |
+| `remove_node`        | O(k)            | O(k)                         |
+| `insert_end`         | O(n)            | O(n)                         |
+| `search`             | O(n)            | O(1)                         |
+| `stringify_list`     | O(n)            | O(n)                         |
+| `reverse`            | O(n)            | O(n)                         |
+
+- `k` is the position of the removed node: only the `k` nodes in front of it are copied, and the rest of the list is
+shared with the old version. Removing a node near the head is cheap, removing the last node copies the whole list.
+
+- **Versions are snapshots**: keeping an old version is just keeping a reference to it, which is O(1). Nodes are never
+changed after they are created, so no later operation can modify a version that someone else is reading.
+
+- **Structural sharing**: `insert_beginning` and `remove_beginning` create at most one node, so `m` versions of a list
+with `n` nodes cost O(n + m) nodes in total, instead of O(n * m) for `m` full copies of a `LinkedList`.
+See `benchmark.py` for the measured memory of 1,000 versions of a 1,000,000-element list.
+
+- The end of the list can only be changed by copying: `insert_end` must copy every node, because the old last node
+has to keep pointing to `None` for the old versions. A persistent list is the right choice when changes happen near
+the front, like a stack or a list that writers keep prepending to.
+
+- A node that no version references any more is freed by Python's garbage collector as usual.
+"""
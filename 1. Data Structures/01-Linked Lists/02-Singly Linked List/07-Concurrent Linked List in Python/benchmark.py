@@ -0,0 +1,142 @@
+# Benchmark: throughput of a mixed workload as the number of threads grows,
+# for ConcurrentLinkedList (hand-over-hand locking) and for LinkedList behind one global lock
+
+import importlib.util
+import os
+import random
+import threading
+import time
+
+from main import ConcurrentLinkedList
+
+SIZE = 1_000
+THREAD_COUNTS = [1, 2, 4, 8]
+DURATION = 2.0  # Seconds each configuration runs
+WRITE_SHARE = 0.2  # Share of operations that remove a value and insert it again; the rest are searches
+
+
+def load_linked_list():
+    # Import LinkedList from the Node-based implementation in the neighbouring folder
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "02-Implementing Singly Linked List in Python",
+        "main.py",
+    )
+    spec = importlib.util.spec_from_file_location("singly_linked_list", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.LinkedList
+
+
+class GlobalLockLinkedList:
+    def __init__(self, linked_list):
+        # Serialize every call to a plain LinkedList with a single lock
+        self.linked_list = linked_list
+        self.lock = threading.Lock()
+
+    def search(self, value):
+        with self.lock:
+            return self.linked_list.search(value)
+
+    def remove_node(self, value):
+        with self.lock:
+            self.linked_list.remove_node(value)
+
+    def insert_beginning(self, value):
+        with self.lock:
+            self.linked_list.insert_beginning(value)
+
+    def __iter__(self):
+        with self.lock:
+            return iter(list(self.linked_list))
+
+
+def run(shared_list, thread_count):
+    # Let every thread work on its own values for DURATION seconds and return the operations per second
+    stop = threading.Event()
+    counts = [0] * thread_count
+
+    def worker(number):
+        rng = random.Random(number)
+        own_values = list(range(number, SIZE, thread_count))  # No two threads touch the same value
+        operations = 0
+        while not stop.is_set():
+            value = rng.choice(own_values)
+            if rng.random() < WRITE_SHARE:
+                shared_list.remove_node(value)
+                shared_list.insert_beginning(value)
+                operations += 2
+            else:
+                shared_list.search(value)
+                operations += 1
+        counts[number] = operations
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    # Every value must still be there exactly once
+    assert sorted(shared_list) == list(range(SIZE))
+    return sum(counts) / DURATION
+
+
+if __name__ == "__main__":
+    LinkedList = load_linked_list()
+
+    print(f"{SIZE:,} values, {WRITE_SHARE:.0%} writes, {DURATION:.0f} s per run")
+    print(f"{'Threads':>7} | {'Global lock (ops/s)':>19} | {'Hand-over-hand (ops/s)':>22} | {'Ratio':>6}")
+    print("-" * 64)
+
+    for thread_count in THREAD_COUNTS:
+        global_list = GlobalLockLinkedList(LinkedList())
+        global_list.linked_list.extend(range(SIZE))
+        global_throughput = run(global_list, thread_count)
+
+        concurrent_throughput = run(ConcurrentLinkedList(range(SIZE)), thread_count)
+
+        print(
+            f"{thread_count:>7} | {global_throughput:>19,.0f} | {concurrent_throughput:>22,.0f} | "
+            f"{concurrent_throughput / global_throughput:>5.2f}x"
+        )
+
+
+# Output:
+
+"""
+1,000 values, 20% writes, 2 s per run
+Threads | Global lock (ops/s) | Hand-over-hand (ops/s) |  Ratio
+----------------------------------------------------------------
+      1 |              16,308 |                  5,502 |  0.34x
+      2 |              16,186 |                  5,241 |  0.32x
+      4 |              16,478 |                  5,986 |  0.36x
+      8 |              20,666 |                  7,476 |  0.36x
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11 with the global interpreter lock (GIL), on a machine with one CPU core. Only one thread
+runs Python code at a time there, whichever list is used, so neither column can grow with the number of threads; the
+differences between the rows are scheduling noise.
+
+- Hand-over-hand locking costs one lock acquire and one release per node visited, which makes a single walk about
+2.5 times slower than the unlocked walk of `LinkedList`. With the GIL, that overhead is not paid back, and the global
+lock comes out about 3 times faster.
+
+- What the fine-grained locks do give, even with the GIL: a thread working near the head is never blocked by a long
+walk of another thread further down the list, and iterating never blocks writers (see the example in `main.py`).
+The final check of every run also confirms that no value was lost or duplicated by the concurrent writes.
+
+- On a free-threaded build (Python 3.13t and later, without the GIL) threads run on several cores at once. There the
+global lock still lets only one thread in at a time, while with hand-over-hand locking several threads walk the
+list together, one behind the other, and work in different regions at the same time. Every walk still starts at the
+head, so the threads follow each other in a queue, and the gain is largest when operations reach deep into the list.
+"""
@@ -0,0 +1,257 @@
+# Implementation in Python:
+
+import threading
+
+
+class ConcurrentNode:
+    def __init__(self, value, next_node=None):
+        # Initialize a node with a value, an optional next_node reference and a lock guarding next_node
+        self.value = value
+        self.next_node = next_node
+        self.lock = threading.Lock()
+
+    def get_value(self):
+        # Return the value of the node
+        return self.value
+
+    def get_next_node(self):
+        # Return the next node in the linked list
+        return self.next_node
+
+    def set_next_node(self, next_node):
+        # Set the next node in the linked list (the caller must hold this node's lock)
+        self.next_node = next_node
+
+    def __str__(self):
+        # Return a string representation of the node
+        return f"Node({self.value})"
+
+
+class ConcurrentLinkedList:
+    def __init__(self, values=()):
+        # The sentinel node holds no value and is never removed, so its lock guards the link to the first node
+        self.head_sentinel = ConcurrentNode(None)
+        self.length = 0
+        self.length_lock = threading.Lock()
+
+        # Link the initial values directly: no other thread can see the list yet
+        last_node = self.head_sentinel
+        for value in values:
+            new_node = ConcurrentNode(value)
+            last_node.set_next_node(new_node)
+            last_node = new_node
+            self.length += 1
+
+    def __len__(self):
+        # Return the number of nodes in the linked list
+        return self.length
+
+    def _change_length(self, delta):
+        # Update the node count; += is not atomic, so it needs its own small lock
+        with self.length_lock:
+            self.length += delta
+
+    def get_head_node(self):
+        # Return the first node holding a value
+        return self.head_sentinel.get_next_node()
+
+    def _lock_pair(self, is_target):
+        # Walk the list hand over hand: lock the next node before releasing the previous one, so no other thread
+        # can unlink or insert between the two. Return (prev_node, node) with both locked, where node is the
+        # first node accepted by is_target, or (last node, None) with only the last node locked.
+        # Locks are always taken from head to tail, so two walking threads can never deadlock.
+        prev_node = self.head_sentinel
+        prev_node.lock.acquire()
+        current_node = prev_node.get_next_node()
+
+        while current_node is not None:
+            current_node.lock.acquire()
+            try:
+                found = is_target(current_node)
+            except BaseException:
+                # is_target may raise, e.g. in a value's __eq__: release both locks, or every later writer would wait
+                # on them forever
+                current_node.lock.release()
+                prev_node.lock.release()
+                raise
+
+            if found:
+                return prev_node, current_node
+
+            prev_node.lock.release()
+            prev_node = current_node
+            current_node = current_node.get_next_node()
+
+        return prev_node, None
+
+    @staticmethod
+    def _release_pair(prev_node, node):
+        # Release the locks taken by _lock_pair
+        if node is not None:
+            node.lock.release()
+        prev_node.lock.release()
+
+    def insert_beginning(self, new_value):
+        # Insert a new node at the beginning of the linked list, locking only the sentinel node
+        with self.head_sentinel.lock:
+            self.head_sentinel.set_next_node(ConcurrentNode(new_value, self.head_sentinel.get_next_node()))
+        self._change_length(1)
+
+    def insert_end(self, value):
+        # Walk to the last node hand over hand and link a new node after it
+        last_node, _ = self._lock_pair(lambda node: False)
+        try:
+            last_node.set_next_node(ConcurrentNode(value))
+        finally:
+            last_node.lock.release()
+        self._change_length(1)
+
+    def insert_after(self, target_value, new_value):
+        # Insert a new node right after the first node with target_value; return False if there is no such node.
+        # Only the nodes around the target are locked, so inserts elsewhere in the list can run at the same time.
+        prev_node, target_node = self._lock_pair(lambda node: node.get_value() == target_value)
+        try:
+            if target_node is None:
+                return False
+            target_node.set_next_node(ConcurrentNode(new_value, target_node.get_next_node()))
+        finally:
+            self._release_pair(prev_node, target_node)
+
+        self._change_length(1)
+        return True
+
+    def remove_node(self, value_to_remove):
+        # Remove the first node with the specified value; return True if a node was removed.
+        # Holding the locks of the node and its predecessor stops other threads from changing either link.
+        prev_node, node_to_remove = self._lock_pair(lambda node: node.get_value() == value_to_remove)
+        try:
+            if node_to_remove is None:
+                return False
+            # The removed node keeps its next_node, so an iterator standing on it can still continue
+            prev_node.set_next_node(node_to_remove.get_next_node())
+        finally:
+            self._release_pair(prev_node, node_to_remove)
+
+        self._change_length(-1)
+        return True
+
+    def search(self, value):
+        # Search for a node with the specified value, walking hand over hand
+        prev_node, found_node = self._lock_pair(lambda node: node.get_value() == value)
+        self._release_pair(prev_node, found_node)
+        return found_node is not None
+
+    def __iter__(self):
+        # Yield the values from head to tail without holding any lock while the caller runs.
+        # Each link is read under its node's lock; values never change, so they are read without one.
+        # The iteration is weakly consistent: it never fails while writers are active, and it yields every value
+        # that stays in the list for the whole iteration; values added or removed meanwhile may or may not appear.
+        current_node = self.head_sentinel
+        while True:
+            with current_node.lock:
+                next_node = current_node.get_next_node()
+            if next_node is None:
+                return
+            yield next_node.get_value()
+            current_node = next_node
+
+    def stringify_list(self):
+        # Return a string representation of the linked list
+        string_list = " -> ".join(str(value) for value in self if value is not None)
+        return string_list if string_list else "Empty List"
+
+    def __reduce__(self):
+        # Locks cannot be pickled, so pickle a flat list of values and create fresh nodes and locks when loading
+        return self.__class__, (list(self),)
+
+
+# Example Usage
+if __name__ == "__main__":
+    cll = ConcurrentLinkedList([10, 20, 30])
+    cll.insert_beginning(5)
+    cll.insert_end(40)
+    cll.insert_after(20, 25)
+    print("List:", cll.stringify_list())  # Output: 5 -> 10 -> 20 -> 25 -> 30 -> 40
+
+    cll.remove_node(10)
+    print("After removing 10:", cll.stringify_list())  # Output: 5 -> 20 -> 25 -> 30 -> 40
+    print("Search for 25:", cll.search(25))  # Output: True
+    print("Insert after 99:", cll.insert_after(99, 100))  # Output: False
+
+    # Several threads insert and remove in their own part of the list at the same time
+    shared_list = ConcurrentLinkedList(range(0, 400, 100))  # 0 -> 100 -> 200 -> 300: one anchor per thread
+
+    def worker(anchor):
+        # Insert 50 values after this thread's anchor, then remove the odd ones again
+        for offset in range(1, 51):
+            shared_list.insert_after(anchor, anchor + offset)
+        for offset in range(1, 51, 2):
+            shared_list.remove_node(anchor + offset)
+
+    threads = [threading.Thread(target=worker, args=(anchor,)) for anchor in range(0, 400, 100)]
+    for thread in threads:
+        thread.start()
+
+    # Iterating is safe while the writers are running
+    seen_count = sum(1 for _ in shared_list)
+
+    for thread in threads:
+        thread.join()
+
+    values = list(shared_list)
+    print("\nLength after 4 threads:", len(shared_list))  # Output: 104
+    print("Length matches the values:", len(values) == len(shared_list))  # Output: True
+    print("Odd offsets left:", [value for value in values if value % 100 % 2 == 1])  # Output: []
+    print("First values:", values[:4])  # Output: [0, 50, 48, 46]
+    print("Iteration during the writes saw at least the anchors:", seen_count >= 4)  # Output: True
+
+
+# Output:
+
+"""
+List: 5 -> 10 -> 20 -> 25 -> 30 -> 40
+After removing 10: 5 -> 20 -> 25 -> 30 -> 40
+Search for 25: True
+Insert after 99: False
+
+Length after 4 threads: 104
+Length matches the values: True
+Odd offsets left: []
+First values: [0, 50, 48, 46]
+Iteration during the writes saw at least the anchors: True
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity | Space Complexity | Locks held at once |
+|----------------------|-----------------|------------------|--------------------|
+| `__init__`           | O(n)            | O(n)             | 0                  |
+| `_lock_pair`         | O(n)            | O(1)             | 2                  |
+| `insert_beginning`   | O(1)            | O(1)             | 1                  |
+| `insert_end`         | O(n)            | O(1)             | 2                  |
+| `insert_after`       | O(n)            | O(1)             | 2                  |
+| `remove_node`        | O(n)            | O(1)             | 2                  |
+| `search`             | O(n)            | O(1)             | 2                  |
+| `__iter__`           | O(n)            | O(1)             | 1                  |
+| `stringify_list`     | O(n)            | O(n)             | 1                  |
+
+- The complexities are the same as for `LinkedList`, plus one lock acquire and release per node visited. `insert_end`
+is O(n) because there is no shared `tail_node`: keeping one consistent would need a lock that every append and every
+removal of the last node must take.
+
+- **Hand-over-hand locking** (lock coupling): a walking thread holds at most two neighbouring locks. Other threads can
+work anywhere else in the list, and they only wait when they reach a node that is locked. Because every thread takes
+its locks from head to tail, no two threads can wait for each other in a circle, so there are no deadlocks.
+
+- **Space**: every node carries its own `threading.Lock`, which costs more memory than the node itself.
+
+- On CPython with the global interpreter lock (GIL), only one thread runs Python code at a time, so fine-grained locks
+let threads interleave instead of waiting for a whole operation, but they do not make the work run in parallel on
+several cores. See `benchmark.py` for the measured throughput.
+"""
@@ -0,0 +1,129 @@
+# Benchmark: reopening a 1,000,000-record list stored in a memory-mapped file (MappedLinkedList)
+# against loading a pickled LinkedList, plus the cost of one full traversal of each
+
+import gc
+import importlib.util
+import os
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from main import MappedLinkedList
+
+SIZE = 1_000_000
+VALUE_SIZE = 16
+
+
+def load_linked_list():
+    # Import LinkedList from the Node-based implementation in the neighbouring folder
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "02-Implementing Singly Linked List in Python",
+        "main.py",
+    )
+    spec = importlib.util.spec_from_file_location("singly_linked_list", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # pickle finds classes by their module name
+    spec.loader.exec_module(module)
+    return module.LinkedList
+
+
+def measure(operation):
+    # Run the operation and return its result, the Python memory it allocated in bytes and its time in seconds
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = operation()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+if __name__ == "__main__":
+    LinkedList = load_linked_list()
+    values = [f"value-{number}".encode() for number in range(SIZE)]
+    directory = tempfile.TemporaryDirectory()
+    mapped_path = os.path.join(directory.name, "records.mmll")
+    pickle_path = os.path.join(directory.name, "records.pickle")
+
+    with MappedLinkedList(mapped_path, value_size=VALUE_SIZE) as mll:
+        mll.extend(values)
+
+    ll = LinkedList()
+    ll.extend(values)
+    with open(pickle_path, "wb") as file:
+        pickle.dump(ll, file)
+    del ll, values
+
+    def load_pickle():
+        with open(pickle_path, "rb") as file:
+            return pickle.load(file)
+
+    mll, mapped_open_bytes, mapped_open_time = measure(lambda: MappedLinkedList(mapped_path))
+    ll, pickle_bytes, pickle_time = measure(load_pickle)
+    assert len(mll) == len(ll) == SIZE
+
+    start = time.perf_counter()
+    assert sum(1 for _ in mll) == SIZE
+    mapped_walk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert sum(1 for _ in ll) == SIZE
+    linked_walk_time = time.perf_counter() - start
+
+    print(f"{SIZE:,} records of up to {VALUE_SIZE} bytes")
+    print(f"{'':<36} | {'Open / load':>12} | {'Memory (MB)':>11} | {'Full traversal':>14}")
+    print("-" * 83)
+    print(
+        f"{'MappedLinkedList (reopen file)':<36} | {mapped_open_time * 1e6:>9.0f} us | "
+        f"{mapped_open_bytes / 1e6:>11.3f} | {mapped_walk_time:>12.3f} s"
+    )
+    print(
+        f"{'LinkedList (pickle.load)':<36} | {pickle_time:>10.3f} s | "
+        f"{pickle_bytes / 1e6:>11.1f} | {linked_walk_time:>12.3f} s"
+    )
+    mapped_size = os.path.getsize(mapped_path) / 1e6
+    pickle_size = os.path.getsize(pickle_path) / 1e6
+    print(f"\nFile sizes: {mapped_size:.1f} MB mapped, {pickle_size:.1f} MB pickle")
+
+    mll.close()
+    del ll
+    directory.cleanup()
+
+
+# Output:
+
+"""
+1,000,000 records of up to 16 bytes
+                                     |  Open / load | Memory (MB) | Full traversal
+-----------------------------------------------------------------------------------
+MappedLinkedList (reopen file)       |       343 us |       0.006 |        0.580 s
+LinkedList (pickle.load)             |      5.698 s |       132.9 |        0.205 s
+
+File sizes: 28.0 MB mapped, 14.9 MB pickle
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Reopening the mapped file maps it and reads the 48-byte header, whatever the number of records: a fraction of a
+millisecond and a few kilobytes of Python memory. Loading the pickled `LinkedList` has to create 1,000,000 nodes and
+1,000,000 `bytes` objects before the first value can be read, and keeps all of them in memory.
+
+- The times are measured with `tracemalloc` running, which makes allocation several times slower than usual; without
+it `pickle.load` takes about 1.4 seconds, still thousands of times longer than reopening the file.
+
+- A full traversal of the mapped list is about 3 times slower: every step unpacks a record with `struct` and copies
+its value into a new `bytes` object, where `LinkedList` just follows a reference. The pages of the file are loaded by
+the operating system on first access and can be dropped again, so only the pages being visited need to fit in RAM.
+
+- The mapped file is about twice the size of the pickle: every record reserves `value_size` bytes for its value,
+and the file doubles when it is full, so up to half of it can be unused records.
+"""
@@ -0,0 +1,302 @@
+# Implementation in Python:
+
+import mmap
+import os
+import struct
+
+NULL_OFFSET = 0  # Marks "no next record"; offset 0 holds the header, so no record can live there
+
+# Header: magic bytes, value size, head offset, tail offset, length, first free record, end of the used records
+HEADER = struct.Struct("<4sIqqqqq")
+MAGIC = b"MMLL"
+INITIAL_RECORDS = 64  # Room for this many records in a new file; the file doubles in size when it is full
+MAX_VALUE_SIZE = 0xFFFF  # Each record stores the length of its value in 2 bytes ("H")
+
+
+class MappedLinkedList:
+    def __init__(self, path, value_size=None):
+        # Open the list stored in the file at `path`, or create it. Every node is a fixed-width record:
+        # the offset of the next record, the length of the value and `value_size` bytes for the value.
+        # Opening an existing file only reads the header: nothing is parsed or loaded.
+        if value_size is not None and not 1 <= value_size <= MAX_VALUE_SIZE:
+            raise ValueError(f"value_size must be between 1 and {MAX_VALUE_SIZE}")
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "w+b")
+
+        if exists:
+            self.mm = mmap.mmap(self.file.fileno(), 0)
+            magic, stored_value_size = HEADER.unpack_from(self.mm, 0)[:2]
+            if magic != MAGIC:
+                self.close()
+                raise ValueError(f"{path} is not a memory-mapped linked list file")
+            if value_size is not None and value_size != stored_value_size:
+                self.close()
+                raise ValueError(f"{path} stores values of {stored_value_size} bytes, not {value_size}")
+            value_size = stored_value_size
+        else:
+            value_size = 32 if value_size is None else value_size
+
+        self.value_size = value_size
+        self.record = struct.Struct(f"<qH{value_size}s")  # next offset, value length, value bytes
+
+        if not exists:
+            size = HEADER.size + INITIAL_RECORDS * self.record.size
+            self.file.truncate(size)
+            self.mm = mmap.mmap(self.file.fileno(), size)
+            self._write_header(NULL_OFFSET, NULL_OFFSET, 0, NULL_OFFSET, HEADER.size)
+
+    def _read_header(self):
+        # Return (head, tail, length, free, end) from the header at the start of the file
+        return HEADER.unpack_from(self.mm, 0)[2:]
+
+    def _write_header(self, head, tail, length, free, end):
+        # Store the list's bookkeeping in the header, so it is on disk together with the records
+        HEADER.pack_into(self.mm, 0, MAGIC, self.value_size, head, tail, length, free, end)
+
+    def __len__(self):
+        # Return the number of records in the linked list
+        return self._read_header()[2]
+
+    def _read_record(self, offset):
+        # Return (next offset, value) of the record at the given offset
+        next_offset, size, data = self.record.unpack_from(self.mm, offset)
+        return next_offset, data[:size]
+
+    def _set_next(self, offset, next_offset):
+        # Change only the next offset of a record, which is its first field
+        struct.pack_into("<q", self.mm, offset, next_offset)
+
+    def _grow(self):
+        # Double the file and map it again; mapping is lazy, so the new pages cost nothing until they are used
+        new_size = len(self.mm) * 2
+        self.mm.close()
+        self.file.truncate(new_size)
+        self.mm = mmap.mmap(self.file.fileno(), new_size)
+
+    def _allocate(self, value, next_offset):
+        # Write a record for the value and return its offset, reusing a freed record if there is one
+        if not isinstance(value, (bytes, bytearray)):
+            raise TypeError("values must be bytes")
+        if len(value) > self.value_size:
+            raise ValueError(f"value is longer than {self.value_size} bytes")
+
+        head, tail, length, free, end = self._read_header()
+        if free != NULL_OFFSET:
+            offset = free
+            free = self._read_record(offset)[0]  # Free records are chained through their next offsets
+        else:
+            if end + self.record.size > len(self.mm):
+                self._grow()
+            offset = end
+            end += self.record.size
+
+        self.record.pack_into(self.mm, offset, next_offset, len(value), bytes(value))
+        self._write_header(head, tail, length + 1, free, end)
+        return offset
+
+    def insert_beginning(self, new_value):
+        # Insert a new record at the beginning of the linked list
+        new_offset = self._allocate(new_value, self._read_header()[0])
+
+        head, tail, length, free, end = self._read_header()
+        if tail == NULL_OFFSET:
+            # If the list was empty, the new record is also the tail record
+            tail = new_offset
+        self._write_header(new_offset, tail, length, free, end)
+
+    def insert_end(self, value):
+        # Insert a new record at the end of the linked list
+        new_offset = self._allocate(value, NULL_OFFSET)
+
+        head, tail, length, free, end = self._read_header()
+        if head == NULL_OFFSET:
+            # If the list is empty, set the new record as the head record
+            head = new_offset
+        else:
+            # Link the new record after the tail record
+            self._set_next(tail, new_offset)
+        self._write_header(head, new_offset, length, free, end)
+
+    def extend(self, values):
+        # Insert every value from an iterable at the end of the linked list
+        for value in values:
+            self.insert_end(value)
+
+    def remove_node(self, value_to_remove):
+        # Remove the first record with the specified value and put it on the free list
+        head, tail, length, free, end = self._read_header()
+        prev_offset = NULL_OFFSET
+        current_offset = head
+
+        while current_offset != NULL_OFFSET:
+            next_offset, value = self._read_record(current_offset)
+
+            if value == value_to_remove:
+                # Skip the record to remove by linking its predecessor (or the header) to its successor
+                if prev_offset == NULL_OFFSET:
+                    head = next_offset
+                else:
+                    self._set_next(prev_offset, next_offset)
+                if current_offset == tail:
+                    tail = prev_offset
+
+                self._set_next(current_offset, free)
+                self._write_header(head, tail, length - 1, current_offset, end)
+                return
+
+            prev_offset = current_offset
+            current_offset = next_offset
+
+    def __iter__(self):
+        # Yield the values from head to tail, following the offsets through the mapped file
+        current_offset = self._read_header()[0]
+        while current_offset != NULL_OFFSET:
+            current_offset, value = self._read_record(current_offset)
+            yield value
+
+    def stringify_list(self):
+        # Return a string representation of the linked list
+        string_list = " -> ".join(value.decode(errors="backslashreplace") for value in self)
+        return string_list if string_list else "Empty List"
+
+    def search(self, value):
+        # Search for a record with the specified value
+        for stored_value in self:
+            if stored_value == value:
+                return True
+
+        return False
+
+    def flush(self):
+        # Write the changed pages of the mapping back to the file
+        self.mm.flush()
+
+    def close(self):
+        # Flush and close the mapping and the file
+        if not self.mm.closed:
+            self.mm.flush()
+            self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        # Use the list in a with block that closes it at the end
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Close the list when the with block ends
+        self.close()
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tempfile
+
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "chain.mmll")
+
+    with MappedLinkedList(path, value_size=16) as mll:
+        mll.extend([b"alpha", b"beta", b"gamma"])
+        mll.insert_beginning(b"start")
+        print("List:", mll.stringify_list())  # Output: start -> alpha -> beta -> gamma
+        print("Length:", len(mll))  # Output: 4
+
+    # Reopening reads only the header; the records are read from the file when they are visited
+    with MappedLinkedList(path) as mll:
+        print("\nAfter reopening:", mll.stringify_list())  # Output: start -> alpha -> beta -> gamma
+        print("Value size from the header:", mll.value_size)  # Output: 16
+        print("Search for b'beta':", mll.search(b"beta"))  # Output: True
+
+        # A removed record goes on the free list, and the next insert reuses it instead of growing the file
+        end_before = mll._read_header()[4]
+        mll.remove_node(b"alpha")
+        mll.insert_end(b"delta")
+        print("\nAfter removing alpha and adding delta:")
+        print(mll.stringify_list())  # Output: start -> beta -> gamma -> delta
+        print("Record reused:", mll._read_header()[4] == end_before)  # Output: True
+
+        # Values are fixed-width records, so a value has to fit in value_size bytes
+        try:
+            mll.insert_end(b"a value that is too long")
+        except ValueError as error:
+            print("\nError:", error)  # Output: value is longer than 16 bytes
+
+    # The length of a value is stored in 2 bytes, so a record holds at most 65535 bytes
+    try:
+        MappedLinkedList(os.path.join(directory.name, "large.mll"), value_size=70_000)
+    except ValueError as error:
+        print("Error:", error)  # Output: value_size must be between 1 and 65535
+
+    # Growing past the first 64 records doubles the file
+    with MappedLinkedList(path) as mll:
+        mll.extend(str(number).encode() for number in range(100))
+        print("\nLength after 100 more values:", len(mll))  # Output: 104
+        print("Last value:", list(mll)[-1])  # Output: b'99'
+
+    print("File size:", os.path.getsize(path), "bytes")  # Output: 3424 bytes
+    directory.cleanup()
+
+
+# Output:
+
+"""
+List: start -> alpha -> beta -> gamma
+Length: 4
+
+After reopening: start -> alpha -> beta -> gamma
+Value size from the header: 16
+Search for b'beta': True
+
+After removing alpha and adding delta:
+start -> beta -> gamma -> delta
+Record reused: True
+
+Error: value is longer than 16 bytes
+Error: value_size must be between 1 and 65535
+
+Length after 100 more values: 104
+Last value: b'99'
+File size: 3424 bytes
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity | Space Complexity |
+|----------------------|-----------------|------------------|
+| `__init__` (open)    | O(1)            | O(1)             |
+| `__len__`            | O(1)            | O(1)             |
+| `_allocate`          | O(1) amortized  | O(1)             |
+| `insert_beginning`   | O(1) amortized  | O(1)             |
+| `insert_end`         | O(1) amortized  | O(1)             |
+| `extend`             | O(k)            | O(1)             |
+| `remove_node`        | O(n)            | O(1)             |
+| `__iter__`           | O(n)            | O(1)             |
+| `search`             | O(n)            | O(1)             |
+| `stringify_list`     | O(n)            | O(n)             |
+
+- **Opening is O(1)**: the head, tail, length and free list are stored in the header, so opening a file maps it and
+reads 48 bytes, however many records it holds. The operating system loads pages of the file only when a record on
+them is read, and can drop them again under memory pressure, so the list can be much larger than RAM.
+See `benchmark.py` for the measured open time of a 1,000,000-record file.
+
+- **Space**: every record takes `8 + 2 + value_size` bytes in the file (next offset, value length and the value),
+and no Python objects are kept in memory. The value length is a 2-byte field, so `value_size` is at most 65535. A value is copied into a new `bytes` object only when it is read.
+
+- `_grow` doubles the file when there are no free records left, so inserts are O(1) amortized, like `list.append`.
+Removed records are chained into a free list in the file and reused by later inserts, so the file never shrinks but
+does not grow while removals and inserts balance out.
+
+- Every read and write goes through `struct`, which is slower than following a `Node` reference: a traversal is
+several times slower than with `LinkedList`. The file is the price of lists that outlive the process and do not fit
+in memory.
+
+- Changes are written into the mapping right away and reach the disk when the operating system writes the pages
+back, or on `flush()` / `close()`. A crash in the middle of an operation can leave the header and the records out
+of step; this list does not keep a journal.
+"""
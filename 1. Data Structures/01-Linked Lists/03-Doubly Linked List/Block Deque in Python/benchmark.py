@@ -0,0 +1,161 @@
+# Benchmark: memory, end operations, iteration and indexed access of BlockDeque against DoublyLinkedList
+# and collections.deque
+
+import collections
+import gc
+import importlib.util
+import os
+import random
+import time
+import tracemalloc
+
+from main import BlockDeque
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SIZE = 200_000
+LOOKUPS = 200  # Random positions read by index
+
+
+def load_module(name, path):
+    # Import a main.py from another folder of the repository
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+DoublyLinkedList = load_module(
+    "doubly_linked_list", os.path.join(HERE, "..", "Implementing Doubly Linked List in Python", "main.py")
+).DoublyLinkedList
+
+
+def dll_value_at(dll, index):
+    # DoublyLinkedList has no indexing; _node_at walks from the nearer end, one node per step
+    return dll._node_at(index).get_value()
+
+
+CASES = [
+    ("DoublyLinkedList", DoublyLinkedList, "add_to_tail", "add_to_head", "remove_head", "remove_tail", dll_value_at),
+    ("BlockDeque", BlockDeque, "add_to_tail", "add_to_head", "remove_head", "remove_tail", BlockDeque.__getitem__),
+    (
+        "collections.deque",
+        collections.deque,
+        "append",
+        "appendleft",
+        "popleft",
+        "pop",
+        collections.deque.__getitem__,
+    ),
+]
+
+
+def measure_memory(make, add_to_tail):
+    # Bytes held per value once the structure is full, and the objects it adds for the garbage collector
+    values = list(range(SIZE))
+    gc.collect()
+    tracked_before = len(gc.get_objects())
+    tracemalloc.start()
+    container = make()
+    add = getattr(container, add_to_tail)
+    for value in values:
+        add(value)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracked = len(gc.get_objects()) - tracked_before
+    return held / SIZE, tracked / SIZE
+
+
+def measure_time(make, add_to_tail, add_to_head, remove_head, remove_tail, value_at, positions):
+    container = make()
+    timings = {}
+
+    start = time.perf_counter()
+    add = getattr(container, add_to_tail)
+    for value in range(SIZE // 2):
+        add(value)
+    add = getattr(container, add_to_head)
+    for value in range(SIZE // 2):
+        add(value)
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = 0
+    for value in container:
+        total += value
+    timings["iterate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for position in positions:
+        value_at(container, position)
+    timings["index"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    remove = getattr(container, remove_head)
+    for _ in range(SIZE // 2):
+        remove()
+    remove = getattr(container, remove_tail)
+    for _ in range(SIZE // 2):
+        remove()
+    timings["remove"] = time.perf_counter() - start
+
+    assert len(container) == 0 and total == 2 * sum(range(SIZE // 2))
+    return timings
+
+
+if __name__ == "__main__":
+    rng = random.Random(5)
+    positions = [rng.randrange(SIZE) for _ in range(LOOKUPS)]
+
+    print(f"{SIZE:,} values; add and remove half at each end, iterate once, {LOOKUPS} random lookups by index")
+    print(
+        f"{'Structure':<17} | {'Bytes/value':>11} | {'GC objs/value':>13} | {'Add (s)':>7} | {'Iterate (s)':>11} | "
+        f"{'Index (s)':>9} | {'Remove (s)':>10}"
+    )
+    print("-" * 100)
+
+    for name, make, add_to_tail, add_to_head, remove_head, remove_tail, value_at in CASES:
+        bytes_per_value, tracked_per_value = measure_memory(make, add_to_tail)
+        timings = measure_time(make, add_to_tail, add_to_head, remove_head, remove_tail, value_at, positions)
+        print(
+            f"{name:<17} | {bytes_per_value:>11.1f} | {tracked_per_value:>13.3f} | {timings['add']:>7.3f} | "
+            f"{timings['iterate']:>11.4f} | {timings['index']:>9.4f} | {timings['remove']:>10.3f}"
+        )
+
+
+# Output:
+
+"""
+200,000 values; add and remove half at each end, iterate once, 200 random lookups by index
+Structure         | Bytes/value | GC objs/value | Add (s) | Iterate (s) | Index (s) | Remove (s)
+----------------------------------------------------------------------------------------------------
+DoublyLinkedList  |        56.0 |         1.000 |   0.228 |      0.0294 |    0.5925 |      0.068
+BlockDeque        |         9.8 |         0.031 |   0.041 |      0.0143 |    0.0037 |      0.038
+collections.deque |         8.3 |         0.000 |   0.008 |      0.0089 |    0.0009 |      0.013
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11; repeated runs differ by up to 30% in time, the ratios keep their order. "Bytes/value" is
+the memory the full structure holds divided by the number of values, the values themselves not counted; "GC
+objs/value" is the number of objects it adds for the cyclic garbage collector.
+
+- Memory: a `BlockDeque` holds 9.8 bytes per value against 56 for `DoublyLinkedList`, close to the 8.3 bytes of
+`collections.deque`. Each block costs one 64-slot list and one `Block` object, so the collector sees 2 objects per 64
+values (0.031) instead of one node per value.
+
+- End operations: adding is about 5 times faster than in `DoublyLinkedList`, because it writes a slot instead of
+creating a node; removing is almost twice as fast. Both stay 4 to 5 times slower than `collections.deque`, which does
+the same work in C.
+
+- Iteration is twice as fast as following `next_node`, since each block is handed out as one slice.
+
+- Indexing skips 64 values per step: 200 random lookups take 4 milliseconds against 0.6 s for walking node by node,
+about 160 times faster. `collections.deque` does the same block walk in C.
+
+- `BlockDeque` only replaces `DoublyLinkedList` for work at the ends. Inserting in the middle, node handles, cursors
+and splicing need a node per value.
+"""
@@ -0,0 +1,316 @@
+# Implementation in Python:
+
+BLOCK_SIZE = 64  # Values per block, as in CPython's collections.deque
+
+
+class Block:
+    __slots__ = ("values", "prev_block", "next_block")  # One small object per block instead of one per value
+
+    def __init__(self, size, prev_block=None, next_block=None):
+        # A fixed array of `size` slots, linked to the blocks before and after it
+        self.values = [None] * size
+        self.prev_block = prev_block
+        self.next_block = next_block
+
+
+class BlockDeque:
+    def __init__(self, values=(), block_size=BLOCK_SIZE):
+        # Values live in doubly linked blocks; head_index and tail_index are the first and last used slots
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self.head_block = self.tail_block = Block(block_size)
+        self.length = 0
+        self._center()
+
+        for value in values:
+            self.add_to_tail(value)
+
+    def _center(self):
+        # Start an empty deque in the middle of its block, so it can grow both ways before it needs a new block
+        self.tail_index = (self.block_size - 1) // 2
+        self.head_index = self.tail_index + 1
+
+    def __len__(self):
+        # Return the number of values in the deque
+        return self.length
+
+    def add_to_head(self, new_value):
+        # Add a value before the first one, starting a new block when the head block is full at the front
+        if self.head_index == 0:
+            new_block = Block(self.block_size, next_block=self.head_block)
+            self.head_block.prev_block = new_block
+            self.head_block = new_block
+            self.head_index = self.block_size
+
+        self.head_index -= 1
+        self.head_block.values[self.head_index] = new_value
+        self.length += 1
+
+    def add_to_tail(self, new_value):
+        # Add a value after the last one, starting a new block when the tail block is full at the back
+        if self.tail_index == self.block_size - 1:
+            new_block = Block(self.block_size, prev_block=self.tail_block)
+            self.tail_block.next_block = new_block
+            self.tail_block = new_block
+            self.tail_index = -1
+
+        self.tail_index += 1
+        self.tail_block.values[self.tail_index] = new_value
+        self.length += 1
+
+    def remove_head(self):
+        # Remove and return the first value, or None if the deque is empty
+        if self.length == 0:
+            return None
+
+        removed_value = self.head_block.values[self.head_index]
+        self.head_block.values[self.head_index] = None  # Do not keep the removed value alive
+        self.head_index += 1
+        self.length -= 1
+
+        if self.length == 0:
+            self._center()  # Head and tail are in the same block again
+        elif self.head_index == self.block_size:
+            # The head block is used up: drop it and continue at the start of the next block
+            self.head_block = self.head_block.next_block
+            self.head_block.prev_block = None
+            self.head_index = 0
+        return removed_value
+
+    def remove_tail(self):
+        # Remove and return the last value, or None if the deque is empty
+        if self.length == 0:
+            return None
+
+        removed_value = self.tail_block.values[self.tail_index]
+        self.tail_block.values[self.tail_index] = None
+        self.tail_index -= 1
+        self.length -= 1
+
+        if self.length == 0:
+            self._center()
+        elif self.tail_index == -1:
+            self.tail_block = self.tail_block.prev_block
+            self.tail_block.next_block = None
+            self.tail_index = self.block_size - 1
+        return removed_value
+
+    def __iter__(self):
+        # Yield the values from head to tail, one block slice at a time
+        block = self.head_block
+        start = self.head_index
+        remaining = self.length
+
+        while remaining > 0:
+            stop = min(self.block_size, start + remaining)
+            yield from block.values[start:stop]
+            remaining -= stop - start
+            block = block.next_block
+            start = 0
+
+    def _locate(self, index):
+        # Return the block and slot of a position, skipping whole blocks from the nearer end: O(n / block_size)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BlockDeque index out of range")
+
+        if index < self.length // 2:
+            slot = self.head_index + index
+            block = self.head_block
+            for _ in range(slot // self.block_size):
+                block = block.next_block
+        else:
+            slot = self.tail_index - (self.length - 1 - index)  # Negative when the value is in an earlier block
+            block = self.tail_block
+            for _ in range((self.block_size - 1 - slot) // self.block_size):
+                block = block.prev_block
+
+        return block, slot % self.block_size
+
+    def __getitem__(self, index):
+        # Return the value at a position (negative positions count from the tail)
+        block, slot = self._locate(index)
+        return block.values[slot]
+
+    def __setitem__(self, index, value):
+        # Replace the value at a position
+        block, slot = self._locate(index)
+        block.values[slot] = value
+
+    def block_count(self):
+        # Return the number of blocks in use
+        count = 0
+        block = self.head_block
+        while block is not None:
+            count += 1
+            block = block.next_block
+        return count
+
+    def stringify_list(self):
+        # Return the values one per line, like DoublyLinkedList.stringify_list
+        return "".join(str(value) + "\n" for value in self if value is not None)
+
+
+# Example Usage
+if __name__ == "__main__":
+    deque = BlockDeque(block_size=4)  # Small blocks to show the structure; the default is 64
+
+    for value in [3, 4, 5, 6, 7]:
+        deque.add_to_tail(value)
+    deque.add_to_head(2)
+    deque.add_to_head(1)
+    print("Values:", list(deque))  # Output: [1, 2, 3, 4, 5, 6, 7]
+    print("Length:", len(deque), "| blocks:", deque.block_count())  # Output: 7 | blocks: 2
+
+    print("deque[0], deque[4], deque[-1]:", deque[0], deque[4], deque[-1])  # Output: 1 5 7
+    deque[3] = 40
+    print("After deque[3] = 40:", list(deque))
+
+    print("\nRemoved head:", deque.remove_head())  # Output: 1
+    print("Removed tail:", deque.remove_tail())  # Output: 7
+    print("Values:", list(deque), "| blocks:", deque.block_count())
+
+    try:
+        deque[10]
+    except IndexError as error:
+        print("Error:", error)
+
+    while len(deque) > 0:
+        deque.remove_tail()
+    print("\nEmpty:", list(deque), "| remove_head():", deque.remove_head(), "| blocks:", deque.block_count())
+
+    # With the default 64-slot blocks, 1,000 values need 17 blocks instead of 1,000 nodes
+    large = BlockDeque(range(1_000))
+    print("1,000 values in", large.block_count(), "blocks; large[500] =", large[500])
+    print(large.stringify_list()[:8], end="...\n")
+
+
+# Output:
+
+"""
+Values: [1, 2, 3, 4, 5, 6, 7]
+Length: 7 | blocks: 2
+deque[0], deque[4], deque[-1]: 1 5 7
+After deque[3] = 40: [1, 2, 3, 40, 5, 6, 7]
+
+Removed head: 1
+Removed tail: 7
+Values: [2, 3, 40, 5, 6] | blocks: 2
+Error: BlockDeque index out of range
+
+Empty: [] | remove_head(): None | blocks: 1
+1,000 values in 17 blocks; large[500] = 500
+0
+1
+2
+3
+...
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity       | Space Complexity |
+|----------------------|-----------------------|------------------|
+| `__init__`           | O(len(values))        | O(len(values))   |
+| `add_to_head`        | O(1)                  | O(1) amortized   |
+| `add_to_tail`        | O(1)                  | O(1) amortized   |
+| `remove_head`        | O(1)                  | O(1)             |
+| `remove_tail`        | O(1)                  | O(1)             |
+| `__getitem__`        | O(n / block_size)     | O(1)             |
+| `__setitem__`        | O(n / block_size)     | O(1)             |
+| `__len__`            | O(1)                  | O(1)             |
+| `__iter__`           | O(n)                  | O(block_size)    |
+| `block_count`        | O(n / block_size)     | O(1)             |
+| `stringify_list`     | O(n)                  | O(n)             |
+
+- **Adding and removing**: an end operation writes or clears one slot and moves an index. Once every `block_size`
+operations it also creates or drops a block, which is O(block_size) for `[None] * size` but O(1) amortized, and
+never moves a value that is already stored.
+
+- **Indexing**: the position tells which block holds the value (`slot // block_size`), so the walk skips whole blocks
+and starts from the nearer end: at most `n / (2 * block_size)` steps. A `DoublyLinkedList` walks value by value.
+
+- **Space**: one `Block` object and one list of `block_size` slots per block, about 10 bytes per value with 64 slots,
+against 56 bytes for a `Node` of `DoublyLinkedList`. At most two blocks (the head and the tail block) are partly
+empty, which wastes at most `2 * block_size` slots.
+
+- **Not supported**: inserting or removing in the middle, node handles, cursors and splicing. Values do not have a
+fixed node of their own; they are slots in shared blocks, so those operations would have to shift values.
+"""
+
+# =========================================================================================================================== #
+
+# Detailed Code Explanation:
+
+"""
+### **Why Blocks**
+
+A `DoublyLinkedList` creates a `Node` with three fields for every value: 56 bytes on top of the value, and one more
+object for the garbage collector to track. Neighbouring values can be anywhere in memory, so walking the list jumps
+around. CPython's `collections.deque` avoids that by storing values in **blocks** of 64 slots that are linked
+together; only the blocks have links. `BlockDeque` follows the same design in Python.
+
+```
+head_block         tail_block
+[ 1 2 3 4 ] <-> [ 5 6 7 _ ]
+  ^ head_index        ^ tail_index
+```
+
+---
+
+### **State**
+
+1. **`Block`**: a list of `block_size` slots plus `prev_block` and `next_block`. `__slots__` keeps the block object
+   small; it is created once per `block_size` values.
+2. **`head_block`, `head_index`**: the first block and the slot of the first value in it.
+3. **`tail_block`, `tail_index`**: the last block and the slot of the last value in it.
+4. **`length`**: the number of values, so `len` is O(1) and indexing knows which end is closer.
+
+An empty deque has one block with `head_index == tail_index + 1`, placed in the middle of the block by `_center`.
+The first values can go either way without creating a block, as in CPython.
+
+---
+
+### **Adding and Removing at the Ends**
+
+- `add_to_tail` moves `tail_index` one slot to the right and writes the value there. When the tail block has no slot
+  left, a new block is linked after it and `tail_index` starts again at slot 0. `add_to_head` is the mirror image.
+- `remove_head` reads the first value, clears its slot (so the deque does not keep the value alive) and moves
+  `head_index` right. When the head block is used up, it is unlinked and the next block becomes the head block.
+  `remove_tail` is the mirror image. Both return `None` on an empty deque, like `DoublyLinkedList`.
+- When the last value is removed, `_center` resets the indices, so an empty deque always has one centered block.
+
+---
+
+### **Indexing: `_locate`**
+
+- Position `i` from the head is slot `head_index + i` counted over the blocks from the head block, so it lies in
+  block number `(head_index + i) // block_size`, at slot `(head_index + i) % block_size`.
+- For positions in the second half, `_locate` counts back from `tail_index` instead and walks from the tail block.
+- Negative positions count from the tail, and positions out of range raise `IndexError`, like a Python list.
+
+---
+
+### **Iteration**
+
+`__iter__` yields one slice of a block at a time with `yield from`, so the loop over the values inside a block runs
+in C. The blocks hold their values next to each other, which is also what makes iteration faster than following
+`next_node` from node to node.
+
+---
+
+### **Same Interface, Fewer Objects**
+
+`add_to_head`, `add_to_tail`, `remove_head`, `remove_tail`, iteration, `len` and `stringify_list` work like those of
+`DoublyLinkedList`, so code that only uses the ends can switch classes. What a `BlockDeque` cannot offer is a node
+per value: there are no handles, no `insert(pos)`, no cursors and no splicing. `benchmark.py` compares both classes
+with `collections.deque`.
+"""
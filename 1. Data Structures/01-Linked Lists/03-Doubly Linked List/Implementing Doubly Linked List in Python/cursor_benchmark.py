@@ -0,0 +1,106 @@
+# Benchmark: editing around one position of a DoublyLinkedList, by position (walking from the head only, or from
+# the nearer end) and with a Cursor
+
+import time
+
+from main import DoublyLinkedList
+
+SIZE = 20_000
+EDITS = 1_000  # Each edit types one value at the position and then deletes the value before it again
+POSITIONS = [0.1, 0.5, 0.9]  # Where the edits happen, as a fraction of the list
+
+
+def insert_from_head(dll, pos, new_value):
+    # insert as it was before the list tracked its length: always walk `pos` steps from the head
+    current_node = dll.head_node
+    for _ in range(pos - 1):
+        current_node = current_node.get_next_node()
+    return dll.insert_after(current_node, new_value)
+
+
+def edit_by_position(dll, pos, insert):
+    # Type a value at `pos`, remove it again through the node insert returns, and type it once more
+    for value in range(EDITS):
+        node = insert(dll, pos, value)
+        dll.remove_node(node)
+        insert(dll, pos, value)
+
+
+def edit_with_cursor(dll, pos):
+    cursor = dll.cursor(pos)
+    for value in range(EDITS):
+        cursor.insert(value)
+        cursor.backspace()
+        cursor.insert(value)
+
+
+def measure(edit):
+    dll = DoublyLinkedList()
+    for value in range(SIZE):
+        dll.add_to_tail(value)
+
+    start = time.perf_counter()
+    edit(dll)
+    elapsed = time.perf_counter() - start
+
+    assert len(dll) == SIZE + EDITS
+    return elapsed
+
+
+if __name__ == "__main__":
+    print(f"{SIZE:,} values, {EDITS:,} edits at one position (2 inserts and 1 removal each)")
+    print(f"{'Position':>8} | {'Method':<27} | {'Time (s)':>8} | {'Speedup':>7}")
+    print("-" * 61)
+
+    for fraction in POSITIONS:
+        pos = int(SIZE * fraction)
+        results = [
+            ("insert, walking from head", measure(lambda dll: edit_by_position(dll, pos, insert_from_head))),
+            ("insert, nearer end", measure(lambda dll: edit_by_position(dll, pos, DoublyLinkedList.insert))),
+            ("Cursor", measure(lambda dll: edit_with_cursor(dll, pos))),
+        ]
+        baseline = results[0][1]
+        for name, elapsed in results:
+            print(f"{pos:>8,} | {name:<27} | {elapsed:>8.4f} | {baseline / elapsed:>6.0f}x")
+        print("-" * 61)
+
+
+# Output:
+
+"""
+20,000 values, 1,000 edits at one position (2 inserts and 1 removal each)
+Position | Method                      | Time (s) | Speedup
+-------------------------------------------------------------
+   2,000 | insert, walking from head   |   0.2945 |      1x
+   2,000 | insert, nearer end          |   0.2324 |      1x
+   2,000 | Cursor                      |   0.0039 |     75x
+-------------------------------------------------------------
+  10,000 | insert, walking from head   |   1.2215 |      1x
+  10,000 | insert, nearer end          |   1.0578 |      1x
+  10,000 | Cursor                      |   0.0041 |    297x
+-------------------------------------------------------------
+  18,000 | insert, walking from head   |   2.0673 |      1x
+  18,000 | insert, nearer end          |   0.1916 |     11x
+  18,000 | Cursor                      |   0.0024 |    865x
+-------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11; repeated runs differ by up to 25% in time, the ratios keep their order.
+
+- `insert(pos, ...)` walks from the nearer end, so its cost is `min(pos, length - pos)` steps. Near the tail it is
+about 10 times faster than the old walk from the head; near the head nothing changes, and in the middle both walk
+half the list (the 10% between them at 10,000 is noise).
+
+- The cursor walks once, when it is created, and every edit after that changes a few links. Its time hardly depends
+on the position at all, and it is 75 to 865 times faster than editing by position here. The gain grows with the
+distance the positional insert has to walk, so it is largest for long lists and edits far from both ends.
+
+- Edits made through the list itself (`add_to_tail`, `insert`, a node handle) while a cursor is open can leave the
+cursor's `index` or its end-of-list position out of date; open a new cursor with `dll.cursor(index)` afterwards.
+"""
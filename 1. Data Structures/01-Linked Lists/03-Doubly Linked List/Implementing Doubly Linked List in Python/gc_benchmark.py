@@ -0,0 +1,110 @@
+# Benchmark: cyclic garbage collector cost of a DoublyLinkedList with strong back-links, the same list emptied
+# with clear() before it is dropped, and ArrayDoublyLinkedList, which stores the links as indices
+
+import gc
+import time
+
+from main import ArrayDoublyLinkedList, DoublyLinkedList
+
+SIZE = 1_000_000
+
+
+def collections():
+    # Total number of collections of all generations so far
+    return sum(stats["collections"] for stats in gc.get_stats())
+
+
+def measure(list_class, clear_first):
+    gc.collect()
+    collections_before = collections()
+    start = time.perf_counter()
+    dll = list_class()
+    for value in range(SIZE):
+        dll.add_to_tail(value)
+    build_time = time.perf_counter() - start
+    build_collections = collections() - collections_before
+
+    # A full collection with the list alive: the pause every generation-2 collection costs while the list exists
+    start = time.perf_counter()
+    gc.collect()
+    pause = time.perf_counter() - start
+
+    # Teardown: drop the list, then collect whatever reference counting could not free
+    start = time.perf_counter()
+    if clear_first:
+        dll.clear()
+    del dll
+    drop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    left_to_gc = gc.collect()  # Number of unreachable objects the collector had to find
+    collect_time = time.perf_counter() - start
+
+    return build_time, build_collections, pause, drop_time, collect_time, left_to_gc
+
+
+if __name__ == "__main__":
+    cases = [
+        ("strong links, del", DoublyLinkedList, False),
+        ("strong links, clear()", DoublyLinkedList, True),
+        ("array links, del", ArrayDoublyLinkedList, False),
+    ]
+
+    print(f"{SIZE:,} nodes")
+    print(
+        f"{'List':<22} | {'Build (s)':>9} | {'GC runs':>7} | {'Full GC (s)':>11} | {'Drop (s)':>8} | "
+        f"{'GC after (s)':>12} | {'Left to GC':>10}"
+    )
+    print("-" * 100)
+
+    for name, list_class, clear_first in cases:
+        results = measure(list_class, clear_first)
+        build_time, build_collections, pause, drop_time, collect_time, left_to_gc = results
+        print(
+            f"{name:<22} | {build_time:>9.3f} | {build_collections:>7,} | {pause:>11.3f} | {drop_time:>8.3f} | "
+            f"{collect_time:>12.3f} | {left_to_gc:>10,}"
+        )
+
+
+# Output:
+
+"""
+1,000,000 nodes
+List                   | Build (s) | GC runs | Full GC (s) | Drop (s) | GC after (s) | Left to GC
+----------------------------------------------------------------------------------------------------
+strong links, del      |     1.273 |   1,426 |       0.102 |    0.000 |        0.244 |  1,000,000
+strong links, clear()  |     1.307 |   1,426 |       0.114 |    0.392 |        0.001 |          0
+array links, del       |     1.032 |       0 |       0.012 |    0.015 |        0.001 |          0
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11. "Full GC" is one `gc.collect()` while the list is alive; "Drop" is `clear()` (if used)
+plus `del`; "GC after" is the `gc.collect()` that follows, and "Left to GC" the unreachable objects it found.
+
+- With strong links, `del` returns at once but frees nothing: every pair of neighbours is a reference cycle, so all
+1,000,000 nodes stay in memory until the collector finds them, here 0.24 s in one go. In a running program that
+happens at an unpredictable moment, during some unrelated allocation.
+
+- `clear()` breaks the links first, so reference counting frees every node during the call and the collector finds
+nothing. It costs more time than the collection it replaces (0.39 s against 0.24 s), but the work happens when the
+caller decides and the memory is back immediately. It does not shorten the pauses while the list is alive.
+
+- Removing the cycles alone does not shorten those pauses: a full collection visits every tracked object, cycle or
+not, and one node per value is one tracked object per value (0.10 to 0.11 s here). `ArrayDoublyLinkedList` stores
+the back-links, and the forward links, as slot numbers in two `array("q")` columns next to one list of values. The
+collector sees a few containers instead of 1,000,000 nodes: a full collection takes 0.01 s, and building the list
+triggers no collection at all. Dropping it frees everything through reference counting in 0.015 s.
+
+- The price is the API: a handle is a slot number with a generation, not a node. A released slot is reused by later
+inserts, and its generation goes up, so an old handle raises `ValueError` instead of reaching the new value.
+`ArrayDoublyLinkedList` keeps the end operations, `insert_after`, `remove_node` and the moves. It has no positional
+inserts, cursors, splicing or splitting, which need nodes that can move between lists.
+
+- Use `ArrayDoublyLinkedList` for large, long-lived lists in a program where collection pauses matter, `clear()` to
+free a strong list at a chosen moment, and `DoublyLinkedList` otherwise.
+"""
@@ -0,0 +1,92 @@
+# Benchmark: inserting k values at random positions of a DoublyLinkedList, one insert call per value against
+# insert_many, which sorts the positions and walks the list once
+
+import random
+import time
+
+from main import DoublyLinkedList
+
+SIZE = 200_000
+BATCH_SIZES = [10, 100, 1_000]
+
+
+def insert_one_by_one(dll, pairs):
+    # Positions refer to the list before the batch; inserting from the highest position down keeps them valid
+    for pos, value in sorted(pairs, key=lambda pair: pair[0], reverse=True):
+        dll.insert(pos, value)
+
+
+def insert_batch(dll, pairs):
+    dll.insert_many(pairs)
+
+
+def measure(insert, pairs):
+    dll = DoublyLinkedList()
+    for value in range(SIZE):
+        dll.add_to_tail(value)
+
+    start = time.perf_counter()
+    insert(dll, pairs)
+    elapsed = time.perf_counter() - start
+    return elapsed, list(dll)
+
+
+if __name__ == "__main__":
+    rng = random.Random(3)
+
+    print(f"{SIZE:,} values, k values inserted at distinct random positions")
+    print(f"{'k':>5} | {'Method':<16} | {'Time (s)':>8} | {'us/insert':>9} | {'Speedup':>7}")
+    print("-" * 58)
+
+    for batch_size in BATCH_SIZES:
+        pairs = [(pos, -pos) for pos in rng.sample(range(SIZE), batch_size)]
+        one_by_one, expected = measure(insert_one_by_one, pairs)
+        batch, result = measure(insert_batch, pairs)
+        assert result == expected
+
+        for name, elapsed in [("insert per value", one_by_one), ("insert_many", batch)]:
+            print(
+                f"{batch_size:>5,} | {name:<16} | {elapsed:>8.4f} | {elapsed / batch_size * 1e6:>9.1f} | "
+                f"{one_by_one / elapsed:>6.1f}x"
+            )
+        print("-" * 58)
+
+
+# Output:
+
+"""
+200,000 values, k values inserted at distinct random positions
+    k | Method           | Time (s) | us/insert | Speedup
+----------------------------------------------------------
+   10 | insert per value |   0.0384 |    3842.7 |    1.0x
+   10 | insert_many      |   0.0252 |    2515.6 |    1.5x
+----------------------------------------------------------
+  100 | insert per value |   0.3603 |    3602.8 |    1.0x
+  100 | insert_many      |   0.0180 |     180.5 |   20.0x
+----------------------------------------------------------
+1,000 | insert per value |   3.3576 |    3357.6 |    1.0x
+1,000 | insert_many      |   0.0212 |      21.2 |  158.3x
+----------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11; repeated runs differ by up to 40% in time, the ratios keep their order.
+
+- Each `insert` walks from the nearer end, n / 4 steps on average for a random position, so k inserts cost
+O(n * k): about 3 milliseconds per value here, whatever k is.
+
+- `insert_many` sorts the k positions and walks the list once, from the nearer end to the first position and then
+forward to the last: O(k log k + n) in total. The walk dominates, so its time barely changes from 10 to 1,000 values
+(18 to 25 milliseconds), and the gain grows with k: 1.5 times faster for 10 values, 20 times for 100, about 160
+times for 1,000. On a list of 10 million entries one walk takes about a second, while a thousand separate inserts
+would take minutes.
+
+- Positions refer to the list before the call, so the result is the same as inserting from the highest position
+down, which is how the one-by-one loop here keeps its positions valid. Values for the same position keep their
+order.
+"""
@@ -1,12 +1,27 @@
 # Implementation in Python:
 
+import copy
+from array import array
+from itertools import islice
+
+NULL_INDEX = -1  # Marks "no next or previous slot" in ArrayDoublyLinkedList, like None does for a node
+SLOT_BITS = 32  # An ArrayDoublyLinkedList handle is (generation << SLOT_BITS) | slot
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
 
 class Node:
+    __slots__ = ("value", "next_node", "prev_node")  # Fixed attributes instead of a __dict__: smaller nodes
+
     def __init__(self, value, next_node=None, prev_node=None):
         self.value = value  # Store node value
         self.next_node = next_node  # Pointer to next node
         self.prev_node = prev_node  # Pointer to previous node
 
+    def reset(self, value, next_node=None, prev_node=None):  # Reinitialize a recycled node (used by a NodePool)
+        self.value = value
+        self.next_node = next_node
+        self.prev_node = prev_node
+
     def set_next_node(self, next_node):
         self.next_node = next_node
 
@@ -24,12 +39,21 @@ class Node:
 
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, node_pool=None):
         self.head_node = None  # Reference to head node
         self.tail_node = None  # Reference to tail node
+        self.length = 0  # Number of nodes, kept up to date by every insert and removal
+        self.node_pool = node_pool  # Optional NodePool(Node) that recycles the nodes this list removes
+
+    def _new_node(self, value):
+        return Node(value) if self.node_pool is None else self.node_pool.acquire(value)  # New or recycled node
+
+    def _release_node(self, node):
+        if self.node_pool is not None:  # Give an unlinked node back to the pool; nothing may refer to it any more
+            self.node_pool.release(node)
 
     def add_to_head(self, new_value):
-        new_head = Node(new_value)  # Create a new node
+        new_head = self._new_node(new_value)  # Create a new node
         current_head = self.head_node  # Get current head
 
         if current_head is not None:
@@ -37,12 +61,15 @@ class DoublyLinkedList:
             new_head.set_next_node(current_head)  # Link new head to old head
 
         self.head_node = new_head  # Update head reference
+        self.length += 1
 
         if self.tail_node is None:  # If list was empty, set tail as well
             self.tail_node = new_head
 
+        return new_head  # The node is a handle for remove_node, move_to_front and move_to_back
+
     def add_to_tail(self, new_value):
-        new_tail = Node(new_value)  # Create a new node
+        new_tail = self._new_node(new_value)  # Create a new node
         current_tail = self.tail_node  # Get current tail
 
         if current_tail is not None:
@@ -50,32 +77,62 @@ class DoublyLinkedList:
             new_tail.set_prev_node(current_tail)  # Link new tail to old tail
 
         self.tail_node = new_tail  # Update tail reference
+        self.length += 1
 
         if self.head_node is None:  # If list was empty, set head as well
             self.head_node = new_tail
 
-    def insert(self, pos, new_value):
-        if pos == 0:  # Insert at head if position is 0
-            self.add_to_head(new_value)
-        else:
-            current_node = self.head_node
-            for i in range(pos - 1):
-                if current_node is None or current_node.get_next_node() is None:
-                    self.add_to_tail(new_value)
-                    return
-                current_node = current_node.get_next_node()
-
-            new_node = Node(new_value)
-            new_node.set_next_node(current_node.get_next_node())
-            new_node.set_prev_node(current_node)
+        return new_tail  # The node is a handle for remove_node, move_to_front and move_to_back
 
-            if current_node.get_next_node() is not None:
-                current_node.get_next_node().set_prev_node(new_node)
+    def __len__(self):
+        return self.length
 
-            current_node.set_next_node(new_node)
+    def _node_at(self, index):
+        # Walk from whichever end is closer, so no position is more than length / 2 steps away
+        if index < self.length // 2:
+            current_node = self.head_node
+            for _ in range(index):
+                current_node = current_node.get_next_node()
+        else:
+            current_node = self.tail_node
+            for _ in range(self.length - 1 - index):
+                current_node = current_node.get_prev_node()
+        return current_node
 
-            if new_node.get_next_node() is None:  # If inserted at end, update tail
-                self.tail_node = new_node
+    def insert(self, pos, new_value):
+        if pos <= 0 or self.head_node is None:  # Insert at head if position is 0 or the list is empty
+            return self.add_to_head(new_value)
+        if pos >= self.length:  # Positions past the end append to the tail
+            return self.add_to_tail(new_value)
+        return self.insert_after(self._node_at(pos - 1), new_value)  # Link in after the node before `pos`
+
+    def insert_many(self, pairs):
+        # Positions refer to the list before the call, as in a patch; equal positions keep the order they were given
+        pairs = list(pairs)
+        positions = [min(max(pos, 0), self.length) for pos, _ in pairs]  # Clamped like insert
+        order = sorted(range(len(pairs)), key=positions.__getitem__)  # Stable sort by position
+        new_nodes = [None] * len(pairs)
+        if not pairs:
+            return new_nodes
+
+        # Walk once, from the nearer end to the first position and then forward; new nodes go in before `next_node`,
+        # so the walk only counts the original nodes and no position has to be shifted
+        index = positions[order[0]]
+        next_node = self._node_at(index) if index < self.length else None
+
+        for i in order:
+            new_value = pairs[i][1]
+            while index < positions[i]:
+                next_node = next_node.get_next_node()
+                index += 1
+
+            if next_node is None:  # Positions past the end append to the tail
+                new_nodes[i] = self.add_to_tail(new_value)
+            elif next_node is self.head_node:
+                new_nodes[i] = self.add_to_head(new_value)
+            else:
+                new_nodes[i] = self.insert_after(next_node.get_prev_node(), new_value)
+        return new_nodes  # The new nodes, in the order of `pairs`
 
     def remove_head(self):
         removed_head = self.head_node
@@ -84,13 +141,16 @@ class DoublyLinkedList:
             return None
 
         self.head_node = removed_head.get_next_node()  # Update head
+        self.length -= 1
 
         if self.head_node is not None:
             self.head_node.set_prev_node(None)  # Remove backward link
         else:
             self.tail_node = None  # If list is empty after removal, update tail
 
-        return removed_head.get_value()
+        removed_value = removed_head.get_value()
+        self._release_node(removed_head)
+        return removed_value
 
     def remove_tail(self):
         removed_tail = self.tail_node
@@ -99,13 +159,191 @@ class DoublyLinkedList:
             return None
 
         self.tail_node = removed_tail.get_prev_node()  # Update tail
+        self.length -= 1
 
         if self.tail_node is not None:
             self.tail_node.set_next_node(None)  # Remove forward link
         else:
             self.head_node = None  # If list is empty after removal, update head
 
-        return removed_tail.get_value()
+        removed_value = removed_tail.get_value()
+        self._release_node(removed_tail)
+        return removed_value
+
+    def _check_linked(self, node):
+        # A node without a neighbour on one side must be the head or the tail; otherwise it is no longer in a list.
+        # A node with both neighbours passes even if it is in another list; _check_owned tells those apart.
+        if (node.get_prev_node() is None and node is not self.head_node) or (
+            node.get_next_node() is None and node is not self.tail_node
+        ):
+            raise ValueError("node is not in this list")
+
+    def insert_after(self, node, new_value):
+        self._check_linked(node)
+        if node is self.tail_node:
+            return self.add_to_tail(new_value)
+
+        new_node = self._new_node(new_value)  # O(1): the node handle gives the position, no walk from the head
+        next_node = node.get_next_node()
+        new_node.set_prev_node(node)
+        new_node.set_next_node(next_node)
+        next_node.set_prev_node(new_node)
+        node.set_next_node(new_node)
+        self.length += 1
+        return new_node
+
+    def _unlink(self, node):
+        self._check_linked(node)
+        prev_node = node.get_prev_node()
+        next_node = node.get_next_node()
+
+        if prev_node is not None:
+            prev_node.set_next_node(next_node)  # Bridge over the node from the front
+        else:
+            self.head_node = next_node
+
+        if next_node is not None:
+            next_node.set_prev_node(prev_node)  # Bridge over the node from the back
+        else:
+            self.tail_node = prev_node
+
+        node.set_prev_node(None)  # The unlinked node keeps no references into the list
+        node.set_next_node(None)
+
+    def remove_node(self, node):
+        self._unlink(node)  # O(1): both neighbours are reachable from the node itself
+        self.length -= 1
+        removed_value = node.get_value()
+        self._release_node(node)
+        return removed_value
+
+    def move_to_front(self, node):
+        if node is not self.head_node:
+            self._unlink(node)
+            node.set_next_node(self.head_node)  # The list still has a head: the node was not the only one
+            self.head_node.set_prev_node(node)
+            self.head_node = node
+        return node
+
+    def move_to_back(self, node):
+        if node is not self.tail_node:
+            self._unlink(node)
+            node.set_prev_node(self.tail_node)
+            self.tail_node.set_next_node(node)
+            self.tail_node = node
+        return node
+
+    def _take_all(self, other):
+        # Empty `other` and return its first node, last node and length, for another list to link in
+        if other is self:
+            raise ValueError("cannot join a list with itself")
+
+        first_node, last_node, count = other.head_node, other.tail_node, other.length
+        other.head_node = None
+        other.tail_node = None
+        other.length = 0
+        return first_node, last_node, count
+
+    def concat(self, other):
+        first_node, last_node, count = self._take_all(other)
+        if first_node is None:  # Nothing to append
+            return self
+
+        if self.tail_node is None:
+            self.head_node = first_node
+        else:
+            self.tail_node.set_next_node(first_node)  # O(1): only the two ends meet, no node is copied
+            first_node.set_prev_node(self.tail_node)
+
+        self.tail_node = last_node
+        self.length += count
+        return self
+
+    def _check_owned(self, node):
+        # Step towards both ends at once: the first end reached shows which list the node is in, O(min(k, n - k))
+        ahead = behind = node
+        while ahead.get_next_node() is not None and behind.get_prev_node() is not None:
+            ahead = ahead.get_next_node()
+            behind = behind.get_prev_node()
+
+        if ahead is not self.tail_node and behind is not self.head_node:
+            raise ValueError("node is not in this list")
+
+    def splice(self, node, other):
+        # A node of `other`, or of any other list, would link `other` into itself and corrupt both lists
+        self._check_owned(node)
+        if node is self.tail_node:
+            return self.concat(other)
+
+        first_node, last_node, count = self._take_all(other)
+        if first_node is None:
+            return self
+
+        next_node = node.get_next_node()  # Link the whole other list in between node and next_node
+        node.set_next_node(first_node)
+        first_node.set_prev_node(node)
+        last_node.set_next_node(next_node)
+        next_node.set_prev_node(last_node)
+
+        self.length += count
+        return self
+
+    def _split_before(self, node, moved):
+        # Move `node` and the `moved` nodes from it to the tail into a new list; O(1), only two links change
+        tail_part = self.__class__(self.node_pool)
+        tail_part.head_node = node
+        tail_part.tail_node = self.tail_node
+        tail_part.length = moved
+
+        prev_node = node.get_prev_node()
+        node.set_prev_node(None)
+        if prev_node is None:  # The whole list moves
+            self.head_node = None
+        else:
+            prev_node.set_next_node(None)
+        self.tail_node = prev_node
+        self.length -= moved
+        return tail_part
+
+    def split_at_handle(self, node):
+        self._check_linked(node)
+
+        # Count the nodes from `node` to the tail and the nodes before `node` in step, so the count stops at the
+        # shorter side: O(min(k, n - k)) to keep both lengths right, while the split itself is O(1)
+        ahead, behind = node, node.get_prev_node()
+        moved = kept = 0
+        while ahead is not None and behind is not None:
+            ahead = ahead.get_next_node()
+            moved += 1
+            behind = behind.get_prev_node()
+            kept += 1
+        if ahead is not None:  # The front side ended first, so it was counted completely
+            moved = self.length - kept
+
+        return self._split_before(node, moved)
+
+    def split_at(self, pos):
+        pos = max(pos, 0)
+        if pos >= self.length:  # Nothing after `pos`: the new list is empty
+            return self.__class__(self.node_pool)
+        return self._split_before(self._node_at(pos), self.length - pos)  # Keep the first `pos` values
+
+    def cursor(self, index=0):
+        return Cursor(self, index)  # A position in the list that edits around it in O(1)
+
+    def clear(self):
+        current_node = self.head_node
+
+        while current_node is not None:  # Break every link, so each node is freed as soon as nothing refers to it
+            next_node = current_node.get_next_node()
+            current_node.set_next_node(None)
+            current_node.set_prev_node(None)
+            self._release_node(current_node)
+            current_node = next_node
+
+        self.head_node = None
+        self.tail_node = None
+        self.length = 0
 
     def remove_by_value(self, value_to_remove):
         current_node = self.head_node
@@ -117,66 +355,439 @@ class DoublyLinkedList:
                 elif current_node == self.tail_node:  # If it's the tail
                     return self.remove_tail()
                 else:  # Middle of the list
-                    prev_node = current_node.get_prev_node()
-                    next_node = current_node.get_next_node()
+                    return self.remove_node(current_node)  # Unlink the node and return its value
 
-                    if prev_node:
-                        prev_node.set_next_node(next_node)
+            current_node = current_node.get_next_node()
 
-                    if next_node:
-                        next_node.set_prev_node(prev_node)
+        return None  # If value not found
 
-                    return value_to_remove  # Return removed value
+    def __iter__(self):
+        current_node = self.head_node
 
+        while current_node:  # Yield the values from head to tail
+            yield current_node.get_value()
             current_node = current_node.get_next_node()
 
-        return None  # If value not found
-
     def stringify_list(self):
-        string_list = ""
-        current_node = self.head_node
+        # Join all the lines in a single pass instead of growing a string with +=
+        return "".join(str(value) + "\n" for value in self if value is not None)
 
-        while current_node:
-            if current_node.get_value() is not None:
-                string_list += str(current_node.get_value()) + "\n"
+    def write_to(self, fileobj, chunk_size=1024):
+        lines = (str(value) + "\n" for value in self if value is not None)
 
-            current_node = current_node.get_next_node()
+        while True:  # Write `chunk_size` lines at a time, never building the whole string
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            fileobj.write("".join(chunk))
 
-        return string_list
+    def preview(self, limit):
+        lines = list(islice((str(value) + "\n" for value in self if value is not None), limit + 1))
 
+        if len(lines) > limit:  # Stop after `limit` lines and mark that more follow
+            lines[limit:] = ["...\n"]
 
-# Create a new doubly linked list
-dll = DoublyLinkedList()
+        return "".join(lines)
 
-# Add elements to the list
-dll.add_to_head(5)
-dll.add_to_tail(10)
-dll.add_to_tail(15)
-dll.add_to_head(1)
+    def __getstate__(self):
+        return list(self)  # Values from head to tail, used by pickle and copy
 
-# Print the list
-print("Doubly Linked List:")
-print(dll.stringify_list())
+    def __setstate__(self, values):
+        for value in values:  # Rebuild the nodes one at a time
+            self.add_to_tail(value)
 
-# Insert an element at position 2
-dll.insert(2, 7)
-print("After inserting 7 at position 2:")
-print(dll.stringify_list())
+    def __reduce__(self):
+        # Pickle a flat list of values instead of the nodes, which pickle would otherwise follow
+        # recursively through next_node and prev_node (RecursionError on long lists)
+        return self.__class__, (), self.__getstate__()
 
-# Remove the head
-dll.remove_head()
-print("After removing head:")
-print(dll.stringify_list())
+    def __deepcopy__(self, memo):
+        copied = self.__class__()
+        memo[id(self)] = copied  # Register the copy first, in case a value refers back to the list
 
-# Remove the tail
-dll.remove_tail()
-print("After removing tail:")
-print(dll.stringify_list())
+        for value in self:  # Copy the values one by one, without recursing through the nodes
+            copied.add_to_tail(copy.deepcopy(value, memo))
 
-# Remove an element by value (e.g., 7)
-dll.remove_by_value(7)
-print("After removing value 7:")
-print(dll.stringify_list())
+        return copied
+
+
+class Cursor:
+    def __init__(self, dll, index=0):
+        self.dll = dll
+        self.index = 0  # Number of values before the cursor, like the column of a caret in a text editor
+        self.node = dll.head_node  # The node right after the cursor; None at the end of the list
+        self.seek(index)
+
+    def seek(self, index):
+        index = max(0, min(index, len(self.dll)))
+
+        # Start from the head, the tail or the current position, whichever is closest, then step
+        from_head, from_tail, from_here = index, len(self.dll) - index, abs(index - self.index)
+        if from_head < from_here and from_head <= from_tail:
+            self.index, self.node = 0, self.dll.head_node
+        elif from_tail < from_here:
+            self.index, self.node = len(self.dll), None
+
+        return self.move(index - self.index)
+
+    def move(self, steps):
+        while steps > 0 and self.node is not None:  # Forward, stopping at the end of the list
+            self.node = self.node.get_next_node()
+            self.index += 1
+            steps -= 1
+
+        while steps < 0 and self.index > 0:  # Backward, stopping at the head
+            self.node = self.dll.tail_node if self.node is None else self.node.get_prev_node()
+            self.index -= 1
+            steps += 1
+
+        return self.index
+
+    def peek(self):
+        return None if self.node is None else self.node.get_value()  # The value after the cursor
+
+    def insert(self, new_value):
+        # Insert before self.node and step over the new value, like typing; O(1) at any position
+        if self.node is None:
+            new_node = self.dll.add_to_tail(new_value)
+        elif self.node is self.dll.head_node:
+            new_node = self.dll.add_to_head(new_value)
+        else:
+            new_node = self.dll.insert_after(self.node.get_prev_node(), new_value)
+
+        self.index += 1
+        return new_node
+
+    def delete(self):
+        if self.node is None:  # Nothing after the cursor
+            return None
+
+        removed_node, self.node = self.node, self.node.get_next_node()  # Like the Delete key: the cursor stays put
+        return self.dll.remove_node(removed_node)
+
+    def backspace(self):
+        if self.index == 0:  # Nothing before the cursor
+            return None
+
+        removed_node = self.dll.tail_node if self.node is None else self.node.get_prev_node()
+        self.index -= 1  # Like the Backspace key: the cursor moves back with the removed value
+        return self.dll.remove_node(removed_node)
+
+
+class ArrayDoublyLinkedList:
+    def __init__(self):
+        # The same links without a Node per value: values[i] is the value of slot i, and next_indices[i] and
+        # prev_indices[i] are the slots around it. The links are ints in two arrays, so there are no reference cycles,
+        # and the garbage collector tracks one list for all the values instead of one node per value.
+        self.values = []
+        self.next_indices = array("q")
+        self.prev_indices = array("q")
+        self.generations = array("q")  # Bumped when a slot is released, so handles of its old value stop matching
+
+        self.head_index = NULL_INDEX  # Slot of the first value
+        self.tail_index = NULL_INDEX  # Slot of the last value
+        self.free_index = NULL_INDEX  # First slot of the free list, chained through next_indices
+        self.first_generation = 0  # Generation of new slots; clear() raises it above every handle given out before
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def _handle(self, index):
+        # A handle is the slot and its generation packed in one int, as cheap to keep as the slot number alone
+        return self.generations[index] << SLOT_BITS | index
+
+    def _slot(self, handle):
+        # Return the slot of a handle, or raise if its value was removed, even when the slot has been reused since
+        index = handle & SLOT_MASK
+        if index >= len(self.values) or self.generations[index] != handle >> SLOT_BITS:
+            raise ValueError("node is not in this list")
+        return index
+
+    def _allocate(self, value, prev_index, next_index):
+        if self.free_index != NULL_INDEX:  # Reuse a released slot before growing the columns
+            index = self.free_index
+            self.free_index = self.next_indices[index]
+            self.values[index] = value
+            self.next_indices[index] = next_index
+            self.prev_indices[index] = prev_index
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.next_indices.append(next_index)
+            self.prev_indices.append(prev_index)
+            self.generations.append(self.first_generation)
+
+        self.length += 1
+        return index
+
+    def _release(self, index):
+        value = self.values[index]
+        self.values[index] = None  # Drop the reference so the value can be freed
+        self.generations[index] += 1  # Every handle of the removed value is now stale
+        self.next_indices[index] = self.free_index
+        self.free_index = index
+        self.length -= 1
+        return value
+
+    def get_value(self, handle):
+        return self.values[self._slot(handle)]
+
+    def add_to_head(self, new_value):
+        new_head = self._allocate(new_value, NULL_INDEX, self.head_index)
+
+        if self.head_index != NULL_INDEX:
+            self.prev_indices[self.head_index] = new_head  # Link old head to new head
+        else:
+            self.tail_index = new_head  # If list was empty, set tail as well
+        self.head_index = new_head
+
+        return self._handle(new_head)  # The handle for remove_node, move_to_front and move_to_back
+
+    def add_to_tail(self, new_value):
+        new_tail = self._allocate(new_value, self.tail_index, NULL_INDEX)
+
+        if self.tail_index != NULL_INDEX:
+            self.next_indices[self.tail_index] = new_tail  # Link old tail to new tail
+        else:
+            self.head_index = new_tail  # If list was empty, set head as well
+        self.tail_index = new_tail
+
+        return self._handle(new_tail)  # The handle for remove_node, move_to_front and move_to_back
+
+    def remove_head(self):
+        if self.head_index == NULL_INDEX:  # If list is empty
+            return None
+        return self._remove(self.head_index)
+
+    def remove_tail(self):
+        if self.tail_index == NULL_INDEX:  # If list is empty
+            return None
+        return self._remove(self.tail_index)
+
+    def insert_after(self, handle, new_value):
+        index = self._slot(handle)
+        if index == self.tail_index:
+            return self.add_to_tail(new_value)
+
+        next_index = self.next_indices[index]
+        new_index = self._allocate(new_value, index, next_index)
+        self.prev_indices[next_index] = new_index
+        self.next_indices[index] = new_index
+        return self._handle(new_index)
+
+    def _unlink(self, index):
+        prev_index = self.prev_indices[index]
+        next_index = self.next_indices[index]
+
+        if prev_index != NULL_INDEX:
+            self.next_indices[prev_index] = next_index  # Bridge over the slot from the front
+        else:
+            self.head_index = next_index
+
+        if next_index != NULL_INDEX:
+            self.prev_indices[next_index] = prev_index  # Bridge over the slot from the back
+        else:
+            self.tail_index = prev_index
+
+    def _remove(self, index):
+        self._unlink(index)  # O(1): both neighbours are stored in the slot's columns
+        return self._release(index)
+
+    def remove_node(self, handle):
+        return self._remove(self._slot(handle))
+
+    def move_to_front(self, handle):
+        index = self._slot(handle)
+        if index != self.head_index:
+            self._unlink(index)
+            self.prev_indices[index] = NULL_INDEX
+            self.next_indices[index] = self.head_index  # The list still has a head: the slot was not the only one
+            self.prev_indices[self.head_index] = index
+            self.head_index = index
+        return handle
+
+    def move_to_back(self, handle):
+        index = self._slot(handle)
+        if index != self.tail_index:
+            self._unlink(index)
+            self.next_indices[index] = NULL_INDEX
+            self.prev_indices[index] = self.tail_index
+            self.next_indices[self.tail_index] = index
+            self.tail_index = index
+        return handle
+
+    def clear(self):
+        # Replace the columns: freeing the old ones drops every value at once, there are no links to cut.
+        # New slots start above every generation used so far, so no handle from before the call matches them.
+        first_generation = max(self.generations, default=self.first_generation - 1) + 1
+        self.__init__()
+        self.first_generation = first_generation
+
+    def __iter__(self):
+        values = self.values
+        next_indices = self.next_indices
+        current_index = self.head_index
+
+        while current_index != NULL_INDEX:  # Yield the values from head to tail
+            yield values[current_index]
+            current_index = next_indices[current_index]
+
+    def __reversed__(self):
+        values = self.values
+        prev_indices = self.prev_indices
+        current_index = self.tail_index
+
+        while current_index != NULL_INDEX:  # Yield the values from tail to head
+            yield values[current_index]
+            current_index = prev_indices[current_index]
+
+
+if __name__ == "__main__":
+    import io
+    import pickle
+
+    # Create a new doubly linked list
+    dll = DoublyLinkedList()
+
+    # Add elements to the list
+    dll.add_to_head(5)
+    dll.add_to_tail(10)
+    dll.add_to_tail(15)
+    dll.add_to_head(1)
+
+    # Print the list
+    print("Doubly Linked List:")
+    print(dll.stringify_list())
+
+    # Insert an element at position 2
+    dll.insert(2, 7)
+    print("After inserting 7 at position 2:")
+    print(dll.stringify_list())
+
+    # Remove the head
+    dll.remove_head()
+    print("After removing head:")
+    print(dll.stringify_list())
+
+    # Remove the tail
+    dll.remove_tail()
+    print("After removing tail:")
+    print(dll.stringify_list())
+
+    # Remove an element by value (e.g., 7)
+    dll.remove_by_value(7)
+    print("After removing value 7:")
+    print(dll.stringify_list())
+
+    # Iterate, preview and stream the list
+    dll.add_to_tail(20)
+    dll.add_to_tail(25)
+    print("Values:", list(dll))
+    print("Preview of 2 values:")
+    print(dll.preview(2))
+
+    output_file = io.StringIO()  # Any object with a write() method, such as an open file
+    dll.write_to(output_file, chunk_size=2)
+    print("Streamed:")
+    print(output_file.getvalue())
+
+    # Keep the nodes returned by add_to_tail as handles: removing or moving them is O(1), without a search
+    tasks = DoublyLinkedList()
+    write = tasks.add_to_tail("write")
+    review = tasks.add_to_tail("review")
+    deploy = tasks.add_to_tail("deploy")
+    tasks.move_to_front(deploy)
+    tasks.move_to_back(write)
+    print("Tasks after moving deploy to the front and write to the back:", list(tasks))
+    print("Removed through its handle:", tasks.remove_node(review))
+    print("Tasks:", list(tasks))
+    tasks.insert_after(deploy, "test")
+    print("After inserting test after deploy:", list(tasks))
+
+    try:
+        tasks.remove_node(review)  # The handle no longer belongs to the list
+    except ValueError as error:
+        print("Error:", error)
+    print()
+
+    # Edit around one position with a cursor: every insert and delete is O(1) once the cursor is there
+    text = DoublyLinkedList()
+    for character in "helo wrld":
+        text.add_to_tail(character)
+    print("Text:", "".join(text), "| length", len(text))
+
+    cursor = text.cursor(3)  # Between "hel" and "o wrld", reached by walking from the nearer end
+    cursor.insert("l")  # hello wrld, the cursor moves past the new value
+    cursor.move(3)  # Between "hello w" and "rld"
+    cursor.insert("o")  # hello world
+    cursor.seek(0)
+    cursor.delete()  # ello world
+    cursor.insert("H")  # Hello world
+    cursor.seek(len(text))
+    cursor.insert("!")
+    cursor.backspace()  # Removes the "!" again
+    print("Edited:", "".join(text), "| length", len(text), "| cursor at", cursor.index, "before", repr(cursor.peek()))
+    print()
+
+    # Split and join whole lists by relinking their ends, without moving the values one by one
+    work = DoublyLinkedList()
+    for job in ["a", "b", "c", "d", "e"]:
+        work.add_to_tail(job)
+    second_half = work.split_at(3)
+    print("Split at 3:", list(work), list(second_half))  # ['a', 'b', 'c'] ['d', 'e']
+
+    urgent = DoublyLinkedList()
+    urgent.add_to_tail("x")
+    urgent.add_to_tail("y")
+    work.splice(work.head_node, urgent)  # Insert the whole urgent list after "a"
+    work.concat(second_half)  # Append the other list; second_half is now empty
+    print("Spliced and concatenated:", list(work), "| length", len(work), "| emptied:", len(urgent), len(second_half))
+    print()
+
+    # Insert a batch of values in one walk; positions refer to the list before the call
+    letters = DoublyLinkedList()
+    for letter in ["a", "c", "e"]:
+        letters.add_to_tail(letter)
+    letters.insert_many([(3, "f"), (1, "b"), (2, "d"), (0, "_")])
+    print("After insert_many:", list(letters), "| length", len(letters))  # ['_', 'a', 'b', 'c', 'd', 'e', 'f']
+    print()
+
+    # Free a long list without the cyclic garbage collector: break the links with clear(), or store the links as indices
+    big_dll = DoublyLinkedList()
+    for value in range(100_000):
+        big_dll.add_to_tail(value)
+    big_dll.clear()  # Every node is freed during the call
+    print("Length after clear:", len(big_dll))
+
+    array_dll = ArrayDoublyLinkedList()  # No node objects: the links are slot numbers in two arrays
+    handles = [array_dll.add_to_tail(value) for value in [1, 2, 3, 4]]
+    array_dll.move_to_front(handles[2])
+    print("Removed through its handle:", array_dll.remove_node(handles[0]))
+    array_dll.add_to_tail(5)  # Reuses the slot of 1 with a new generation
+    print("Forward:", list(array_dll), "| backward:", list(reversed(array_dll)), "| length", len(array_dll))
+    try:
+        array_dll.remove_node(handles[0])  # The handle of 1 does not match the reused slot
+    except ValueError as error:
+        print("Error:", error)
+    del array_dll  # Freed at once by reference counting
+    print()
+
+    # Pickle and copy a long list (the nodes are not pickled one inside the other)
+    long_dll = DoublyLinkedList()
+    for value in range(100_000):
+        long_dll.add_to_tail(value)
+
+    restored_dll = pickle.loads(pickle.dumps(long_dll))
+    print("Restored from pickle:")
+    print(restored_dll.preview(2))
+
+    copied_dll = copy.deepcopy(dll)
+    copied_dll.add_to_head(0)
+    print("Deep copy with 0 added to the head:")
+    print(copied_dll.stringify_list())
+    print("Original:")
+    print(dll.stringify_list())
 
 
 # Output:
@@ -210,6 +821,55 @@ After removing value 7:
 5
 10
 
+Values: [5, 10, 20, 25]
+Preview of 2 values:
+5
+10
+...
+
+Streamed:
+5
+10
+20
+25
+
+Tasks after moving deploy to the front and write to the back: ['deploy', 'review', 'write']
+Removed through its handle: review
+Tasks: ['deploy', 'write']
+After inserting test after deploy: ['deploy', 'test', 'write']
+Error: node is not in this list
+
+Text: helo wrld | length 9
+Edited: Hello world | length 11 | cursor at 11 before None
+
+Split at 3: ['a', 'b', 'c'] ['d', 'e']
+Spliced and concatenated: ['a', 'x', 'y', 'b', 'c', 'd', 'e'] | length 7 | emptied: 0 0
+
+After insert_many: ['_', 'a', 'b', 'c', 'd', 'e', 'f'] | length 7
+
+Length after clear: 0
+Removed through its handle: 1
+Forward: [3, 2, 4, 5] | backward: [5, 4, 2, 3] | length 4
+Error: node is not in this list
+
+Restored from pickle:
+0
+1
+...
+
+Deep copy with 0 added to the head:
+0
+5
+10
+20
+25
+
+Original:
+5
+10
+20
+25
+
 """
 
 # =========================================================================================================================== #
@@ -238,10 +898,10 @@ Let's analyze the **time and space complexity** of the methods in the `DoublyLin
    This is a constant-time operation.
 
 3. **`insert(pos, new_value)`**:
-   - **Time Complexity**: **O(n)**
+   - **Time Complexity**: **O(min(pos, n - pos))**, at most **O(n / 2)**
    
-   - Explanation: In the worst case, inserting at position `pos` requires traversing the list up to `pos` nodes.
-   This makes it linear in the worst case.
+   - Explanation: The list keeps its `length`, so `_node_at` walks from the head for positions in the first half and
+   from the tail for positions in the second half. Positions near either end are fast; the middle is still linear.
 
 4. **`remove_head()`**:
    - **Time Complexity**: **O(1)**
@@ -263,6 +923,60 @@ Let's analyze the **time and space complexity** of the methods in the `DoublyLin
    - **Time Complexity**: **O(n)**
    
    - Explanation: This method traverses the entire list to create a string representation, so it is linear in time.
+   The lines are joined in a single pass with `str.join`; growing the string with `+=` could copy it on every step,
+   which is O(n²).
+
+8. **`__iter__()`, `write_to(fileobj, chunk_size)`, `preview(limit)`**:
+   - **Time Complexity**: **O(n)** for a full traversal or `write_to`, **O(limit)** for `preview`.
+
+9. **Pickling and copying** (`__getstate__`, `__setstate__`, `__reduce__`, `__deepcopy__`):
+   - **Time Complexity**: **O(n)**
+   
+   - Explanation: Saving walks the list once with `__iter__`, and loading calls `add_to_tail` once per value.
+
+10. **Node pool** (`DoublyLinkedList(node_pool=NodePool(Node))`):
+   - **Time Complexity**: **O(1)** per node, the same as without a pool.
+   
+   - Explanation: `_new_node` takes a node from the pool instead of calling `Node(value)`, and `remove_head`,
+   `remove_tail` and `remove_by_value` give the removed node back with `_release_node`.
+
+11. **Node handles** (`remove_node(node)`, `move_to_front(node)`, `move_to_back(node)`, `insert_after(node, value)`):
+   - **Time Complexity**: **O(1)**
+   
+   - Explanation: `add_to_head`, `add_to_tail` and `insert` return the new node. Given that node, `_unlink` reaches
+   both neighbours through `prev_node` and `next_node` and links them to each other, so nothing is searched.
+   `remove_by_value` is O(n) only because it first has to find the node.
+
+12. **Length and cursor** (`__len__()`, `cursor(index)`, `Cursor`):
+   - **Time Complexity**: **O(1)** for `len(dll)` and for `insert`, `delete`, `backspace` and `peek` on a cursor;
+   **O(min(index, n - index))** to open a cursor; **O(|steps|)** for `move`, and `seek` walks from the head, the tail
+   or the cursor, whichever is closest.
+   
+   - Explanation: Every method that adds or removes a node updates `self.length`. A cursor keeps the node right after
+   it, so an edit at the cursor changes a few links and never walks.
+
+13. **`clear()` and `ArrayDoublyLinkedList`**:
+   - **Time Complexity**: **O(n)** for `clear`; **O(1)** for every operation of `ArrayDoublyLinkedList` except
+   iterating, and O(n) for its `clear`, which frees the old columns and finds their highest generation.
+   
+   - Explanation: `clear` visits every node once to cut its links. `ArrayDoublyLinkedList` reads and writes slots of
+   its columns where `DoublyLinkedList` follows and sets node attributes, so each step is the same constant work;
+   checking the generation of a handle is one more array read.
+
+14. **Joining and splitting** (`concat(other)`, `splice(node, other)`, `split_at(pos)`, `split_at_handle(node)`):
+   - **Time Complexity**: **O(1)** for `concat`; **O(min(k, n - k))** for `splice` after the node at index `k`, for
+   `split_at(k)` and for `split_at_handle` of the node at index `k`.
+   
+   - Explanation: Joining links the two ends of the other list in and adds its `length`; the other list is left empty.
+   `splice` first walks from its node to the nearer end, to make sure the node is in this list.
+   Splitting cuts two links in O(1), but `split_at` first walks to the position from the nearer end, and
+   `split_at_handle` counts the nodes on the shorter side of its node to know both new lengths.
+
+15. **`insert_many(pairs)`**:
+   - **Time Complexity**: **O(k log k + n)** for `k` pairs, against **O(k * n)** for `k` calls to `insert`.
+   
+   - Explanation: The positions are sorted, and one walk from the nearer end to the first position and then forward
+   visits every position in order. Each value is then linked in with `add_to_head`, `insert_after` or `add_to_tail`.
 
 ---
 
@@ -303,6 +1017,46 @@ Let's analyze the **time and space complexity** of the methods in the `DoublyLin
    
    - Explanation: The space required for the string representation grows linearly with the number of nodes in the list.
 
+8. **`__iter__()`, `write_to(fileobj, chunk_size)`, `preview(limit)`**:
+   - **Space Complexity**: **O(1)** for `__iter__`, **O(chunk_size)** for `write_to` and **O(limit)** for `preview`.
+   
+   - Explanation: `write_to` only keeps one chunk of lines in memory, so it can write a very long list to a file.
+
+9. **Pickling and copying** (`__getstate__`, `__setstate__`, `__reduce__`, `__deepcopy__`):
+   - **Space Complexity**: **O(n)**
+   
+   - Explanation: The values are saved as a flat list. The call stack stays O(1) deep, while pickling the nodes
+   themselves would need one level of recursion per node.
+
+10. **Node pool** (`node_pool`):
+   - **Space Complexity**: **O(max_free)** for the released nodes the pool keeps.
+   
+   - Explanation: `__slots__` on `Node` stores `value`, `next_node` and `prev_node` without a per-node `__dict__`,
+   so every node is about half the size, with or without a pool.
+
+11. **Node handles** (`remove_node(node)`, `move_to_front(node)`, `move_to_back(node)`, `insert_after(node, value)`):
+   - **Space Complexity**: **O(1)**
+   
+   - Explanation: The handle is the node itself, so keeping handles costs no extra memory in the list.
+
+12. **Length and cursor** (`__len__()`, `cursor(index)`, `Cursor`):
+   - **Space Complexity**: **O(1)**: one counter in the list, and a list, a node and an index in every cursor.
+
+13. **`clear()` and `ArrayDoublyLinkedList`**:
+   - **Space Complexity**: **O(1)** for `clear`; **O(n)** for `ArrayDoublyLinkedList`, about 33 bytes per value (one
+   list slot, two 8-byte indices and an 8-byte generation) against a 56-byte node.
+   
+   - Explanation: Strong links make every pair of neighbours a reference cycle, so a dropped list is only freed by the
+   cyclic garbage collector. `clear` lets reference counting free the nodes right away. `ArrayDoublyLinkedList` has no
+   cycles and no object per value, so the collector neither frees nor visits anything per value.
+
+14. **Joining and splitting**:
+   - **Space Complexity**: **O(1)**: the nodes move between the lists, nothing is copied. The splits create one new
+   `DoublyLinkedList` object to hold the moved nodes.
+
+15. **`insert_many(pairs)`**:
+   - **Space Complexity**: **O(k)** for the sorted order and the returned nodes, besides the `k` new nodes.
+
 ---
 
 ### **Summary**
@@ -311,11 +1065,30 @@ Let's analyze the **time and space complexity** of the methods in the `DoublyLin
 |----------------------|-----------------|------------------|
 | `add_to_head`        | O(1)            | O(1)             |
 | `add_to_tail`        | O(1)            | O(1)             |
-| `insert`             | O(n)            | O(1)             |
+| `insert`             | O(min(pos, n - pos)) | O(1)        |
 | `remove_head`        | O(1)            | O(1)             |
 | `remove_tail`        | O(1)            | O(1)             |
 | `remove_by_value`    | O(n)            | O(1)             |
 | `stringify_list`     | O(n)            | O(n)             |
+| `__iter__`           | O(n)            | O(1)             |
+| `write_to`           | O(n)            | O(chunk_size)    |
+| `preview`            | O(limit)        | O(limit)         |
+| pickle / `deepcopy`  | O(n)            | O(n)             |
+| `_new_node` / `_release_node` (pooled) | O(1) | O(1) |
+| `remove_node`        | O(1)            | O(1)             |
+| `move_to_front`      | O(1)            | O(1)             |
+| `move_to_back`       | O(1)            | O(1)             |
+| `insert_after`       | O(1)            | O(1)             |
+| `__len__`            | O(1)            | O(1)             |
+| `cursor` / `Cursor.seek` | O(min(index, n - index)) | O(1) |
+| `Cursor.move`        | O(steps)        | O(1)             |
+| `Cursor.insert` / `delete` / `backspace` | O(1) | O(1)     |
+| `clear`              | O(n)            | O(1)             |
+| `ArrayDoublyLinkedList` adds, removes, moves | O(1) | O(1)  |
+| `concat`             | O(1)            | O(1)             |
+| `splice`             | O(min(k, n - k)) | O(1)            |
+| `split_at` / `split_at_handle` | O(min(k, n - k)) | O(1)   |
+| `insert_many`        | O(k log k + n)  | O(k)             |
 
 ---
 
@@ -323,10 +1096,11 @@ Let's analyze the **time and space complexity** of the methods in the `DoublyLin
 - Most operations (e.g., `add_to_head`, `add_to_tail`, `remove_head`, `remove_tail`) are **O(1)** in both time and space.
 
 - Traversal-based operations (e.g., `insert`, `remove_by_value`, `stringify_list`) are **O(n)** in time due to the
-need to traverse the list.
+need to traverse the list; `insert` walks from the nearer end, so at most half of it. With a node handle, removing or
+moving any node is **O(1)**, and a `Cursor` makes repeated edits around one position **O(1)** each.
 
 - The space complexity is generally **O(1)** for most operations, except for `stringify_list`, which requires **O(n)**
-space for the output string.
+space for the output string. `write_to` streams the same text with only **O(chunk_size)** extra space.
 
 """
 
@@ -360,6 +1134,7 @@ Unlike a singly linked list, a doubly linked list allows traversal in both direc
 def __init__(self):
     self.head_node = None  
     self.tail_node = None 
+    self.length = 0
 ```
 
 #### **What does this code do?**
@@ -373,6 +1148,10 @@ def __init__(self):
    - The `tail_node` is a reference to the **last node** in the list.
    - When the list is empty, there is no last node, so `tail_node` is set to `None`.
 
+3. **`self.length = 0`**:
+   - The number of nodes. Every method that adds or removes a node updates it, so `len(dll)` is O(1) and `insert`
+     knows which end of the list is closer to a position.
+
 ---
 
 ### **Why are `head_node` and `tail_node` important?**
@@ -508,6 +1287,7 @@ def add_to_head(self, new_value):
     self.head_node = new_head  
     if self.tail_node is None: 
         self.tail_node = new_head
+    return new_head
 ```
 
 ---
@@ -566,6 +1346,13 @@ if self.tail_node is None:
   - The `tail_node` is also updated to point to the new head (`new_head`).
   - This is because the new node is both the first and last node in the list.
 
+#### **Step 6: Return the new node**
+```
+return new_head
+```
+- The node is returned as a **handle**: keeping it lets `remove_node`, `move_to_front` and `move_to_back` reach it
+  in O(1) later, without searching the list. `add_to_tail` and `insert` return their new node the same way.
+
 ---
 
 ### **Example Walkthrough**
@@ -659,102 +1446,67 @@ If the position is `0`, it adds the node to the head. If the position is beyond
 ### **Code Breakdown**
 
 ```
-def insert(self, pos, new_value):
-    if pos == 0:  
-        self.add_to_head(new_value)
-    else:
+def _node_at(self, index):
+    if index < self.length // 2:
         current_node = self.head_node
-        for i in range(pos - 1):
-            if current_node is None or current_node.get_next_node() is None:
-                self.add_to_tail(new_value)
-                return
+        for _ in range(index):
             current_node = current_node.get_next_node()
-        new_node = Node(new_value)
-        new_node.set_next_node(current_node.get_next_node())
-        new_node.set_prev_node(current_node)
-        if current_node.get_next_node() is not None:
-            current_node.get_next_node().set_prev_node(new_node)
-        current_node.set_next_node(new_node)
-        if new_node.get_next_node() is None:
-            self.tail_node = new_node
+    else:
+        current_node = self.tail_node
+        for _ in range(self.length - 1 - index):
+            current_node = current_node.get_prev_node()
+    return current_node
+
+def insert(self, pos, new_value):
+    if pos <= 0 or self.head_node is None:
+        return self.add_to_head(new_value)
+    if pos >= self.length:
+        return self.add_to_tail(new_value)
+    return self.insert_after(self._node_at(pos - 1), new_value)
 ```
 
 ---
 
 ### **Step-by-Step Explanation**
 
-#### **Step 1: Check if the position is 0**
+#### **Step 1: Check if the position is 0 or the list is empty**
 ```
-if pos == 0:
-    self.add_to_head(new_value)
+if pos <= 0 or self.head_node is None:
+    return self.add_to_head(new_value)
 ```
 - If the position (`pos`) is `0`, the new node should be inserted at the **head** of the list.
+- In an empty list every position is the head, and there is no node to walk from.
 - The `add_to_head` method is called to handle this case.
 
 ---
 
-#### **Step 2: Traverse to the correct position**
+#### **Step 2: Positions at or beyond the end**
 ```
-else:
-    current_node = self.head_node
-    for i in range(pos - 1):
-        if current_node is None or current_node.get_next_node() is None:
-            self.add_to_tail(new_value)
-            return
-        current_node = current_node.get_next_node()
+if pos >= self.length:
+    return self.add_to_tail(new_value)
 ```
-- If the position is not `0`, we need to traverse the list to find the node **just before** the desired position.
-- Start from the `head_node` and move forward `(pos - 1)` steps.
-- If at any point:
-  - `current_node` becomes `None` (end of the list is reached), or
-  - `current_node.get_next_node()` is `None` (next node doesn't exist),
-- It means the position is beyond the list's length. In this case, the new node is added to the **tail** using `add_to_tail`.
+- `self.length` is the number of nodes, so a position equal to it or larger means "after the last node".
+- The new node is added to the **tail** with `add_to_tail`, without walking at all.
 
 ---
 
-#### **Step 3: Create the new node**
+#### **Step 3: Find the node before the position, from the nearer end**
 ```
-new_node = Node(new_value)
+self._node_at(pos - 1)
 ```
-- A new node is created with the given `new_value`.
+- The new node goes right after the node at index `pos - 1`.
+- `_node_at(index)` walks `index` steps forward from the head when the index is in the first half of the list, and
+  `length - 1 - index` steps backward from the tail otherwise. No position is more than half the list away.
 
 ---
 
-#### **Step 4: Link the new node to its neighbors**
+#### **Step 4: Link the new node in**
 ```
-new_node.set_next_node(current_node.get_next_node())
-new_node.set_prev_node(current_node)
+return self.insert_after(node, new_value)
 ```
-- Set the `next_node` of the new node to the node that currently comes after `current_node`.
-- Set the `prev_node` of the new node to `current_node`.
-
----
-
-#### **Step 5: Update the previous node's `next_node`**
-```
-if current_node.get_next_node() is not None:
-    current_node.get_next_node().set_prev_node(new_node)
-```
-- If the node after `current_node` exists:
-  - Update its `prev_node` to point to the new node.
-
----
-
-#### **Step 6: Update `current_node`'s `next_node`**
-```
-current_node.set_next_node(new_node)
-```
-- Set the `next_node` of `current_node` to the new node.
-
----
-
-#### **Step 7: Update the tail if necessary**
-```
-if new_node.get_next_node() is None:
-    self.tail_node = new_node
-```
-- If the new node's `next_node` is `None`, it means the new node is now the **last node** in the list.
-- Update the `tail_node` to point to the new node.
+- `insert_after` links the new node between `node` and its next node, in O(1), and adds 1 to `self.length` (see
+  **Node Handles** below).
+- The new node is returned as a handle, like `add_to_head` and `add_to_tail` return theirs.
 
 ---
 
@@ -763,56 +1515,38 @@ if new_node.get_next_node() is None:
 Let's walk through an example to see how this works.
 
 #### **Initial State**
-- The list contains the following nodes:
+- The list contains the following nodes (`length = 4`):
   ```
-  head_node -> [1] <-> [3] <- tail_node
+  head_node -> [1] <-> [2] <-> [3] <-> [5] <- tail_node
   ```
 
 ---
 
-#### **Step 1: Insert `2` at position 1**
+#### **Step 1: Insert `4` at position 3**
 ```
-dll.insert(1, 2)
+dll.insert(3, 4)
 ```
-1. Since `pos = 1` (not `0`), we start traversing from the `head_node` (`[1]`).
-2. Move forward `(pos - 1) = 0` steps, so `current_node` remains `[1]`.
-3. Create a new node with `value = 2`.
-4. Link the new node:
-   - `new_node.set_next_node(current_node.get_next_node())`:
-     - `next_node` of `[2]` is set to `[3]`.
-   - `new_node.set_prev_node(current_node)`:
-     - `prev_node` of `[2]` is set to `[1]`.
-5. Update the `next_node` of `[1]` to point to `[2]`.
-6. Update the `prev_node` of `[3]` to point to `[2]`.
-7. Since `new_node.get_next_node()` is `[3]` (not `None`), the `tail_node` is not updated.
+1. `pos = 3` is neither `0` nor beyond the end (`3 < 4`).
+2. The node before the position has index `2`. Since `2 >= length // 2`, `_node_at` starts at the tail (`[5]`) and
+   walks `4 - 1 - 2 = 1` step backward, to `[3]`.
+3. `insert_after([3], 4)` links the new node between `[3]` and `[5]`, and `length` becomes `5`.
 
 The list now looks like this:
 ```
-head_node -> [1] <-> [2] <-> [3] <- tail_node
+head_node -> [1] <-> [2] <-> [3] <-> [4] <-> [5] <- tail_node
 ```
 
 ---
 
-#### **Step 2: Insert `4` at position 3**
+#### **Step 2: Insert `6` at position 10**
 ```
-dll.insert(3, 4)
+dll.insert(10, 6)
 ```
-1. Since `pos = 3` (not `0`), we start traversing from the `head_node` (`[1]`).
-2. Move forward `(pos - 1) = 2` steps:
-   - Step 1: `current_node = [1]` -> `current_node = [2]`.
-   - Step 2: `current_node = [2]` -> `current_node = [3]`.
-3. Create a new node with `value = 4`.
-4. Link the new node:
-   - `new_node.set_next_node(current_node.get_next_node())`:
-     - `next_node` of `[4]` is set to `None` (since `[3]` is the tail).
-   - `new_node.set_prev_node(current_node)`:
-     - `prev_node` of `[4]` is set to `[3]`.
-5. Update the `next_node` of `[3]` to point to `[4]`.
-6. Since `new_node.get_next_node()` is `None`, update the `tail_node` to point to `[4]`.
+1. `10 >= length`, so `add_to_tail(6)` appends the node without walking.
 
 The list now looks like this:
 ```
-head_node -> [1] <-> [2] <-> [3] <-> [4] <- tail_node
+head_node -> [1] <-> [2] <-> [3] <-> [4] <-> [5] <-> [6] <- tail_node
 ```
 
 ---
@@ -822,13 +1556,20 @@ head_node -> [1] <-> [2] <-> [3] <-> [4] <- tail_node
    - Calls `add_to_head` to insert the node at the head.
 
 2. **Inserting at a specific position**:
-   - Traverses the list to find the correct position.
-   - Links the new node to its neighbors.
-   - Updates the `tail_node` if the new node is inserted at the end.
+   - Walks from whichever end is closer to the position, at most half of the list.
+   - Links the new node to its neighbors with `insert_after`.
 
 3. **Handling out-of-bounds positions**:
    - If the position is beyond the list's length, the node is added to the tail using `add_to_tail`.
 
+4. **Many edits at one position**:
+   - Each `insert(pos, ...)` walks again. A `Cursor` (see **Length and Cursor** below) walks once and then edits
+     in O(1).
+
+5. **Many values at scattered positions**:
+   - `insert_many(pairs)` takes `(position, value)` pairs and inserts them all in one walk (see **Inserting a Batch**
+     below).
+
 # =========================================================================================================================== #
 
                                         *** remove_head() method: ***
@@ -1209,13 +1950,7 @@ def remove_by_value(self, value_to_remove):
             elif current_node == self.tail_node: 
                 return self.remove_tail()
             else:  # Middle of the list
-                prev_node = current_node.get_prev_node()
-                next_node = current_node.get_next_node()
-                if prev_node:
-                    prev_node.set_next_node(next_node)
-                if next_node:
-                    next_node.set_prev_node(prev_node)
-                return value_to_remove  
+                return self.remove_node(current_node)
         current_node = current_node.get_next_node()
     return None  
 ```
@@ -1271,21 +2006,14 @@ elif current_node == self.tail_node:
 #### **Step 6: Handle removal of a middle node**
 ```
 else:
-    prev_node = current_node.get_prev_node()
-    next_node = current_node.get_next_node()
-
-    if prev_node:
-        prev_node.set_next_node(next_node)
-    if next_node:
-        next_node.set_prev_node(prev_node)
-
-    return value_to_remove
+    return self.remove_node(current_node)
 ```
-- If the node to be removed is in the **middle** of the list:
+- If the node to be removed is in the **middle** of the list, `remove_node` unlinks it (see
+  **Node Handles** below):
   1. Get the `prev_node` and `next_node` of the current node.
   2. Update the `next_node` of `prev_node` to point to `next_node`.
   3. Update the `prev_node` of `next_node` to point to `prev_node`.
-  4. This effectively removes the current node from the list.
+  4. Clear the links of the removed node, so it no longer refers to the list.
   5. Return the value of the removed node.
 
 ---
@@ -1411,177 +2139,495 @@ The `stringify_list` method converts the doubly linked list into a **string repr
 ### **Code Breakdown**
 
 ```
-def stringify_list(self):
-    string_list = ""  
-    current_node = self.head_node  # Start from the head of the list
-    while current_node:
-        if current_node.get_value() is not None:
-            string_list += str(current_node.get_value()) + "\n"
+def __iter__(self):
+    current_node = self.head_node
+
+    while current_node:  # Yield the values from head to tail
+        yield current_node.get_value()
         current_node = current_node.get_next_node()
-    return string_list  
+
+def stringify_list(self):
+    # Join all the lines in a single pass instead of growing a string with +=
+    return "".join(str(value) + "\n" for value in self if value is not None)
 ```
 
 ---
 
 ### **Step-by-Step Explanation**
 
-#### **Step 1: Initialize an empty string**
+#### **Step 1: Walk the list with `__iter__`**
+- `__iter__` is a generator: it starts at `head_node` and yields each value, following `next_node` until it reaches
+  `None`.
+- Because the class is iterable, it also works with `for value in dll`, `list(dll)` and any function that takes an
+  iterable.
+
+---
+
+#### **Step 2: Turn every value into a line**
 ```
-string_list = ""
+str(value) + "\n" for value in self if value is not None
 ```
-- `string_list` is initialized as an empty string. This will store the final string representation of the list.
+- Each value is converted to a string and followed by a newline character (`\n`).
+- Values that are `None` are skipped.
 
 ---
 
-#### **Step 2: Start from the head of the list**
+#### **Step 3: Join the lines once**
 ```
-current_node = self.head_node
+"".join(...)
 ```
-- `current_node` is set to the `head_node` of the list. This is the starting point for traversing the list.
+- `join` collects all the lines, adds up their lengths and copies each line **once** into the final string.
+- Growing a string with `string_list += ...` inside the loop can copy everything built so far on every step, because
+  Python strings are immutable. For `n` nodes that is about `n²/2` copied characters, which becomes very slow on a long
+  list. `join` does the same job in **linear** time.
 
 ---
 
-#### **Step 3: Traverse the list**
+### **Streaming and Previewing**
+
 ```
-while current_node:
+def write_to(self, fileobj, chunk_size=1024):
+    lines = (str(value) + "\n" for value in self if value is not None)
+
+    while True:  # Write `chunk_size` lines at a time, never building the whole string
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            break
+        fileobj.write("".join(chunk))
+
+def preview(self, limit):
+    lines = list(islice((str(value) + "\n" for value in self if value is not None), limit + 1))
+
+    if len(lines) > limit:  # Stop after `limit` lines and mark that more follow
+        lines[limit:] = ["...\n"]
+
+    return "".join(lines)
 ```
-- Use a `while` loop to traverse the list until the end (`current_node` becomes `None`).
+- `write_to` writes exactly the same text as `stringify_list` to any object with a `write()` method (an open file,
+  `io.StringIO`, ...). `islice` takes the next `chunk_size` lines from the generator, so only one chunk is in memory at
+  a time.
+- `preview` stops the traversal after `limit + 1` values. The extra value tells it whether more values follow, in which
+  case it is replaced by `"...\n"`. It costs O(limit), however long the list is.
 
 ---
 
-#### **Step 4: Append the current node's value to the string**
+### **Key Points**
+1. **Traversing the list**:
+   - `__iter__` starts from the `head_node` and moves to the next node until the end of the list.
+
+2. **Building the string in one pass**:
+   - Each value becomes one line, and `join` builds the result without repeated copying.
+
+3. **Handling `None` values**:
+   - If a node's value is `None`, it is skipped and not added to the string.
+
+4. **Large lists**:
+   - Use `write_to` to send a long list to a file without building one huge string, and `preview` to look at its first
+     values.
+
+---
+
+### **Example Output**
+For the list:
 ```
-if current_node.get_value() is not None:
-    string_list += str(current_node.get_value()) + "\n"
+head_node -> [1] <-> [2] <-> [3] <- tail_node
+```
+The output of `stringify_list` will be:
+```
+1
+2
+3
 ```
-- If the current node's value is not `None`:
-  - Convert the value to a string using `str()`.
-  - Append the value to `string_list`, followed by a newline character (`\n`).
+ 
+# =========================================================================================================================== #
+
+                          *** Pickling and copying: __getstate__, __setstate__, __reduce__, __deepcopy__ ***
+
+### **Why the Default Fails**
+By default, `pickle` and `copy.deepcopy` save an object by saving its attributes. `head_node` is a `Node` whose
+`next_node` is another `Node` (and whose `prev_node` points back), so saving the list goes **one level deeper for
+every node**. A list with more than about 1,000 nodes raises `RecursionError`.
 
 ---
 
-#### **Step 5: Move to the next node**
+### **Code Breakdown**
+
 ```
-current_node = current_node.get_next_node()
+def __getstate__(self):
+    return list(self)  # Values from head to tail, used by pickle and copy
+
+def __setstate__(self, values):
+    for value in values:  # Rebuild the nodes one at a time
+        self.add_to_tail(value)
+
+def __reduce__(self):
+    return self.__class__, (), self.__getstate__()
 ```
-- Update `current_node` to the next node in the list using `get_next_node()`.
+- `__reduce__` tells `pickle` to save only the class and a **flat list of values**. When loading, `pickle` creates an
+  empty `DoublyLinkedList()` and passes the values to `__setstate__`, which links both directions with `add_to_tail`.
+- `copy.copy` also goes through `__reduce__`, so a shallow copy gets new nodes holding the same values.
 
----
+```
+def __deepcopy__(self, memo):
+    copied = self.__class__()
+    memo[id(self)] = copied
 
-#### **Step 6: Return the final string**
+    for value in self:
+        copied.add_to_tail(copy.deepcopy(value, memo))
+
+    return copied
 ```
-return string_list
+- The new list is put in `memo` first, so a value that refers back to the list points to the copy.
+- Each value is deep-copied on its own; the nodes are created fresh, so the recursion depth does not depend on the
+  length of the list.
+- The copy is built without a `node_pool`: the pool is shared with the original list, not part of its value.
+
+# =========================================================================================================================== #
+
+                                    *** Recycling Nodes: node_pool, _new_node, _release_node ***
+
+A list that grows and shrinks all the time creates a node for every insert and drops one for every removal.
+With `DoublyLinkedList(node_pool=pool)`, where `pool = NodePool(Node)` from the `01-Nodes` folder, removed nodes are
+kept and handed out again:
+
 ```
-- After the loop ends, return the `string_list` containing all the node values, each on a new line.
+def _new_node(self, value):
+    return Node(value) if self.node_pool is None else self.node_pool.acquire(value)  # New or recycled node
 
----
+def _release_node(self, node):
+    if self.node_pool is not None:  # Give an unlinked node back to the pool; nothing may refer to it any more
+        self.node_pool.release(node)
+```
+- `add_to_head`, `add_to_tail` and `insert` create their nodes with `_new_node`. A recycled node gets its new value
+  from `Node.reset`, which also clears both of its links.
+- `remove_head`, `remove_tail` and `remove_by_value` read the value of the removed node first and then release it;
+  `release` resets the node to `None`, so the pool keeps no removed value alive.
+- A released node is reused for another value, so code outside the list must not keep a reference to a removed node.
+- `pool_benchmark.py` in the `01-Nodes` folder measures allocations and garbage collections with and without a pool.
 
-### **Example Walkthrough**
+# =========================================================================================================================== #
 
-Let's walk through an example to see how this works.
+                              *** Node Handles: remove_node, move_to_front, move_to_back ***
 
-#### **Initial State**
-- The list contains the following nodes:
-  ```
-  head_node -> [1] <-> [2] <-> [3] <- tail_node
-  ```
+Every node knows both of its neighbours, so once you have the node, unlinking it takes a constant number of steps.
+`add_to_head`, `add_to_tail` and `insert` return the node they create, to be kept as a **handle**:
 
----
+```
+def _check_linked(self, node):
+    if (node.get_prev_node() is None and node is not self.head_node) or (
+        node.get_next_node() is None and node is not self.tail_node
+    ):
+        raise ValueError("node is not in this list")
+
+def _unlink(self, node):
+    self._check_linked(node)
+    prev_node = node.get_prev_node()
+    next_node = node.get_next_node()
+
+    if prev_node is not None:
+        prev_node.set_next_node(next_node)
+    else:
+        self.head_node = next_node
+
+    if next_node is not None:
+        next_node.set_prev_node(prev_node)
+    else:
+        self.tail_node = prev_node
+
+    node.set_prev_node(None)
+    node.set_next_node(None)
+```
+- Only the head has no `prev_node` and only the tail has no `next_node`. A node that lacks a neighbour without being
+  the head or the tail has already been removed, so `_check_linked` raises `ValueError` instead of letting `_unlink`
+  cut the list apart.
+- The removed node's own links are cleared, so a stale handle is recognized the next time it is used.
+- `_unlink` cannot tell a node of **another** list from one of this list in O(1); a handle must only be used with the
+  list that returned it.
 
-#### **Step 1: Initialize `string_list`**
 ```
-string_list = ""
+def remove_node(self, node):
+    self._unlink(node)
+    removed_value = node.get_value()
+    self._release_node(node)
+    return removed_value
 ```
+- Removes the node and returns its value, like `remove_by_value` but without the search.
 
----
+```
+def move_to_front(self, node):
+    if node is not self.head_node:
+        self._unlink(node)
+        node.set_next_node(self.head_node)
+        self.head_node.set_prev_node(node)
+        self.head_node = node
+    return node
+```
+- The node is unlinked from its place and linked in again before the head; the same node object stays in the list,
+  so the handle remains valid. `move_to_back` does the same at the tail.
+- These are the building blocks of an LRU cache or a scheduler: move an entry to the front on every use, remove
+  entries from the back, both in O(1).
 
-#### **Step 2: Start from the head**
 ```
-current_node = self.head_node  # current_node = [1]
+def insert_after(self, node, new_value):
+    self._check_linked(node)
+    if node is self.tail_node:
+        return self.add_to_tail(new_value)
+
+    new_node = self._new_node(new_value)
+    next_node = node.get_next_node()
+    new_node.set_prev_node(node)
+    new_node.set_next_node(next_node)
+    next_node.set_prev_node(new_node)
+    node.set_next_node(new_node)
+    return new_node
 ```
+- Inserts a value right after a node in O(1), where `insert(pos, ...)` has to walk to the position first. The
+  new node is returned as a handle too; `insert` itself ends with a call to `insert_after`. An LFU cache uses it
+  to place a new frequency bucket right after the current one.
 
----
+**Example:**
+```
+tasks = DoublyLinkedList()
+write = tasks.add_to_tail("write")
+review = tasks.add_to_tail("review")
+deploy = tasks.add_to_tail("deploy")
+tasks.move_to_front(deploy)   # deploy <-> write <-> review
+tasks.move_to_back(write)     # deploy <-> review <-> write
+tasks.remove_node(review)     # deploy <-> write
+tasks.insert_after(deploy, "test")  # deploy <-> test <-> write
+```
 
-#### **Step 3: Traverse the list**
-1. **First iteration**:
-   - `current_node = [1]`
-   - Append `1` to `string_list`:
-     ```
-     string_list = "1\n"
-     ```
-   - Move to the next node:
-     ```
-     current_node = [2]
-     ```
+# =========================================================================================================================== #
 
-2. **Second iteration**:
-   - `current_node = [2]`
-   - Append `2` to `string_list`:
-     ```
-     string_list = "1\n2\n"
-     ```
-   - Move to the next node:
-     ```
-     current_node = [3]
-     ```
+                              *** Length and Cursor: __len__, cursor, Cursor ***
 
-3. **Third iteration**:
-   - `current_node = [3]`
-   - Append `3` to `string_list`:
-     ```
-     string_list = "1\n2\n3\n"
-     ```
-   - Move to the next node:
-     ```
-     current_node = None
-     ```
+`self.length` counts the nodes: `add_to_head`, `add_to_tail` and `insert_after` add 1, and `remove_head`,
+`remove_tail` and `remove_node` take 1 away (`remove_by_value` and `insert` go through them). `len(dll)` returns it
+in O(1), and `_node_at` uses it to walk from the nearer end.
 
----
+A **cursor** is a position **between** two values, like the caret of a text editor. `dll.cursor(index)` creates one
+with `index` values before it:
 
-#### **Step 4: Return the final string**
 ```
-return string_list
+class Cursor:
+    def __init__(self, dll, index=0):
+        self.dll = dll
+        self.index = 0
+        self.node = dll.head_node  # The node right after the cursor; None at the end of the list
+        self.seek(index)
 ```
-- The final value of `string_list` is:
-  ```
-  "1\n2\n3\n"
-  ```
-- When printed, it will look like:
-  ```
-  1
-  2
-  3
-  ```
+- `self.node` is the node after the cursor and `self.index` the number of values before it. At the end of the list
+  `self.node` is `None`, and the value before the cursor is `self.dll.tail_node`.
+- `seek(index)` starts from the head, the tail or the cursor's own position, whichever is closest, and steps with
+  `move(steps)`. `move` stops at either end of the list and returns the new index.
 
----
+```
+def insert(self, new_value):
+    if self.node is None:
+        new_node = self.dll.add_to_tail(new_value)
+    elif self.node is self.dll.head_node:
+        new_node = self.dll.add_to_head(new_value)
+    else:
+        new_node = self.dll.insert_after(self.node.get_prev_node(), new_value)
 
-### **Key Points**
-1. **Traversing the list**:
-   - The method starts from the `head_node` and moves to the next node until the end of the list (`current_node` becomes `None`).
+    self.index += 1
+    return new_node
+```
+- The new value goes before `self.node`, and the cursor ends up after it, as when typing. Nothing is walked.
+- `delete()` removes the value after the cursor (the Delete key) and `backspace()` the value before it (the Backspace
+  key); both use `remove_node` and return the removed value, or `None` if there is nothing to remove.
+- `peek()` returns the value after the cursor without moving.
+- The cursor only tracks edits made through it. After adding or removing values through the list itself, its
+  `index` (or its end-of-list position) can be out of date; create a new cursor then.
 
-2. **Appending values to the string**:
-   - Each node's value is converted to a string and appended to `string_list`, followed by a newline character (`\n`).
+**Example:**
+```
+text = DoublyLinkedList()            # h e l o   w r l d
+cursor = text.cursor(3)              # hel|o wrld
+cursor.insert("l")                   # hell|o wrld
+cursor.move(3)                       # hello w|rld
+cursor.insert("o")                   # hello wo|rld
+```
+- `cursor_benchmark.py` measures 1,000 edits at one position of a 20,000-value list: the cursor is 75 to 865 times
+  faster than `insert(pos, ...)`, and walking from the nearer end makes `insert` about 10 times faster near the tail.
 
-3. **Handling `None` values**:
-   - If a node's value is `None`, it is skipped and not added to the string.
+# =========================================================================================================================== #
 
-4. **Returning the result**:
-   - The method returns the final string representation of the list.
+                              *** Freeing Nodes Without the Garbage Collector: clear, ArrayDoublyLinkedList ***
 
----
+A node points to its next node and the next node points back, so every pair of neighbours is a **reference cycle**.
+Reference counting cannot free a cycle: after `del dll` the nodes stay in memory until CPython's cyclic garbage
+collector runs and finds them, all at once and at a moment nobody chose.
 
-### **Example Output**
-For the list:
 ```
-head_node -> [1] <-> [2] <-> [3] <- tail_node
+def clear(self):
+    current_node = self.head_node
+
+    while current_node is not None:
+        next_node = current_node.get_next_node()
+        current_node.set_next_node(None)
+        current_node.set_prev_node(None)
+        self._release_node(current_node)
+        current_node = next_node
+
+    self.head_node = None
+    self.tail_node = None
+    self.length = 0
 ```
-The output of `stringify_list` will be:
+- `clear` cuts both links of every node, O(n). Once the list forgets `head_node`, nothing refers to the nodes any
+  more and reference counting frees them during the call. With a pool, the nodes go back to the pool instead.
+
+Cutting the cycles does not shorten the collections that run while the list is alive: a full collection visits
+every tracked object, cycle or not, and every node is one. `ArrayDoublyLinkedList` keeps the same links without any
+node objects:
+
 ```
-1
-2
-3
+def __init__(self):
+    self.values = []
+    self.next_indices = array("q")
+    self.prev_indices = array("q")
+    self.generations = array("q")
+
+    self.head_index = NULL_INDEX
+    self.tail_index = NULL_INDEX
+    self.free_index = NULL_INDEX
+    self.first_generation = 0
+    self.length = 0
+```
+- Slot `i` holds one value: `values[i]`, the slot after it in `next_indices[i]` and the slot before it in
+  `prev_indices[i]`. `NULL_INDEX` (-1) plays the part of `None`. The links are plain ints in typed arrays, so there
+  are no references between values at all, and no cycles.
+- The collector sees a few containers, whatever the length. On 1,000,000 values `gc_benchmark.py` measures a full
+  collection at 0.01 s against 0.10 s with nodes, no collection at all while the list is built, and 0.015 s to free
+  it with `del`.
+- `add_to_head`, `add_to_tail` and `insert_after` return a handle for `remove_node`, `move_to_front`,
+  `move_to_back`, `insert_after` and `get_value`, all O(1) like their node versions.
+- A removed slot goes on a free list, chained through `next_indices`, and is reused by the next insert. The handle
+  is one int, `generations[slot] << SLOT_BITS | slot`, and removing a value adds 1 to the generation of its slot. A
+  handle kept after its value was removed therefore raises `ValueError`, also once the slot holds a new value,
+  instead of reaching that new value.
+- `clear` simply starts over with new columns: dropping the old ones frees every value without walking any links.
+  New slots start at `first_generation`, one above every generation used before, so older handles stay invalid.
+- The API is smaller than `DoublyLinkedList`'s: the adds, removals and moves above, `len`, iteration in both
+  directions and `clear`. There is no `insert` by position, `insert_many`, `remove_by_value`, `stringify_list`,
+  `write_to`, `preview`, cursor, `concat`, `splice`, `split_at` or node pool. Joining or splitting would copy the
+  moved slots into the other list's columns, O(k) instead of O(1). `pickle` and `copy.deepcopy` work through the
+  default attribute copy: the columns are flat, so nothing recurses.
+
+# =========================================================================================================================== #
+
+                              *** Joining and Splitting Lists: concat, splice, split_at, split_at_handle ***
+
+Moving a list into another with `remove_head` and `add_to_tail` frees one node and creates another for every value.
+The nodes can move as they are: only the links at the ends of the moved part change.
+
 ```
- 
+def _take_all(self, other):
+    if other is self:
+        raise ValueError("cannot join a list with itself")
+
+    first_node, last_node, count = other.head_node, other.tail_node, other.length
+    other.head_node = None
+    other.tail_node = None
+    other.length = 0
+    return first_node, last_node, count
+
+def concat(self, other):
+    first_node, last_node, count = self._take_all(other)
+    if first_node is None:
+        return self
+
+    if self.tail_node is None:
+        self.head_node = first_node
+    else:
+        self.tail_node.set_next_node(first_node)
+        first_node.set_prev_node(self.tail_node)
+
+    self.tail_node = last_node
+    self.length += count
+    return self
+```
+- `_take_all` empties the other list and hands over its two ends and its length. Afterwards `other` is a valid,
+  empty list, so no node belongs to two lists.
+- Joining a list with itself would create a loop, so it raises `ValueError`.
+- `concat` links the ends in O(1) and returns `self`, so calls can be chained: `a.concat(b).concat(c)`.
+- `splice(node, other)` does the same in the middle: the whole other list goes between `node` and its next node.
+- A node of `other` would link `other` into itself and corrupt both lists. `_check_linked` only catches nodes
+  without a neighbour, so `splice` calls `_check_owned`: it steps from `node` towards both ends at once, and the first
+  end it reaches must be this list's head or tail, or `ValueError` is raised. That takes O(min(k, n - k)) steps for
+  the node at index `k`, and none at either end; the relinking itself stays O(1).
+
+```
+def _split_before(self, node, moved):
+    tail_part = self.__class__(self.node_pool)
+    tail_part.head_node = node
+    tail_part.tail_node = self.tail_node
+    tail_part.length = moved
+
+    prev_node = node.get_prev_node()
+    node.set_prev_node(None)
+    if prev_node is None:
+        self.head_node = None
+    else:
+        prev_node.set_next_node(None)
+    self.tail_node = prev_node
+    self.length -= moved
+    return tail_part
+```
+- Cutting the list before `node` changes two links. The new list starts at `node`, ends at the old tail, and shares
+  the node pool of the original.
+- `split_at(pos)` finds the node with `_node_at(pos)`, walking from the nearer end, and knows that `length - pos`
+  nodes move. `split_at_handle(node)` has no position, so it walks forward and backward from the node in step until
+  one side ends: that side's count is exact, and the other is `length` minus it.
+- Node handles stay valid, since the nodes themselves move; a cursor on either list must be opened again.
+- `splice_benchmark.py` shards 200,000 values into 2 to 64 lists and merges them back: 25 to 66 times faster than
+  moving the values one by one, with the merges taking microseconds.
+
+# =========================================================================================================================== #
+
+                                        *** Inserting a Batch: insert_many ***
+
+Inserting `k` values with `insert` walks the list `k` times. When all the values are known at once, as when a batch
+of patches is applied, the positions can be sorted and visited in a single walk.
+
+```
+def insert_many(self, pairs):
+    pairs = list(pairs)
+    positions = [min(max(pos, 0), self.length) for pos, _ in pairs]
+    order = sorted(range(len(pairs)), key=positions.__getitem__)
+    new_nodes = [None] * len(pairs)
+    if not pairs:
+        return new_nodes
+
+    index = positions[order[0]]
+    next_node = self._node_at(index) if index < self.length else None
+
+    for i in order:
+        new_value = pairs[i][1]
+        while index < positions[i]:
+            next_node = next_node.get_next_node()
+            index += 1
+
+        if next_node is None:
+            new_nodes[i] = self.add_to_tail(new_value)
+        elif next_node is self.head_node:
+            new_nodes[i] = self.add_to_head(new_value)
+        else:
+            new_nodes[i] = self.insert_after(next_node.get_prev_node(), new_value)
+    return new_nodes
+```
+- Positions refer to the list **before** the call: `(2, x)` puts `x` in front of the value that was at index 2. They
+  are clamped like in `insert`, so negative positions go to the head and positions past the end to the tail.
+- `order` sorts the pairs by position with a stable sort, so values for the same position keep the order in which
+  they were given.
+- `next_node` is the original node at `index`. Every new value goes in right before it, so later positions never
+  shift: the walk only ever steps over original nodes and needs no offset.
+- The walk starts with `_node_at`, from whichever end is closer to the first position, and only moves forward. The
+  whole batch costs O(k log k) for the sort plus at most one walk of the list.
+- The new nodes are returned in the order of `pairs`, as handles like those of `insert`.
+- `insert_many_benchmark.py` inserts 10 to 1,000 values into a list of 200,000: 1.5 to 160 times faster than
+  calling `insert` for each value.
+
 # =========================================================================================================================== #
 
                               *** Creating a New Doubly Linked List ***
@@ -0,0 +1,116 @@
+# Benchmark: sharding a DoublyLinkedList into equal parts and merging them back, moving one value at a time
+# (remove_head + add_to_tail) against split_at and concat
+
+import time
+
+from main import DoublyLinkedList
+
+SIZE = 200_000
+SHARD_COUNTS = [2, 8, 64]
+
+
+def shard_by_value(work, shards):
+    # Move every value into a new list of its own shard, one remove_head and one add_to_tail per value
+    shard_size = len(work) // shards
+    parts = []
+    for index in range(shards):
+        part = DoublyLinkedList()
+        for _ in range(shard_size if index < shards - 1 else len(work)):
+            part.add_to_tail(work.remove_head())
+        parts.append(part)
+    return parts
+
+
+def merge_by_value(work, parts):
+    for part in parts:
+        while part.head_node is not None:
+            work.add_to_tail(part.remove_head())
+
+
+def shard_by_split(work, shards):
+    # Cut shards off the end of the list; split_at walks to the cut from the nearer end and relinks two nodes
+    shard_size = len(work) // shards
+    parts = []
+    for _ in range(shards - 1):
+        parts.append(work.split_at(len(work) - shard_size))
+    parts.append(work.split_at(0))
+    parts.reverse()
+    return parts
+
+
+def merge_by_concat(work, parts):
+    for part in parts:
+        work.concat(part)
+
+
+def measure(shard, merge, shards):
+    work = DoublyLinkedList()
+    for value in range(SIZE):
+        work.add_to_tail(value)
+
+    start = time.perf_counter()
+    parts = shard(work, shards)
+    shard_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merge(work, parts)
+    merge_time = time.perf_counter() - start
+
+    assert len(work) == SIZE and work.head_node.get_value() == 0 and work.tail_node.get_value() == SIZE - 1
+    return shard_time, merge_time
+
+
+if __name__ == "__main__":
+    print(f"{SIZE:,} values")
+    print(f"{'Shards':>6} | {'Method':<25} | {'Shard (s)':>9} | {'Merge (s)':>9} | {'Speedup':>8}")
+    print("-" * 70)
+
+    for shards in SHARD_COUNTS:
+        by_value = measure(shard_by_value, merge_by_value, shards)
+        by_links = measure(shard_by_split, merge_by_concat, shards)
+        for name, (shard_time, merge_time) in [
+            ("remove_head + add_to_tail", by_value),
+            ("split_at + concat", by_links),
+        ]:
+            speedup = sum(by_value) / (shard_time + merge_time)
+            print(f"{shards:>6} | {name:<25} | {shard_time:>9.4f} | {merge_time:>9.6f} | {speedup:>7,.0f}x")
+        print("-" * 70)
+
+
+# Output:
+
+"""
+200,000 values
+Shards | Method                    | Shard (s) | Merge (s) |  Speedup
+----------------------------------------------------------------------
+     2 | remove_head + add_to_tail |    0.1578 |  0.238524 |       1x
+     2 | split_at + concat         |    0.0060 |  0.000011 |      66x
+----------------------------------------------------------------------
+     8 | remove_head + add_to_tail |    0.2164 |  0.246957 |       1x
+     8 | split_at + concat         |    0.0129 |  0.000030 |      36x
+----------------------------------------------------------------------
+    64 | remove_head + add_to_tail |    0.1583 |  0.174722 |       1x
+    64 | split_at + concat         |    0.0134 |  0.000050 |      25x
+----------------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11. Moving values one at a time costs the same per value however the list is cut: two
+method calls, a node freed and a node created, about 1 microsecond per value for sharding and again for merging.
+
+- `concat` is O(1) whatever the sizes: merging 64 shards takes 50 microseconds in total, against 0.17 s for moving
+the 200,000 values back one by one.
+
+- `split_at` still walks to the cut, from the nearer end, but only follows links; it creates and frees nothing.
+Cutting shards off the end walks one shard per cut, so sharding walks the list about once in total, which is why its
+time barely grows from 8 to 64 shards. `split_at_handle` costs about the same: it does not know the position of its
+node, so it counts the shorter side to keep both lengths right.
+
+- Nodes move with their values, so node handles stay valid in the list that now holds them. Cursors on either list
+do not follow and must be opened again.
+"""
@@ -0,0 +1,134 @@
+# Benchmark: hit rate and time per request of LFUCache, with and without decay, against LRUCache
+# under access traces that mix a hot set with scans of cold keys
+
+import os
+import random
+import time
+
+from main import HERE, LFUCache, load_module
+
+LRUCache = load_module("lru_cache", os.path.join(HERE, "..", "LRU Cache in Python", "main.py")).LRUCache
+
+KEYS = 100_000
+REQUESTS = 200_000
+CAPACITY = 5_000
+DECAY_EVERY = 10 * CAPACITY
+
+
+def load(key):
+    # Stand-in for the expensive work a cache saves; kept trivial so the table shows the cost of the cache itself
+    return key
+
+
+def hot_set_trace(rng):
+    # 4,000 hot keys get 90% of the requests, the rest are spread over all keys; every 20,000 requests a scan
+    # reads 10,000 cold keys once, like a report or a backup running next to the normal traffic
+    hot_keys = range(4_000)
+    trace = [rng.choice(hot_keys) if rng.random() < 0.9 else rng.randrange(KEYS) for _ in range(REQUESTS)]
+    for start in range(0, REQUESTS, 20_000):
+        trace[start : start + 10_000] = range(KEYS + start, KEYS + start + 10_000)
+    return trace
+
+
+def zipf_scan_trace(rng, exponent=1.0):
+    # A few popular keys get most requests, with a sequential scan of 2,000 cold keys every 20,000 requests
+    weights = [1 / rank**exponent for rank in range(1, KEYS + 1)]
+    ranked_keys = list(range(KEYS))
+    rng.shuffle(ranked_keys)
+    trace = rng.choices(ranked_keys, weights=weights, k=REQUESTS)
+    for start in range(0, REQUESTS, 20_000):
+        trace[start : start + 2_000] = range(KEYS + start, KEYS + start + 2_000)
+    return trace
+
+
+def shifting_trace(rng):
+    # The hot set moves every 50,000 requests: keys that were hot in one phase are never used again
+    trace = []
+    for phase in range(REQUESTS // 50_000):
+        hot_keys = range(phase * 4_000, phase * 4_000 + 4_000)
+        trace.extend(rng.choice(hot_keys) if rng.random() < 0.9 else rng.randrange(KEYS) for _ in range(50_000))
+    return trace
+
+
+def run(cache, trace):
+    # Look every key up, loading and storing it on a miss; return the elapsed time and the hit rate
+    missing = object()
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key, missing) is missing:
+            cache.put(key, load(key))
+    elapsed = time.perf_counter() - start
+    return elapsed, cache.stats()["hit_rate"]
+
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    traces = [
+        ("Hot set + scans", hot_set_trace(rng)),
+        ("Zipf + scans", zipf_scan_trace(rng)),
+        ("Shifting hot set", shifting_trace(rng)),
+    ]
+    caches = [
+        ("LRUCache", lambda: LRUCache(CAPACITY)),
+        ("LFUCache", lambda: LFUCache(CAPACITY)),
+        (f"LFUCache, decay {DECAY_EVERY:,}", lambda: LFUCache(CAPACITY, decay_every=DECAY_EVERY)),
+    ]
+
+    print(f"{REQUESTS:,} requests, capacity {CAPACITY:,}")
+    print(f"{'Trace':<16} | {'Cache':<22} | {'Time (s)':>8} | {'us/request':>10} | {'Hit rate':>8}")
+    print("-" * 78)
+
+    for trace_name, trace in traces:
+        for cache_name, make_cache in caches:
+            elapsed, hit_rate = run(make_cache(), trace)
+            print(
+                f"{trace_name:<16} | {cache_name:<22} | {elapsed:>8.3f} | {elapsed / len(trace) * 1e6:>10.2f} | "
+                f"{hit_rate:>8.1%}"
+            )
+        print("-" * 78)
+
+
+# Output:
+
+"""
+200,000 requests, capacity 5,000
+Trace            | Cache                  | Time (s) | us/request | Hit rate
+------------------------------------------------------------------------------
+Hot set + scans  | LRUCache               |    0.819 |       4.10 |    27.4%
+Hot set + scans  | LFUCache               |    1.089 |       5.44 |    42.5%
+Hot set + scans  | LFUCache, decay 50,000 |    1.191 |       5.96 |    40.3%
+------------------------------------------------------------------------------
+Zipf + scans     | LRUCache               |    0.764 |       3.82 |    57.2%
+Zipf + scans     | LFUCache               |    1.158 |       5.79 |    62.0%
+Zipf + scans     | LFUCache, decay 50,000 |    1.342 |       6.71 |    60.5%
+------------------------------------------------------------------------------
+Shifting hot set | LRUCache               |    0.475 |       2.38 |    79.3%
+Shifting hot set | LFUCache               |    1.213 |       6.07 |    26.1%
+Shifting hot set | LFUCache, decay 50,000 |    1.095 |       5.48 |    49.9%
+------------------------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11. Half of the "Hot set + scans" requests belong to scans of keys that are never used again,
+so no cache can hit more than about 45% there.
+
+- Scans are where LFU wins. Each scan reads 10,000 new keys, twice the capacity, and LRU lets them push out the
+whole hot set, which then has to be loaded again: 27.4% hits. The scanned keys only ever reach a use count of 1, so
+LFU evicts them among themselves and keeps the hot keys: 42.5%, close to the limit. With Zipf traffic and shorter scans the gap is
+smaller (62.0% against 57.2%), because the hottest keys are used often enough to come back quickly under LRU too.
+
+- A moving hot set is where LFU loses. Keys that were hot in the first phase keep their high counts after the traffic
+has moved on, so plain LFU keeps the old hot set and hits only 26.1%, against 79.3% for LRU. Halving the counts every
+50,000 operations lets the old keys sink and brings LFU to 49.9%; it still trails LRU, because it takes a decay or
+two before the new keys outrank the old ones. On the scan traces decay costs about 2 points of hit rate.
+
+- Time per request is 1.3 to 2.5 times that of `LRUCache`: a hit moves the entry to another bucket, which may insert a
+bucket and remove an empty one, where LRU moves one node. The runs on this machine vary by up to 30% in time, the hit
+rates not at all. As with `LRUCache`, the time only matters when a miss is cheap; when a miss costs a database query,
+15 more points of hit rate save far more than the 2 microseconds per request.
+"""
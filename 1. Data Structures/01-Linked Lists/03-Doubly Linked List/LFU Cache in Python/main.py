@@ -0,0 +1,359 @@
+# Implementation in Python:
+
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(name, path):
+    # Import a main.py from another folder of the repository
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+DoublyLinkedList = load_module(
+    "doubly_linked_list", os.path.join(HERE, "..", "Implementing Doubly Linked List in Python", "main.py")
+).DoublyLinkedList
+HashMap = load_module(
+    "hash_map", os.path.join(HERE, "..", "..", "..", "04-Hash Maps", "02_Implementing Hash Maps in Python", "main.py")
+).HashMap  # The resizing version, the last HashMap defined in that file
+
+
+class LFUCache:
+    def __init__(self, capacity, on_evict=None, decay_every=None):
+        # Keep at most `capacity` entries and evict the least frequently used one, the least recently used on a tie.
+        # on_evict(key, value) is called for every entry pushed out to make room. With decay_every, all use counts
+        # are halved after every `decay_every` lookups and puts, so keys that were popular long ago can be evicted.
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if decay_every is not None and decay_every <= 0:
+            raise ValueError("decay_every must be positive")
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self.decay_every = decay_every
+
+        # The buckets list holds one [frequency, entries] bucket per use count, in increasing order of frequency.
+        # Each bucket's entries list orders its entries from most recently used (head) to least recently used (tail),
+        # and the map finds the entry of a key, so no operation has to walk either list
+        self.buckets = DoublyLinkedList()
+        self.entries = HashMap()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.operations = 0  # Lookups and puts since the last decay
+        self.decays = 0
+
+    def __len__(self):
+        # Return the number of entries in the cache
+        return self.entries.count
+
+    def __contains__(self, key):
+        # Check for a key without counting a hit or a miss and without changing its use count
+        return self.entries.get(key) is not None
+
+    def frequency(self, key):
+        # Return the use count of a key, 0 if it is not in the cache
+        entry = self.entries.get(key)
+        return 0 if entry is None else entry[2].get_value()[0]
+
+    def _link(self, entry, bucket_node):
+        # Put an entry at the head of a bucket's entries list and remember where it is
+        entry[2] = bucket_node
+        entry[3] = bucket_node.get_value()[1].add_to_head(entry)
+
+    def _unlink(self, entry):
+        # Take an entry out of its bucket and drop the bucket if it is now empty
+        bucket_node = entry[2]
+        bucket_entries = bucket_node.get_value()[1]
+        bucket_entries.remove_node(entry[3])
+        if bucket_entries.head_node is None:
+            self.buckets.remove_node(bucket_node)
+
+    def _touch(self, entry):
+        # Move an entry to the bucket of the next frequency, creating that bucket right after the current one if needed
+        bucket_node = entry[2]
+        frequency = bucket_node.get_value()[0] + 1
+        next_bucket = bucket_node.get_next_node()
+        if next_bucket is None or next_bucket.get_value()[0] != frequency:
+            next_bucket = self.buckets.insert_after(bucket_node, [frequency, DoublyLinkedList()])
+
+        self._unlink(entry)  # The new bucket is already linked, so removing the old one cannot lose the position
+        self._link(entry, next_bucket)
+
+    def get(self, key, default=None):
+        # Return the value of a key and count one more use of it, or `default` on a miss
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            value = default
+        else:
+            self.hits += 1
+            self._touch(entry)
+            value = entry[1]
+
+        self._count_operation()
+        return value
+
+    def put(self, key, value):
+        # Replace the value of a known key and count a use, or add the key with a use count of 1
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            entry[1] = value
+            self._touch(entry)
+        else:
+            if len(self) == self.capacity:
+                self._evict()
+
+            # Every entry is a [key, value, bucket node, entry node] list, so it can find its way back into both lists
+            entry = [key, value, None, None]
+            first_bucket = self.buckets.head_node
+            if first_bucket is None or first_bucket.get_value()[0] != 1:
+                first_bucket = self.buckets.add_to_head([1, DoublyLinkedList()])
+            self._link(entry, first_bucket)
+            self.entries.add(key, entry)
+
+        self._count_operation()
+
+    def _evict(self):
+        # Remove the least recently used entry of the lowest frequency and report it
+        entry = self.buckets.head_node.get_value()[1].tail_node.get_value()
+        self._unlink(entry)
+        self.entries.delete(entry[0])
+        self.evictions += 1
+
+        if self.on_evict is not None:
+            self.on_evict(entry[0], entry[1])
+
+    def delete(self, key):
+        # Remove an entry without calling on_evict; return True if the key was in the cache
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+
+        self._unlink(entry)
+        self.entries.delete(key)
+        return True
+
+    def _count_operation(self):
+        # Halve the use counts once every `decay_every` operations
+        self.operations += 1
+        if self.decay_every is not None and self.operations >= self.decay_every:
+            self.decay()
+
+    def decay(self):
+        # Halve every use count (keeping it at least 1) and merge the buckets that end up with the same frequency
+        old_buckets = self.buckets
+        self.buckets = DoublyLinkedList()
+
+        for frequency, bucket_entries in old_buckets:
+            frequency = max(1, frequency // 2)
+            target = self.buckets.tail_node
+            if target is None or target.get_value()[0] != frequency:
+                target = self.buckets.add_to_tail([frequency, DoublyLinkedList()])
+
+            # Re-link from the least to the most recently used, so the order inside the bucket is kept and the
+            # entries that had the higher count end up in front of the ones they were merged with
+            node = bucket_entries.tail_node
+            while node is not None:
+                entry = node.get_value()
+                node = node.get_prev_node()
+                self._link(entry, target)
+
+        self.operations = 0
+        self.decays += 1
+
+    def keys(self):
+        # Return the keys in eviction order: lowest frequency first, least recently used first within a frequency
+        keys = []
+        for _, bucket_entries in self.buckets:
+            node = bucket_entries.tail_node
+            while node is not None:
+                keys.append(node.get_value()[0])
+                node = node.get_prev_node()
+        return keys
+
+    def stats(self):
+        # Return the counters as a dictionary
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+            "decays": self.decays,
+        }
+
+
+# Example Usage
+if __name__ == "__main__":
+    evicted = []
+    cache = LFUCache(3, on_evict=lambda key, value: evicted.append(key))
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    print("Frequencies:", {key: cache.frequency(key) for key in "abc"})  # Output: {'a': 3, 'b': 2, 'c': 1}
+    print("Eviction order:", cache.keys())  # Output: ['c', 'b', 'a']
+
+    # The cache is full, so adding d evicts the least frequently used key, c
+    cache.put("d", 4)
+    print("\nAfter putting d:", cache.keys())  # Output: ['d', 'b', 'a']
+    print("Evicted:", evicted)  # Output: ['c']
+
+    # d and e both have a use count of 1; d was used longer ago, so it goes first
+    cache.put("e", 5)
+    print("After putting e:", cache.keys())  # Output: ['e', 'b', 'a']
+    print("Evicted:", evicted)  # Output: ['c', 'd']
+    print("Stats:", cache.stats())
+
+    # A scan of keys used once cannot push out the keys used often
+    for key in ["x1", "x2", "x3", "x4"]:
+        cache.put(key, 0)
+    print("\nAfter a scan:", cache.keys())  # Output: ['x4', 'b', 'a']
+
+    # With decay, old use counts fade: after every 4 operations all counts are halved
+    aging = LFUCache(2, decay_every=4)
+    aging.put("old", 1)
+    for _ in range(3):
+        aging.get("old")  # 4 operations: the count of old is halved from 4 to 2
+    print("\nFrequency of old after decay:", aging.frequency("old"))  # Output: 2
+    aging.put("new", 2)
+    aging.get("new")
+    print("Frequencies:", {key: aging.frequency(key) for key in aging.keys()})  # Output: {'old': 2, 'new': 2}
+    print("Decays:", aging.decays)  # Output: 1
+
+
+# Output:
+
+"""
+Frequencies: {'a': 3, 'b': 2, 'c': 1}
+Eviction order: ['c', 'b', 'a']
+
+After putting d: ['d', 'b', 'a']
+Evicted: ['c']
+After putting e: ['e', 'b', 'a']
+Evicted: ['c', 'd']
+Stats: {'hits': 3, 'misses': 0, 'evictions': 2, 'hit_rate': 1.0, 'size': 3, 'decays': 0}
+
+After a scan: ['x4', 'b', 'a']
+
+Frequency of old after decay: 2
+Frequencies: {'old': 2, 'new': 2}
+Decays: 1
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity     | Space Complexity |
+|----------------------|---------------------|------------------|
+| `__init__`           | O(1)                | O(1)             |
+| `get`                | O(1) average        | O(1)             |
+| `put`                | O(1) average        | O(1)             |
+| `_touch`             | O(1)                | O(1)             |
+| `_evict`             | O(1) average        | O(1)             |
+| `delete`             | O(1) average        | O(1)             |
+| `frequency`          | O(1) average        | O(1)             |
+| `decay`              | O(n)                | O(1)             |
+| `__contains__`       | O(1) average        | O(1)             |
+| `__len__`            | O(1)                | O(1)             |
+| `keys`               | O(n)                | O(n)             |
+| `stats`              | O(1)                | O(1)             |
+
+- **Why O(1)**: the textbook LFU keeps the entries in a heap ordered by use count, so every `get` costs O(log n) to
+restore the heap. Here an entry only ever moves from the bucket of frequency `f` to the bucket of `f + 1`, which is
+the next bucket in the list or has to be inserted right after it with `insert_after`. The entry's own node is removed
+with `remove_node` and added with `add_to_head`. The lowest frequency is always the head bucket, and the least
+recently used entry there is its tail. Every step is a fixed number of link changes.
+
+- **"Average"**: the `HashMap` lookups are O(1) on average and O(n) if many keys land in one bucket. `put` sometimes
+makes the map double its buckets, which is O(n) once but O(1) amortized.
+
+- **Decay**: `decay` re-links every entry, O(n). It runs once every `decay_every` operations, so with
+`decay_every >= capacity` it adds O(1) amortized per operation.
+
+- **Space**: O(capacity). Every entry costs a `[key, value, bucket node, entry node]` list, a node in its bucket and a
+slot in the map; there is at most one bucket per distinct use count, never more buckets than entries.
+"""
+
+# =========================================================================================================================== #
+
+# Detailed Code Explanation:
+
+"""
+### **Least Frequently Used (LFU) Eviction**
+
+An **LFU** cache drops the entry that was used the **fewest times**. An LRU cache only remembers when an entry was
+last used, so one pass over many cold keys (a report, a backup) pushes out every hot key. An LFU cache keeps the hot
+keys, because the cold keys of a scan are used once and are evicted first. When several entries share the lowest use
+count, the least recently used of them is evicted.
+
+---
+
+### **Frequency Buckets**
+
+The cache is a list of lists: `self.buckets` is a `DoublyLinkedList` with one bucket per use count, in increasing order
+of frequency. Each bucket is a `[frequency, entries]` list whose `entries` is another `DoublyLinkedList`, from the most
+recently used entry (head) to the least recently used (tail).
+
+```
+buckets:  [1: d] <-> [2: b] <-> [3: a]
+           ^ head: the eviction victim is the tail of this bucket
+```
+
+`self.entries` is a `HashMap` from every key to its `[key, value, bucket node, entry node]` list. Holding both nodes,
+an entry can leave its bucket in O(1) without any search.
+
+---
+
+### **`_touch(entry)`**
+
+- A use moves an entry from the bucket of `f` to the bucket of `f + 1`. Buckets are sorted, so that bucket, if it
+  exists, is the next one. Otherwise `insert_after` creates it right after the current bucket, in O(1).
+- The new bucket is linked in before the entry leaves its old bucket: if the old bucket becomes empty and is removed,
+  the position of the new one is already fixed.
+- The entry goes to the head of its new bucket, so within a bucket the tail is always the least recently used.
+
+---
+
+### **`put(key, value)` and `_evict()`**
+
+- A new key starts with a use count of 1, in the head bucket (created if the head bucket has a higher frequency).
+- When the cache is full, `_evict` first removes the tail entry of the head bucket: the least frequently used entry,
+  and the least recently used of those. `on_evict(key, value)` is called after the entry is gone; `delete` does not
+  call it.
+- Replacing the value of a known key counts as a use.
+
+---
+
+### **Decay (Aging)**
+
+A pure LFU cache never forgets: a key used 1,000 times yesterday outlives every key of today's working set. With
+`decay_every=N`, all use counts are halved after every `N` lookups and puts. `decay` walks the buckets in order and
+re-links every entry into a fresh bucket list; buckets whose halved counts meet (3 and 2 both become 1) are merged.
+Entries from the higher count are placed in front of the ones they are merged with, so they are evicted later. The
+halving is O(n), so `decay_every` should be at least the capacity to keep the cost O(1) amortized.
+
+---
+
+### **Statistics**
+
+`stats()` returns the hits, misses, evictions, hit rate, size and number of decays. `frequency(key)` shows the use
+count of one key, and `keys()` lists the keys in the order they would be evicted.
+"""
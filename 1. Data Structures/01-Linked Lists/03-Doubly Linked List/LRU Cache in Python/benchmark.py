@@ -0,0 +1,155 @@
+# Benchmark: throughput and hit rate of LRUCache (DoublyLinkedList + HashMap) against functools.lru_cache
+# and an LRU cache built on collections.OrderedDict, under three access traces
+
+import functools
+import random
+import time
+from collections import OrderedDict
+
+from main import LRUCache
+
+KEYS = 100_000
+REQUESTS = 200_000
+CAPACITY = 5_000
+
+
+class OrderedDictLRU:
+    def __init__(self, capacity):
+        # The usual pure-Python LRU: an OrderedDict keeps the keys in order of use
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, key, default=None):
+        if key not in self.entries:
+            return default
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+
+def load(key):
+    # Stand-in for the expensive work a cache saves; kept trivial so the table shows the cost of the cache itself
+    return key
+
+
+def zipf_trace(rng, exponent=1.0):
+    # A few popular keys get most requests, like pages of a website or rows of a database
+    weights = [1 / rank**exponent for rank in range(1, KEYS + 1)]
+    ranked_keys = list(range(KEYS))
+    rng.shuffle(ranked_keys)
+    return rng.choices(ranked_keys, weights=weights, k=REQUESTS)
+
+
+def scan_trace(rng):
+    # The Zipf trace, with a long sequential scan of cold keys (a report or a backup) every 20,000 requests
+    trace = zipf_trace(rng)
+    for start in range(0, REQUESTS, 20_000):
+        trace[start : start + 2_000] = range(KEYS + start, KEYS + start + 2_000)
+    return trace
+
+
+def shifting_trace(rng):
+    # The hot keys move every 50,000 requests, like the working set of a batch job moving through its input
+    trace = []
+    for phase in range(REQUESTS // 50_000):
+        hot_keys = range(phase * 10_000, phase * 10_000 + 10_000)
+        trace.extend(rng.choices(hot_keys, k=40_000))
+        trace.extend(rng.choices(range(KEYS), k=10_000))
+    return trace
+
+
+def run_get_put(cache, trace):
+    # Look every key up, loading and storing it on a miss; return the elapsed time and the hit count
+    missing = object()
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        value = cache.get(key, missing)
+        if value is missing:
+            cache.put(key, load(key))
+        else:
+            hits += 1
+    return time.perf_counter() - start, hits
+
+
+def run_functools(trace):
+    # lru_cache wraps the loading function itself; its statistics give the hit count
+    cached_load = functools.lru_cache(maxsize=CAPACITY)(load)
+    start = time.perf_counter()
+    for key in trace:
+        cached_load(key)
+    return time.perf_counter() - start, cached_load.cache_info().hits
+
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    traces = [("Zipf", zipf_trace(rng)), ("Zipf + scans", scan_trace(rng)), ("Shifting hot set", shifting_trace(rng))]
+
+    print(f"{REQUESTS:,} requests over {KEYS:,} keys, capacity {CAPACITY:,}")
+    print(f"{'Trace':<16} | {'Cache':<22} | {'Time (s)':>8} | {'Requests/s':>10} | {'Hit rate':>8}")
+    print("-" * 78)
+
+    for trace_name, trace in traces:
+        results = [
+            ("LRUCache", *run_get_put(LRUCache(CAPACITY), trace)),
+            ("OrderedDict LRU", *run_get_put(OrderedDictLRU(CAPACITY), trace)),
+            ("functools.lru_cache", *run_functools(trace)),
+        ]
+        # All three evict the least recently used key, so they must agree on every hit
+        assert len({hits for _, _, hits in results}) == 1
+
+        for cache_name, elapsed, hits in results:
+            print(
+                f"{trace_name:<16} | {cache_name:<22} | {elapsed:>8.3f} | {len(trace) / elapsed:>10,.0f} | "
+                f"{hits / len(trace):>8.1%}"
+            )
+        print("-" * 78)
+
+
+# Output:
+
+"""
+200,000 requests over 100,000 keys, capacity 5,000
+Trace            | Cache                  | Time (s) | Requests/s | Hit rate
+------------------------------------------------------------------------------
+Zipf             | LRUCache               |    0.544 |    367,629 |    65.9%
+Zipf             | OrderedDict LRU        |    0.105 |  1,895,825 |    65.9%
+Zipf             | functools.lru_cache    |    0.047 |  4,223,537 |    65.9%
+------------------------------------------------------------------------------
+Zipf + scans     | LRUCache               |    0.618 |    323,800 |    57.3%
+Zipf + scans     | OrderedDict LRU        |    0.111 |  1,796,729 |    57.3%
+Zipf + scans     | functools.lru_cache    |    0.051 |  3,917,671 |    57.3%
+------------------------------------------------------------------------------
+Shifting hot set | LRUCache               |    0.737 |    271,433 |    38.0%
+Shifting hot set | OrderedDict LRU        |    0.140 |  1,433,320 |    38.0%
+Shifting hot set | functools.lru_cache    |    0.061 |  3,304,110 |    38.0%
+------------------------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- All three caches evict the least recently used key, so their hit rates are identical on every trace (the benchmark
+checks it); the traces only change how much work the misses cause. Scans of cold keys push hot keys out, and a
+shifting hot set misses every time it moves: that is where LRU loses hit rate, whatever the implementation.
+
+- `LRUCache` takes about 3 microseconds per request, 5 times as long as the `OrderedDict` LRU and more than 10 times as
+long as `functools.lru_cache`. Both of those keep their linked list and their hash table in C, while every `get` here runs a
+`HashMap` lookup and a `move_to_front` in Python.
+
+- The difference only matters when loading a value is almost free, as in this benchmark. If a miss costs a database
+query or a file read (hundreds of microseconds or more), the cache's own overhead is a small share of the total, and
+the hit rate decides.
+
+- What `LRUCache` adds is the control the others lack: a weight limit instead of a count limit, an `on_evict`
+callback and `delete`. `functools.lru_cache` only caches a function's results, counted by entry; for a plain count
+limit with no callbacks it is the faster choice.
+"""
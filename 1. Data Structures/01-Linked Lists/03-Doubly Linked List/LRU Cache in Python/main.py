@@ -0,0 +1,291 @@
+# Implementation in Python:
+
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(name, path):
+    # Import a main.py from another folder of the repository
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+DoublyLinkedList = load_module(
+    "doubly_linked_list", os.path.join(HERE, "..", "Implementing Doubly Linked List in Python", "main.py")
+).DoublyLinkedList
+HashMap = load_module(
+    "hash_map", os.path.join(HERE, "..", "..", "..", "04-Hash Maps", "02_Implementing Hash Maps in Python", "main.py")
+).HashMap  # The resizing version, the last HashMap defined in that file
+
+
+class LRUCache:
+    def __init__(self, capacity, weigh=None, on_evict=None):
+        # Keep at most `capacity` entries, or entries of at most `capacity` total weight if weigh(key, value) is given.
+        # on_evict(key, value) is called for every entry pushed out to make room.
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.weigh = weigh
+        self.on_evict = on_evict
+        self.weight = 0  # Total weight of the entries (their number when there is no weigh function)
+
+        # The list orders the entries from most recently used (head) to least recently used (tail);
+        # the map finds the node of a key, so no operation has to walk the list
+        self.entries = DoublyLinkedList()
+        self.nodes = HashMap()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        # Return the number of entries in the cache
+        return self.nodes.count
+
+    def __contains__(self, key):
+        # Check for a key without counting a hit or a miss and without changing the order
+        return self.nodes.get(key) is not None
+
+    def _weight_of(self, key, value):
+        # Return the weight of an entry: 1, or what the weigh function says
+        if self.weigh is None:
+            return 1
+
+        weight = self.weigh(key, value)
+        if weight > self.capacity:
+            raise ValueError(f"an entry of weight {weight} cannot fit in a cache of capacity {self.capacity}")
+        return weight
+
+    def get(self, key, default=None):
+        # Return the value of a key and mark it as the most recently used, or `default` on a miss
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.entries.move_to_front(node)
+        return node.get_value()[1]
+
+    def put(self, key, value):
+        # Add or replace an entry as the most recently used, then evict from the tail until the cache fits
+        weight = self._weight_of(key, value)
+        node = self.nodes.get(key)
+
+        if node is None:
+            # Every entry is a [key, value, weight] list, like the [key, value] pairs in the HashMap buckets
+            node = self.entries.add_to_head([key, value, weight])
+            self.nodes.add(key, node)
+        else:
+            entry = node.get_value()
+            self.weight -= entry[2]
+            entry[1] = value
+            entry[2] = weight
+            self.entries.move_to_front(node)
+
+        self.weight += weight
+        while self.weight > self.capacity:
+            self._evict()
+
+    def _evict(self):
+        # Remove the least recently used entry and report it
+        key, value, weight = self.entries.remove_node(self.entries.tail_node)
+        self.nodes.delete(key)
+        self.weight -= weight
+        self.evictions += 1
+
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def delete(self, key):
+        # Remove an entry without calling on_evict; return True if the key was in the cache
+        node = self.nodes.get(key)
+        if node is None:
+            return False
+
+        self.weight -= self.entries.remove_node(node)[2]
+        self.nodes.delete(key)
+        return True
+
+    def keys(self):
+        # Return the keys from the most recently used to the least recently used
+        return [entry[0] for entry in self.entries]
+
+    def stats(self):
+        # Return the counters as a dictionary
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+            "weight": self.weight,
+        }
+
+
+# Example Usage
+if __name__ == "__main__":
+    evicted = []
+    cache = LRUCache(3, on_evict=lambda key, value: evicted.append(key))
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    print("Keys (most recent first):", cache.keys())  # Output: ['c', 'b', 'a']
+
+    print("Get a:", cache.get("a"))  # Output: 1
+    print("Keys:", cache.keys())  # Output: ['a', 'c', 'b']
+
+    # The cache is full, so adding d evicts the least recently used key, b
+    cache.put("d", 4)
+    print("\nAfter putting d:", cache.keys())  # Output: ['d', 'a', 'c']
+    print("Evicted:", evicted)  # Output: ['b']
+    print("Get b:", cache.get("b"))  # Output: None
+    print("Stats:", cache.stats())
+
+    # Bound the cache by weight instead of count: here the total length of the values may be at most 10
+    pages = LRUCache(10, weigh=lambda key, value: len(value))
+    pages.put("home", "<html/>")  # Weight 7
+    pages.put("about", "hi")  # Weight 2
+    pages.put("blog", "post")  # Weight 4: 13 > 10, so "home" is evicted
+    print("\nWeighted keys:", pages.keys())  # Output: ['blog', 'about']
+    print("Weight:", pages.weight)  # Output: 6
+
+    try:
+        pages.put("video", "x" * 50)
+    except ValueError as error:
+        print("Error:", error)  # Output: an entry of weight 50 cannot fit in a cache of capacity 10
+
+
+# Output:
+
+"""
+Keys (most recent first): ['c', 'b', 'a']
+Get a: 1
+Keys: ['a', 'c', 'b']
+
+After putting d: ['d', 'a', 'c']
+Evicted: ['b']
+Get b: None
+Stats: {'hits': 1, 'misses': 1, 'evictions': 1, 'hit_rate': 0.5, 'size': 3, 'weight': 3}
+
+Weighted keys: ['blog', 'about']
+Weight: 6
+Error: an entry of weight 50 cannot fit in a cache of capacity 10
+
+"""
+
+# =========================================================================================================================== #
+
+# Big O Analysis:
+
+"""
+## Time and Space Complexity Analysis:
+
+| Method               | Time Complexity     | Space Complexity |
+|----------------------|---------------------|------------------|
+| `__init__`           | O(1)                | O(1)             |
+| `get`                | O(1) average        | O(1)             |
+| `put`                | O(1) average        | O(1)             |
+| `_evict`             | O(1) average        | O(1)             |
+| `delete`             | O(1) average        | O(1)             |
+| `__contains__`       | O(1) average        | O(1)             |
+| `__len__`            | O(1)                | O(1)             |
+| `keys`               | O(n)                | O(n)             |
+| `stats`              | O(1)                | O(1)             |
+
+- **Why two structures**: the `HashMap` finds the node of a key in O(1) on average, and the `DoublyLinkedList`
+keeps the order of use. With the node in hand, `move_to_front` and `remove_node` are O(1) (see the node handles of
+`DoublyLinkedList`), so no operation walks the list. A list alone would need an O(n) search per `get`; a map alone
+would need an O(n) scan to find the least recently used key.
+
+- **"Average"**: the `HashMap` lookups are O(1) on average and O(n) if many keys land in one bucket. `put` sometimes
+makes the map double its buckets, which is O(n) once but O(1) amortized, like `list.append`.
+
+- **Eviction**: with a weigh function, one `put` can evict several small entries to make room for one large entry.
+Each entry is evicted at most once after it was put, so this is still O(1) amortized per `put`.
+
+- **Space**: O(capacity) entries. Every entry costs a list node, a `[key, value, weight]` list and a bucket slot in
+the map, several times the memory of an entry in `functools.lru_cache` or `OrderedDict`, which are written in C.
+`benchmark.py` measures the time cost.
+"""
+
+# =========================================================================================================================== #
+
+# Detailed Code Explanation:
+
+"""
+### **Least Recently Used (LRU) Eviction**
+
+A cache keeps a limited number of results so they do not have to be computed or fetched again. When it is full, it
+has to drop something. An **LRU** cache drops the entry that was used **longest ago**, betting that recently used
+entries will be used again soon.
+
+```
+put a, b, c     head -> [c] <-> [b] <-> [a] <- tail
+get a           head -> [a] <-> [c] <-> [b] <- tail     a moves to the front
+put d           head -> [d] <-> [a] <-> [c] <- tail     b, at the tail, is evicted
+```
+
+---
+
+### **Loading the Building Blocks**
+
+`DoublyLinkedList` and `HashMap` live in other folders of the repository, so `load_module` imports their `main.py`
+files by path. The `main.py` of the hash map defines `HashMap` twice; the second, resizing version is the one the
+module ends up with. Both files keep their example usage under `if __name__ == "__main__":`, so importing them runs
+only the class definitions.
+
+---
+
+### **State of the Cache**
+
+1. **`self.entries`**: a `DoublyLinkedList` whose node values are `[key, value, weight]` lists, from the most
+   recently used (head) to the least recently used (tail).
+2. **`self.nodes`**: a `HashMap` from every key to its node in `self.entries`. A node is never `None`, so
+   `self.nodes.get(key) is None` reliably means the key is missing, even when a cached value is `None`.
+3. **`self.weight`**: the total weight of the entries. Without a `weigh` function every entry weighs 1, so
+   `capacity` is the number of entries.
+4. **`hits`, `misses`, `evictions`**: counters, returned with the hit rate by `stats()`.
+
+---
+
+### **`get(key, default=None)`**
+
+- Looks up the node in the map. On a miss it counts the miss and returns `default`.
+- On a hit it calls `self.entries.move_to_front(node)`: the node is unlinked from its place and linked in again at the
+  head, in O(1), because the node knows both of its neighbours.
+
+---
+
+### **`put(key, value)`**
+
+- A new key gets a node from `add_to_head`, which returns the node so it can be stored in the map.
+- An existing key has its entry updated in place and is moved to the front; its old weight is taken off first.
+- Then `_evict` runs until the total weight fits into `capacity`. The new entry is at the head and is never evicted,
+  because `_weight_of` already refused entries heavier than the whole capacity with a `ValueError`.
+
+---
+
+### **`_evict()` and `on_evict`**
+
+- The least recently used entry is always `self.entries.tail_node`. `remove_node` unlinks it and returns its
+  `[key, value, weight]` list, and the key is deleted from the map.
+- `on_evict(key, value)` is called after the entry is gone, so the callback can write the value somewhere else, close a
+  resource or log the eviction. It is **not** called by `delete` or when `put` replaces a value: those are the
+  caller's own decisions, not the cache's.
+
+---
+
+### **Weighing Entries**
+
+`LRUCache(10_000_000, weigh=lambda key, value: len(value))` keeps values of at most 10 MB in total, whatever their
+number. A weigh function can measure anything that adds up: bytes, rows, or the cost of computing the value again.
+"""
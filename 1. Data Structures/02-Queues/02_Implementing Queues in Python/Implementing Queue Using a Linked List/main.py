@@ -1,18 +1,28 @@
 # Implementation in Python:
 
+import copy
+
 
 # Node class represents each element in the queue
 class Node:
+    __slots__ = ("data", "next")  # Fixed attributes instead of a per-node __dict__, so every node is smaller
+
     def __init__(self, data):
         self.data = data  # Stores the value of the node
         self.next = None  # Pointer to the next node in the queue
 
+    # Reinitialize a recycled node (used by a NodePool)
+    def reset(self, data):
+        self.data = data
+        self.next = None
+
 
 # Queue class implementing a linked list-based queue
 class Queue:
-    def __init__(self):
+    def __init__(self, node_pool=None):
         self.front = None  # Points to the front (first) element of the queue
         self.rear = None  # Points to the rear (last) element of the queue
+        self.node_pool = node_pool  # Optional NodePool(Node) that recycles the nodes of dequeued elements
 
     # Check if the queue is empty
     def is_empty(self):
@@ -20,7 +30,8 @@ class Queue:
 
     # Add an element to the rear of the queue
     def enqueue(self, data):
-        new_node = Node(data)  # Create a new node with the given data
+        # Create a new node with the given data, or take a recycled one from the pool
+        new_node = Node(data) if self.node_pool is None else self.node_pool.acquire(data)
 
         # If the queue is empty, both front and rear should point to new node
         if self.rear is None:
@@ -41,7 +52,11 @@ class Queue:
         if self.front is None:  # If the queue becomes empty, reset rear as well
             self.rear = None
 
-        return temp.data  # Return the removed element's data
+        data = temp.data
+        if self.node_pool is not None:
+            self.node_pool.release(temp)  # The node is unlinked, so it can be reused by a later enqueue
+
+        return data  # Return the removed element's data
 
     # View the front element without removing it
     def peek(self):
@@ -64,20 +79,69 @@ class Queue:
 
         return " -> ".join(queue_str)  # Format as a string
 
+    # Return the values as a flat list, front to rear (used by pickle and copy)
+    def __getstate__(self):
+        values = []
+        temp = self.front
+
+        while temp:  # Walk the nodes iteratively
+            values.append(temp.data)
+            temp = temp.next
+
+        return values
+
+    # Rebuild the nodes from a flat list of values
+    def __setstate__(self, values):
+        self.front = self.rear = None
+
+        for data in values:
+            self.enqueue(data)
+
+    # Pickle the class and a flat list of values instead of the chain of nodes,
+    # which pickle would otherwise follow recursively through `next` (RecursionError on long queues)
+    def __reduce__(self):
+        return self.__class__, (), self.__getstate__()
+
+    # Deep-copy the values one by one into a new queue, without recursing through the nodes
+    def __deepcopy__(self, memo):
+        copied = self.__class__()
+        memo[id(self)] = copied  # Register the copy first, in case a value refers back to the queue
+
+        for data in self.__getstate__():
+            copied.enqueue(copy.deepcopy(data, memo))
+
+        return copied
+
 
 # Example usage:
-queue = Queue()
-queue.enqueue(10)
-queue.enqueue(20)
-queue.enqueue(30)
+if __name__ == "__main__":
+    import pickle
 
-print("Queue:", queue)  # Output: Queue: 10 -> 20 -> 30
+    queue = Queue()
+    queue.enqueue(10)
+    queue.enqueue(20)
+    queue.enqueue(30)
 
-print("Dequeue:", queue.dequeue())  # Output: Dequeue: 10
+    print("Queue:", queue)  # Output: Queue: 10 -> 20 -> 30
 
-print("Queue after dequeue:", queue)  # Output: Queue after dequeue: 20 -> 30
+    print("Dequeue:", queue.dequeue())  # Output: Dequeue: 10
 
-print("Peek:", queue.peek())  # Output: Peek: 20
+    print("Queue after dequeue:", queue)  # Output: Queue after dequeue: 20 -> 30
+
+    print("Peek:", queue.peek())  # Output: Peek: 20
+
+    # Checkpoint a long queue with pickle and restore it
+    long_queue = Queue()
+    for item in range(100_000):
+        long_queue.enqueue(item)
+
+    restored_queue = pickle.loads(pickle.dumps(long_queue))
+    print("Restored front:", restored_queue.peek())  # Output: Restored front: 0
+
+    copied_queue = copy.deepcopy(queue)
+    copied_queue.enqueue(40)
+    print("Deep copy:", copied_queue)  # Output: Deep copy: 20 -> 30 -> 40
+    print("Original:", queue)  # Output: Original: 20 -> 30
 
 
 # Output:
@@ -87,6 +151,9 @@ Queue: 10 -> 20 -> 30
 Dequeue: 10
 Queue after dequeue: 20 -> 30
 Peek: 20
+Restored front: 0
+Deep copy: 20 -> 30 -> 40
+Original: 20 -> 30
 
 """
 
@@ -128,6 +195,12 @@ Peek: 20
    - **Explanation**: This method traverses the entire queue to collect the data values of all nodes, where `n` is
    the number of elements in the queue. Therefore, the time complexity is linear with respect to the number of elements.
 
+6. **`__getstate__()`, `__setstate__()`, `__reduce__()`, `__deepcopy__()`**:
+   - **Time Complexity**: O(n)
+   
+   - **Explanation**: Pickling and copying walk the nodes once to collect the values, and rebuilding enqueues each
+   value once.
+
 #### Space Complexity
 
 1. **`is_empty()`**:
@@ -156,17 +229,31 @@ Peek: 20
    - **Explanation**: This method stores the string representation of each element in the queue, which requires
    space proportional to the number of elements `n`.
 
+6. **`__getstate__()`, `__setstate__()`, `__reduce__()`, `__deepcopy__()`**:
+   - **Space Complexity**: O(n)
+   
+   - **Explanation**: The values are collected in a flat list. The call stack stays O(1) deep however long the queue
+   is, while pickling the nodes themselves would need one level of recursion per node.
+
+7. **`node_pool`**:
+   - **Time and Space Complexity**: `enqueue()` and `dequeue()` stay O(1): acquiring and releasing a node is a list
+   `pop` or `append`. The pool keeps at most `max_free` unused nodes.
+
 ### Summary
 
 - **Time Complexity**:
   - `is_empty()`, `enqueue()`, `dequeue()`, and `peek()` are all O(1).
   
   - `__str__()` is O(n).
+  
+  - Pickling and copying are O(n).
 
 - **Space Complexity**:
   - `is_empty()`, `enqueue()`, `dequeue()`, and `peek()` are all O(1).
   
   - `__str__()` is O(n).
+  
+  - Pickling and copying are O(n), with no recursion through the nodes.
 
 This implementation of a queue using a linked list is efficient for most operations, with constant time complexity for
 adding and removing elements, and linear time complexity for generating a string representation of the queue.
@@ -186,14 +273,22 @@ explanation of how the code works, broken down into its components:
 ### 1. **Node Class**
 ```
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
+
+    def reset(self, data):
+        self.data = data
+        self.next = None
 ```
 - The `Node` class represents a single node in the linked list.
 - Each node has two attributes:
   - `data`: Stores the value of the node.
   - `next`: A pointer to the next node in the list. Initially, it is set to `None`.
+- `__slots__` stores the two attributes in fixed places instead of a per-node `__dict__`, so every node is smaller.
+- `reset` lets a `NodePool` reinitialize a recycled node (see **h. Recycling Nodes**).
 
 ---
 
@@ -209,11 +304,13 @@ The `Queue` class implements the queue data structure using the `Node` class. A
 
 ##### a. **`__init__` (Constructor)**
 ```
-def __init__(self):
+def __init__(self, node_pool=None):
     self.front = None
     self.rear = None
+    self.node_pool = node_pool
 ```
 - Initializes an empty queue by setting both `front` and `rear` to `None`.
+- `node_pool` is an optional pool that recycles the nodes of dequeued elements (see **h. Recycling Nodes**).
 
 ---
 
@@ -298,6 +395,38 @@ def __str__(self):
   2. Otherwise, traverse the queue from `front` to `rear`, appending each node's `data` to a list.
   3. Join the list elements with `" -> "` to represent the queue as a string.
 
+#### g. **Pickling and Copying**
+```
+def __getstate__(self):
+    values = []
+    temp = self.front
+    while temp:
+        values.append(temp.data)
+        temp = temp.next
+    return values
+
+def __reduce__(self):
+    return self.__class__, (), self.__getstate__()
+```
+- By default, `pickle` and `copy.deepcopy` save an object by saving its attributes. Here `front` is a `Node` whose
+  `next` is another `Node`, and so on, so they go **one level deeper for every node**. A queue with more than about
+  1,000 nodes then fails with `RecursionError`.
+- `__reduce__` tells `pickle` to save only the class and a **flat list of values** from `__getstate__`. When loading,
+  `pickle` creates an empty `Queue()` and calls `__setstate__(values)`, which enqueues the values one at a time.
+- `__deepcopy__` does the same without the list round trip: it creates an empty queue and enqueues a deep copy of each
+  value. The new queue is registered in `memo` first, so a value that refers back to the queue is copied correctly.
+- `copy.copy` also goes through `__reduce__`, so a shallow copy gets new nodes holding the same values.
+
+#### h. **Recycling Nodes (`node_pool`)**
+```
+queue = Queue(node_pool=NodePool(Node))  # NodePool from "01-Nodes/Implementing Node in Python"
+```
+- A queue that is constantly filled and emptied creates one node per `enqueue` and drops one per `dequeue`.
+- With a `node_pool`, `enqueue` gets its node from `node_pool.acquire(data)`, and `dequeue` hands the unlinked node
+  back with `node_pool.release(temp)` after reading its data, so the next `enqueue` can reuse it.
+- The pool counts allocations, reuses and the high-water mark of nodes in use; one pool can be shared by several
+  queues. Without a pool (the default), nothing changes.
+
 ---
 
 ### 3. **Example Usage**
@@ -0,0 +1,150 @@
+# Benchmark: RingBufferQueue against the list-based Queue (pop(0)), the deque-based Queue and the linked-list Queue,
+# draining a backlog and running a queue that stays at a steady size
+
+import importlib.util
+import os
+import time
+
+from main import RingBufferQueue
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OPTIMIZED_MARKER = "# Optimized Version:"  # The list folder keeps the deque-based Queue after this line
+BACKLOGS = [10_000, 100_000, 1_000_000]
+LIST_QUEUE_LIMIT = 100_000  # Draining 1,000,000 elements with pop(0) takes minutes, so larger backlogs are skipped
+STEADY_SIZE = 1_000
+STEADY_OPERATIONS = 1_000_000
+
+
+def load_module(name, folder, until=None):
+    # Import the main.py of another Queue folder.
+    # With `until`, only the source before that marker runs, which loads the first of two versions of a class.
+    filename = os.path.join(HERE, "..", folder, "main.py")
+    with open(filename, encoding="utf-8") as file:
+        source = file.read()
+    if until is not None:
+        source = source[: source.index(until)]
+
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader=None))
+    module.__file__ = filename
+    exec(compile(source, filename, "exec"), module.__dict__)
+    return module
+
+
+QUEUES = [
+    ("Queue (list)", load_module("list_queue", "Implementing Queue Using a List", until=OPTIMIZED_MARKER).Queue),
+    ("Queue (deque)", load_module("deque_queue", "Implementing Queue Using a List").Queue),
+    ("Queue (linked)", load_module("linked_queue", "Implementing Queue Using a Linked List").Queue),
+    ("RingBufferQueue", RingBufferQueue),
+]
+
+
+def drain(queue_class, backlog):
+    # Fill the queue with a backlog, then dequeue everything; return the time to fill and the time to drain
+    queue = queue_class()
+    start = time.perf_counter()
+    for item in range(backlog):
+        queue.enqueue(item)
+    fill_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for item in range(backlog):
+        assert queue.dequeue() == item
+    drain_time = time.perf_counter() - start
+
+    assert queue.is_empty()
+    return fill_time, drain_time
+
+
+def steady(queue_class):
+    # Keep STEADY_SIZE elements queued: every enqueue is followed by a dequeue, like a worker keeping up with its input
+    queue = queue_class()
+    for item in range(STEADY_SIZE):
+        queue.enqueue(item)
+
+    start = time.perf_counter()
+    for item in range(STEADY_SIZE, STEADY_SIZE + STEADY_OPERATIONS):
+        queue.enqueue(item)
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'Workload':<27} | {'Queue':<15} | {'Fill (s)':>8} | {'Run (s)':>9} | {'ns/element':>10}")
+    print("-" * 82)
+
+    for backlog in BACKLOGS:
+        for name, queue_class in QUEUES:
+            workload = f"drain {backlog:,}"
+            if name == "Queue (list)" and backlog > LIST_QUEUE_LIMIT:
+                print(f"{workload:<27} | {name:<15} | {'skipped: O(n²) drain':>33}")
+                continue
+            fill_time, drain_time = drain(queue_class, backlog)
+            print(
+                f"{workload:<27} | {name:<15} | {fill_time:>8.3f} | {drain_time:>9.3f} | "
+                f"{drain_time / backlog * 1e9:>10.0f}"
+            )
+        print("-" * 82)
+
+    for name, queue_class in QUEUES:
+        workload = f"steady {STEADY_SIZE:,}, {STEADY_OPERATIONS:,} ops"
+        elapsed = steady(queue_class)
+        print(
+            f"{workload:<27} | {name:<15} | {'':>8} | {elapsed:>9.3f} | {elapsed / STEADY_OPERATIONS * 1e9:>10.0f}"
+        )
+    print("-" * 82)
+
+
+# Output:
+
+"""
+Workload                    | Queue           | Fill (s) |   Run (s) | ns/element
+----------------------------------------------------------------------------------
+drain 10,000                | Queue (list)    |    0.001 |     0.010 |        990
+drain 10,000                | Queue (deque)   |    0.001 |     0.002 |        160
+drain 10,000                | Queue (linked)  |    0.005 |     0.002 |        249
+drain 10,000                | RingBufferQueue |    0.003 |     0.004 |        429
+----------------------------------------------------------------------------------
+drain 100,000               | Queue (list)    |    0.013 |     0.944 |       9444
+drain 100,000               | Queue (deque)   |    0.011 |     0.021 |        212
+drain 100,000               | Queue (linked)  |    0.070 |     0.025 |        249
+drain 100,000               | RingBufferQueue |    0.032 |     0.040 |        399
+----------------------------------------------------------------------------------
+drain 1,000,000             | Queue (list)    |              skipped: O(n²) drain
+drain 1,000,000             | Queue (deque)   |    0.119 |     0.212 |        212
+drain 1,000,000             | Queue (linked)  |    0.837 |     0.247 |        247
+drain 1,000,000             | RingBufferQueue |    0.334 |     0.392 |        392
+----------------------------------------------------------------------------------
+steady 1,000, 1,000,000 ops | Queue (list)    |          |     0.383 |        383
+steady 1,000, 1,000,000 ops | Queue (deque)   |          |     0.274 |        274
+steady 1,000, 1,000,000 ops | Queue (linked)  |          |     0.620 |        620
+steady 1,000, 1,000,000 ops | RingBufferQueue |          |     0.626 |        626
+----------------------------------------------------------------------------------
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11; repeated runs differ by up to 25% in time, the order stays the same. "Fill" is enqueuing
+the backlog, "Run" is dequeuing all of it (drain) or one enqueue and one dequeue per element (steady), and
+"ns/element" is "Run" divided by the number of elements.
+
+- The list-based `Queue` is the only one whose cost per element grows with the backlog: `pop(0)` shifts every
+remaining element, so 10 times the backlog takes about 100 times as long to drain (0.01 s for 10,000, 0.94 s for
+100,000). A backlog of 1,000,000 would take about 100 s, and is skipped. `RingBufferQueue` drains at the same
+400 ns per element for every backlog size.
+
+- `RingBufferQueue` is not the fastest O(1) queue in CPython. The `deque`-based `Queue` does its work in C and is
+about twice as fast; the linked-list `Queue` dequeues 1.5 times faster, because dequeuing a node is one attribute
+read where the ring buffer also masks the index, clears the slot and checks whether to shrink. The ring buffer
+fills 2.5 times faster than the linked list, which creates a node per element, and holds about 13 bytes per element
+against 48 (see `memory_footprint.py`).
+
+- At a steady 1,000 elements, `pop(0)` shifts only 1,000 pointers, a fast `memmove`, and the list-based `Queue` is
+faster than both Python O(1) queues. Its problem is the large backlog, not the common case.
+
+- Use the `deque`-based `Queue` in practice. `RingBufferQueue` shows how a circular buffer works, and is the
+layout to port to languages without a built-in deque or to fixed-size buffers shared between processes.
+"""
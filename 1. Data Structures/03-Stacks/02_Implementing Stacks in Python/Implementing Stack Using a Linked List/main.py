@@ -1,17 +1,27 @@
 # Implementation in Python:
 
+import copy
+
 
 # Node class represents an element in the stack
 class Node:
+    __slots__ = ("data", "next")  # Fixed attributes instead of a per-node __dict__, so every node is smaller
+
     def __init__(self, data):
         self.data = data  # Store the data
         self.next = None  # Pointer to the next node (initially None)
 
+    # Reinitialize a recycled node (used by a NodePool)
+    def reset(self, data):
+        self.data = data
+        self.next = None
+
 
 # Stack class implements a stack using a linked list
 class Stack:
-    def __init__(self):
+    def __init__(self, node_pool=None):
         self.top = None  # Top of the stack (initially None)
+        self.node_pool = node_pool  # Optional NodePool(Node) that recycles the nodes of popped elements
 
     # Check if the stack is empty
     def is_empty(self):
@@ -19,7 +29,8 @@ class Stack:
 
     # Push a new element onto the stack
     def push(self, data):
-        new_node = Node(data)  # Create a new node with the given data
+        # Create a new node with the given data, or take a recycled one from the pool
+        new_node = Node(data) if self.node_pool is None else self.node_pool.acquire(data)
         new_node.next = self.top  # Link the new node to the current top
         self.top = new_node  # Update the top to the new node
 
@@ -27,8 +38,11 @@ class Stack:
     def pop(self):
         if self.is_empty():
             raise IndexError("pop from empty stack")  # Raise error if stack is empty
-        popped_data = self.top.data  # Get data from the top node
-        self.top = self.top.next  # Move the top to the next node
+        popped_node = self.top
+        popped_data = popped_node.data  # Get data from the top node
+        self.top = popped_node.next  # Move the top to the next node
+        if self.node_pool is not None:
+            self.node_pool.release(popped_node)  # The node is unlinked, so it can be reused by a later push
         return popped_data  # Return the popped data
 
     # Return the top element without removing it
@@ -48,23 +62,70 @@ class Stack:
             current = current.next  # Move to the next node
         return stack_str[:-4]  # Remove the last " -> " for cleaner output
 
+    # Return the values as a flat list, top to bottom (used by pickle and copy)
+    def __getstate__(self):
+        values = []
+        current = self.top
+
+        while current:  # Walk the nodes iteratively
+            values.append(current.data)
+            current = current.next
+
+        return values
+
+    # Rebuild the nodes from a flat list of values
+    def __setstate__(self, values):
+        self.top = None
+
+        for data in reversed(values):  # Push the bottom value first so the top value ends up on top
+            self.push(data)
+
+    # Pickle the class and a flat list of values instead of the chain of nodes,
+    # which pickle would otherwise follow recursively through `next` (RecursionError on long stacks)
+    def __reduce__(self):
+        return self.__class__, (), self.__getstate__()
+
+    # Deep-copy the values one by one into a new stack, without recursing through the nodes
+    def __deepcopy__(self, memo):
+        copied = self.__class__()
+        memo[id(self)] = copied  # Register the copy first, in case a value refers back to the stack
+
+        copied.__setstate__([copy.deepcopy(data, memo) for data in self.__getstate__()])
+        return copied
+
 
 # Example usage of the Stack class
-stack = Stack()
+if __name__ == "__main__":
+    import pickle
 
-stack.push(10)
-stack.push(20)
-stack.push(30)
+    stack = Stack()
 
-print(stack)  # Output: 30 -> 20 -> 10 (Last In, First Out order)
+    stack.push(10)
+    stack.push(20)
+    stack.push(30)
 
-print("Popped:", stack.pop())  # Output: Popped: 30 (removes top element)
-print(stack)  # Output: 20 -> 10 (Stack after popping 30)
+    print(stack)  # Output: 30 -> 20 -> 10 (Last In, First Out order)
 
-print("Top element:", stack.peek())  # Output: Top element: 20 (peek at the top)
+    print("Popped:", stack.pop())  # Output: Popped: 30 (removes top element)
+    print(stack)  # Output: 20 -> 10 (Stack after popping 30)
 
-stack.push(40)
-print(stack)  # Output: 40 -> 20 -> 10 (40 is now the new top)
+    print("Top element:", stack.peek())  # Output: Top element: 20 (peek at the top)
+
+    stack.push(40)
+    print(stack)  # Output: 40 -> 20 -> 10 (40 is now the new top)
+
+    # Save a long stack with pickle and restore it
+    long_stack = Stack()
+    for item in range(100_000):
+        long_stack.push(item)
+
+    restored_stack = pickle.loads(pickle.dumps(long_stack))
+    print("Restored top:", restored_stack.peek())  # Output: Restored top: 99999
+
+    copied_stack = copy.deepcopy(stack)
+    copied_stack.push(50)
+    print("Deep copy:", copied_stack)  # Output: Deep copy: 50 -> 40 -> 20 -> 10
+    print("Original:", stack)  # Output: Original: 40 -> 20 -> 10
 
 # Output:
 
@@ -74,6 +135,9 @@ Popped: 30
 20 -> 10
 Top element: 20
 40 -> 20 -> 10
+Restored top: 99999
+Deep copy: 50 -> 40 -> 20 -> 10
+Original: 40 -> 20 -> 10
 
 """
 
@@ -118,6 +182,14 @@ Let's analyze the **time complexity** and **space complexity** of the `Stack` im
    - Explanation: The `__str__` method traverses the entire stack to construct the string representation.
    This requires visiting each node once, so the time complexity is linear in the number of elements.
 
+6. **`__getstate__()`, `__setstate__()`, `__reduce__()`, `__deepcopy__()`**:
+   - **Time Complexity**: O(n)
+   
+   - Explanation: Pickling and copying walk the nodes once to collect the values, and rebuilding pushes each value once.
+
+7. **With a `node_pool`**:
+   - **Time Complexity**: `push` and `pop` stay O(1): acquiring and releasing a node is a list `pop` or `append`.
+
 ---
 
 ### **Space Complexity**
@@ -144,6 +216,10 @@ Let's analyze the **time complexity** and **space complexity** of the `Stack` im
      
    - **`__str__()`**: O(n)
      - Explanation: The `stack_str` variable grows linearly with the number of elements in the stack.
+     
+   - **Pickling and copying**: O(n)
+     - Explanation: The values are collected in a flat list, and the call stack stays O(1) deep however long the
+     stack is.
 
 """
 
@@ -162,21 +238,31 @@ The `Node` class is a basic building block for the stack. It has two attributes:
 
 ```
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
+
+    def reset(self, data):
+        self.data = data
+        self.next = None
 ```
 
+`__slots__` makes every node smaller, and `reset` lets a node pool reuse a node (see **7. Recycling Nodes**).
+
 ### 2. **Stack Class**
 The `Stack` class implements the stack data structure using a linked list. It has the following methods:
 
 #### **Attributes**
 - `top`: This is a pointer to the top node of the stack. Initially, it is set to `None` because the stack is empty.
+- `node_pool`: An optional pool that recycles the nodes of popped elements (see **7. Recycling Nodes**).
 
 ```
 class Stack:
-    def __init__(self):
+    def __init__(self, node_pool=None):
         self.top = None
+        self.node_pool = node_pool
 ```
 
 #### **Methods**
@@ -248,6 +334,43 @@ def __str__(self):
     return stack_str[:-4]  # Remove the last " -> "
 ```
 
+6. **Pickling and Copying: `__getstate__()`, `__setstate__()`, `__reduce__()`, `__deepcopy__()`**
+   - By default, `pickle` and `copy.deepcopy` save an object by saving its attributes. `top` is a `Node` whose `next`
+     is another `Node`, and so on, so they go **one level deeper for every node** and fail with `RecursionError`
+     on a stack with more than about 1,000 nodes.
+   - `__reduce__` saves only the class and a **flat list of values**, top to bottom, from `__getstate__`.
+   - When loading, `__setstate__` pushes the values **in reverse order**, so the bottom value goes in first and the
+     top value ends up on top again.
+   - `__deepcopy__` registers the new stack in `memo` and rebuilds it from deep copies of the values.
+
+```
+def __setstate__(self, values):
+    self.top = None
+    for data in reversed(values):
+        self.push(data)
+```
+
+7. **Recycling Nodes (`node_pool`)**
+   - A stack that is constantly pushed and popped creates one node per `push` and drops one per `pop`.
+   - With `Stack(node_pool=NodePool(Node))` (`NodePool` from "01-Nodes/Implementing Node in Python"), `push` gets its
+     node from `node_pool.acquire(data)` and `pop` hands the unlinked node back with `node_pool.release(...)`, so the
+     next `push` can reuse it.
+   - `Node` has `__slots__` (smaller nodes) and a `reset` method that the pool uses to reinitialize a recycled node.
+   - The pool counts allocations, reuses and the high-water mark of nodes in use. Without a pool (the default),
+     nothing changes.
+
+```
+def pop(self):
+    if self.is_empty():
+        raise IndexError("pop from empty stack")
+    popped_node = self.top
+    popped_data = popped_node.data
+    self.top = popped_node.next
+    if self.node_pool is not None:
+        self.node_pool.release(popped_node)
+    return popped_data
+```
+
 ### 3. **Example Usage**
 
 Let's go through the example usage step by step:
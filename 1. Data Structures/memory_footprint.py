@@ -0,0 +1,500 @@
+# Memory footprint report: fills every container implementation of this unit (and every Node class) with the same
+# SIZE values and reports, as JSON, the bytes per element, the peak memory while filling and the number of objects
+# the garbage collector tracks. Save the report of each release and compare them to catch regressions:
+#
+#     python memory_footprint.py footprint.json
+
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from collections import deque
+
+DATA_STRUCTURES = os.path.dirname(os.path.abspath(__file__))
+SIZE = 10_000
+SINGLY_FOLDER = ("01-Linked Lists", "02-Singly Linked List")
+QUEUE_FOLDER = ("02-Queues", "02_Implementing Queues in Python")
+STACK_FOLDER = ("03-Stacks", "02_Implementing Stacks in Python")
+OPTIMIZED_MARKER = "# Optimized Version:"  # Files with two versions of a class keep the second one after this line
+FIRST_VALUE = 1_000  # Values from 1,000 up are not in CPython's cache of small ints, like most real data
+VALUES = list(range(FIRST_VALUE, FIRST_VALUE + SIZE))  # Made before measuring, so only the structures are counted
+KEYS = [f"key-{value}" for value in VALUES]  # HashMap keys, also made in advance
+
+
+def load_module(name, *path, until=None):
+    # Import a main.py from a folder of this unit.
+    # With `until`, only the source before that marker runs, which loads the first of two versions of a class.
+    filename = os.path.join(DATA_STRUCTURES, *path)
+    with open(filename, encoding="utf-8") as file:
+        source = file.read()
+    if until is not None:
+        source = source[: source.index(until)]
+
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader=None))
+    module.__file__ = filename
+    exec(compile(source, filename, "exec"), module.__dict__)
+    return module
+
+
+def source_of(module):
+    # Folder of a loaded main.py, relative to this unit, for the report
+    return os.path.relpath(os.path.dirname(module.__file__), DATA_STRUCTURES).replace(os.sep, "/")
+
+
+def node_chain(make_node):
+    # Build function that links one node per value; make_node(value, next_node) creates a node
+    def build(values):
+        head = None
+        for value in reversed(values):
+            head = make_node(value, head)
+        return head
+
+    return build
+
+
+def filled(make_container, add):
+    # Build function that creates an empty container and calls add(container, value) for every value
+    def build(values):
+        container = make_container()
+        for value in values:
+            add(container, value)
+        return container
+
+    return build
+
+
+def measure(build, values):
+    # Build the structure from values that already exist, so only the structure itself is counted
+    gc.collect()
+    tracked_before = len(gc.get_objects())
+
+    tracemalloc.start()
+    structure = build(values)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.collect()
+    tracked = len(gc.get_objects()) - tracked_before
+    del structure
+
+    return {
+        "bytes_per_element": round(current / len(values), 1),
+        "total_bytes": current,
+        "peak_bytes": peak,
+        "gc_tracked_objects": tracked,
+        "gc_tracked_per_element": round(tracked / len(values), 2),
+    }
+
+
+def footprint_cases():
+    # Return (name, source, build function) for every structure in the report
+    nodes = load_module("nodes", "01-Linked Lists", "01-Nodes", "Implementing Node in Python", "main.py")
+    singly = load_module(
+        "singly_linked_list", *SINGLY_FOLDER, "02-Implementing Singly Linked List in Python", "main.py"
+    )
+    array_backed = load_module("array_linked_list", *SINGLY_FOLDER, "03-Array-Backed Linked List in Python", "main.py")
+    skip = load_module("skip_list", *SINGLY_FOLDER, "04-Skip List in Python", "main.py")
+    unrolled = load_module("unrolled_linked_list", *SINGLY_FOLDER, "05-Unrolled Linked List in Python", "main.py")
+    persistent = load_module("persistent_linked_list", *SINGLY_FOLDER, "06-Persistent Linked List in Python", "main.py")
+    concurrent = load_module("concurrent_linked_list", *SINGLY_FOLDER, "07-Concurrent Linked List in Python", "main.py")
+    doubly = load_module(
+        "doubly_linked_list",
+        "01-Linked Lists",
+        "03-Doubly Linked List",
+        "Implementing Doubly Linked List in Python",
+        "main.py",
+    )
+    block_deque = load_module(
+        "block_deque", "01-Linked Lists", "03-Doubly Linked List", "Block Deque in Python", "main.py"
+    )
+    linked_queue = load_module("linked_queue", *QUEUE_FOLDER, "Implementing Queue Using a Linked List", "main.py")
+    list_queue = load_module(
+        "list_queue", *QUEUE_FOLDER, "Implementing Queue Using a List", "main.py", until=OPTIMIZED_MARKER
+    )
+    deque_queue = load_module("deque_queue", *QUEUE_FOLDER, "Implementing Queue Using a List", "main.py")
+    ring_queue = load_module("ring_buffer_queue", *QUEUE_FOLDER, "Implementing Queue Using a Ring Buffer", "main.py")
+    linked_stack = load_module("linked_stack", *STACK_FOLDER, "Implementing Stack Using a Linked List", "main.py")
+    list_stack = load_module("list_stack", *STACK_FOLDER, "Implementing Stack Using a List", "main.py")
+    hash_map_path = ("04-Hash Maps", "02_Implementing Hash Maps in Python", "main.py")
+    hash_map = load_module("hash_map", *hash_map_path, until=OPTIMIZED_MARKER)
+    optimized_hash_map = load_module("optimized_hash_map", *hash_map_path)
+
+    def doubly_node(value, next_node):
+        node = doubly.Node(value, next_node)
+        if next_node is not None:
+            next_node.set_prev_node(node)
+        return node
+
+    def data_node(node_class):
+        # Queue and Stack nodes take only their data; the link is the `next` attribute
+        def make_node(value, next_node):
+            node = node_class(value)
+            node.next = next_node
+            return node
+
+        return make_node
+
+    def add_pair(table, value):
+        # HashMaps store every value under its own key from KEYS
+        table.add(KEYS[value - FIRST_VALUE], value)
+
+    return [
+        ("Node (01-Nodes)", source_of(nodes), node_chain(nodes.Node)),
+        ("Node (LinkedList)", source_of(singly), node_chain(singly.Node)),
+        ("Node (DoublyLinkedList)", source_of(doubly), node_chain(doubly_node)),
+        ("Node (linked Queue)", source_of(linked_queue), node_chain(data_node(linked_queue.Node))),
+        ("Node (linked Stack)", source_of(linked_stack), node_chain(data_node(linked_stack.Node))),
+        ("LinkedList", source_of(singly), filled(singly.LinkedList, singly.LinkedList.insert_end)),
+        (
+            "LinkedList (indexed)",
+            source_of(singly),
+            filled(lambda: singly.LinkedList(indexed=True), singly.LinkedList.insert_end),
+        ),
+        (
+            "ArrayLinkedList",
+            source_of(array_backed),
+            filled(array_backed.ArrayLinkedList, array_backed.ArrayLinkedList.insert_end),
+        ),
+        ("SkipList", source_of(skip), filled(lambda: skip.SkipList(seed=1), skip.SkipList.insert)),
+        (
+            "UnrolledLinkedList",
+            source_of(unrolled),
+            filled(unrolled.UnrolledLinkedList, unrolled.UnrolledLinkedList.insert_end),
+        ),
+        ("PersistentLinkedList", source_of(persistent), persistent.PersistentLinkedList),
+        ("ConcurrentLinkedList", source_of(concurrent), concurrent.ConcurrentLinkedList),
+        ("DoublyLinkedList", source_of(doubly), filled(doubly.DoublyLinkedList, doubly.DoublyLinkedList.add_to_tail)),
+        (
+            "ArrayDoublyLinkedList",
+            source_of(doubly),
+            filled(doubly.ArrayDoublyLinkedList, doubly.ArrayDoublyLinkedList.add_to_tail),
+        ),
+        ("BlockDeque", source_of(block_deque), filled(block_deque.BlockDeque, block_deque.BlockDeque.add_to_tail)),
+        ("Queue (linked)", source_of(linked_queue), filled(linked_queue.Queue, linked_queue.Queue.enqueue)),
+        ("Queue (list)", source_of(list_queue), filled(list_queue.Queue, list_queue.Queue.enqueue)),
+        ("Queue (deque)", source_of(deque_queue), filled(deque_queue.Queue, deque_queue.Queue.enqueue)),
+        (
+            "RingBufferQueue",
+            source_of(ring_queue),
+            filled(ring_queue.RingBufferQueue, ring_queue.RingBufferQueue.enqueue),
+        ),
+        ("Stack (linked)", source_of(linked_stack), filled(linked_stack.Stack, linked_stack.Stack.push)),
+        ("Stack (list)", source_of(list_stack), filled(list_stack.Stack, list_stack.Stack.push)),
+        ("HashMap", source_of(hash_map), filled(hash_map.HashMap, add_pair)),
+        ("HashMap (optimized)", source_of(optimized_hash_map), filled(optimized_hash_map.HashMap, add_pair)),
+        ("list (built-in)", "builtins", filled(list, list.append)),
+        ("collections.deque", "collections", filled(deque, deque.append)),
+    ]
+
+
+def footprint_report():
+    # Measure every structure and return the report as a dictionary
+    results = []
+    for name, source, build in footprint_cases():
+        results.append({"name": name, "source": source, **measure(build, VALUES)})
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "elements": SIZE,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    report = json.dumps(footprint_report(), indent=2)
+    if len(sys.argv) > 1:
+        # Write the report to the given file, to keep it next to the reports of earlier releases
+        with open(sys.argv[1], "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+        print(f"Wrote {sys.argv[1]}")
+    else:
+        print(report)
+
+
+# Output:
+
+"""
+{
+  "python": "3.11.7",
+  "implementation": "CPython",
+  "elements": 10000,
+  "results": [
+    {
+      "name": "Node (01-Nodes)",
+      "source": "01-Linked Lists/01-Nodes/Implementing Node in Python",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480056,
+      "peak_bytes": 480104,
+      "gc_tracked_objects": 10000,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Node (LinkedList)",
+      "source": "01-Linked Lists/02-Singly Linked List/02-Implementing Singly Linked List in Python",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480056,
+      "peak_bytes": 480104,
+      "gc_tracked_objects": 10000,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Node (DoublyLinkedList)",
+      "source": "01-Linked Lists/03-Doubly Linked List/Implementing Doubly Linked List in Python",
+      "bytes_per_element": 56.0,
+      "total_bytes": 560056,
+      "peak_bytes": 560104,
+      "gc_tracked_objects": 10000,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Node (linked Queue)",
+      "source": "02-Queues/02_Implementing Queues in Python/Implementing Queue Using a Linked List",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480048,
+      "peak_bytes": 480096,
+      "gc_tracked_objects": 10000,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Node (linked Stack)",
+      "source": "03-Stacks/02_Implementing Stacks in Python/Implementing Stack Using a Linked List",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480048,
+      "peak_bytes": 480096,
+      "gc_tracked_objects": 10000,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "LinkedList",
+      "source": "01-Linked Lists/02-Singly Linked List/02-Implementing Singly Linked List in Python",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480400,
+      "peak_bytes": 480480,
+      "gc_tracked_objects": 10001,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "LinkedList (indexed)",
+      "source": "01-Linked Lists/02-Singly Linked List/02-Implementing Singly Linked List in Python",
+      "bytes_per_element": 107.1,
+      "total_bytes": 1070560,
+      "peak_bytes": 1070640,
+      "gc_tracked_objects": 10003,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "ArrayLinkedList",
+      "source": "01-Linked Lists/02-Singly Linked List/03-Array-Backed Linked List in Python",
+      "bytes_per_element": 16.6,
+      "total_bytes": 166308,
+      "peak_bytes": 166416,
+      "gc_tracked_objects": 3,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "SkipList",
+      "source": "01-Linked Lists/02-Singly Linked List/04-Skip List in Python",
+      "bytes_per_element": 160.7,
+      "total_bytes": 1606816,
+      "peak_bytes": 1607216,
+      "gc_tracked_objects": 20004,
+      "gc_tracked_per_element": 2.0
+    },
+    {
+      "name": "UnrolledLinkedList",
+      "source": "01-Linked Lists/02-Singly Linked List/05-Unrolled Linked List in Python",
+      "bytes_per_element": 10.6,
+      "total_bytes": 106120,
+      "peak_bytes": 106200,
+      "gc_tracked_objects": 315,
+      "gc_tracked_per_element": 0.03
+    },
+    {
+      "name": "PersistentLinkedList",
+      "source": "01-Linked Lists/02-Singly Linked List/06-Persistent Linked List in Python",
+      "bytes_per_element": 88.4,
+      "total_bytes": 883680,
+      "peak_bytes": 963760,
+      "gc_tracked_objects": 10001,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "ConcurrentLinkedList",
+      "source": "01-Linked Lists/02-Singly Linked List/07-Concurrent Linked List in Python",
+      "bytes_per_element": 184.4,
+      "total_bytes": 1843680,
+      "peak_bytes": 1843760,
+      "gc_tracked_objects": 20004,
+      "gc_tracked_per_element": 2.0
+    },
+    {
+      "name": "DoublyLinkedList",
+      "source": "01-Linked Lists/03-Doubly Linked List/Implementing Doubly Linked List in Python",
+      "bytes_per_element": 56.0,
+      "total_bytes": 560304,
+      "peak_bytes": 560384,
+      "gc_tracked_objects": 10001,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "ArrayDoublyLinkedList",
+      "source": "01-Linked Lists/03-Doubly Linked List/Implementing Doubly Linked List in Python",
+      "bytes_per_element": 32.8,
+      "total_bytes": 327828,
+      "peak_bytes": 327936,
+      "gc_tracked_objects": 5,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "BlockDeque",
+      "source": "01-Linked Lists/03-Doubly Linked List/Block Deque in Python",
+      "bytes_per_element": 9.9,
+      "total_bytes": 98600,
+      "peak_bytes": 98688,
+      "gc_tracked_objects": 315,
+      "gc_tracked_per_element": 0.03
+    },
+    {
+      "name": "Queue (linked)",
+      "source": "02-Queues/02_Implementing Queues in Python/Implementing Queue Using a Linked List",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480336,
+      "peak_bytes": 480384,
+      "gc_tracked_objects": 10001,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Queue (list)",
+      "source": "02-Queues/02_Implementing Queues in Python/Implementing Queue Using a List",
+      "bytes_per_element": 8.5,
+      "total_bytes": 85440,
+      "peak_bytes": 85488,
+      "gc_tracked_objects": 2,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "Queue (deque)",
+      "source": "02-Queues/02_Implementing Queues in Python/Implementing Queue Using a List",
+      "bytes_per_element": 8.3,
+      "total_bytes": 83448,
+      "peak_bytes": 83496,
+      "gc_tracked_objects": 2,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "RingBufferQueue",
+      "source": "02-Queues/02_Implementing Queues in Python/Implementing Queue Using a Ring Buffer",
+      "bytes_per_element": 13.2,
+      "total_bytes": 131712,
+      "peak_bytes": 328396,
+      "gc_tracked_objects": 2,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "Stack (linked)",
+      "source": "03-Stacks/02_Implementing Stacks in Python/Implementing Stack Using a Linked List",
+      "bytes_per_element": 48.0,
+      "total_bytes": 480336,
+      "peak_bytes": 480384,
+      "gc_tracked_objects": 10001,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "Stack (list)",
+      "source": "03-Stacks/02_Implementing Stacks in Python/Implementing Stack Using a List",
+      "bytes_per_element": 8.5,
+      "total_bytes": 85440,
+      "peak_bytes": 85488,
+      "gc_tracked_objects": 2,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "HashMap",
+      "source": "04-Hash Maps/02_Implementing Hash Maps in Python",
+      "bytes_per_element": 80.9,
+      "total_bytes": 809056,
+      "peak_bytes": 809448,
+      "gc_tracked_objects": 10012,
+      "gc_tracked_per_element": 1.0
+    },
+    {
+      "name": "HashMap (optimized)",
+      "source": "04-Hash Maps/02_Implementing Hash Maps in Python",
+      "bytes_per_element": 229.2,
+      "total_bytes": 2291920,
+      "peak_bytes": 3368328,
+      "gc_tracked_objects": 30482,
+      "gc_tracked_per_element": 3.05
+    },
+    {
+      "name": "list (built-in)",
+      "source": "builtins",
+      "bytes_per_element": 8.5,
+      "total_bytes": 85176,
+      "peak_bytes": 85224,
+      "gc_tracked_objects": 1,
+      "gc_tracked_per_element": 0.0
+    },
+    {
+      "name": "collections.deque",
+      "source": "collections",
+      "bytes_per_element": 8.3,
+      "total_bytes": 83128,
+      "peak_bytes": 83176,
+      "gc_tracked_objects": 1,
+      "gc_tracked_per_element": 0.0
+    }
+  ]
+}
+
+"""
+
+# =========================================================================================================================== #
+
+# Notes:
+
+"""
+- Measured on CPython 3.11 with 10,000 values. `bytes_per_element` is the memory the structure holds once it is full,
+divided by the number of values; the values themselves (and the HashMap keys) exist before the measurement starts
+and are not counted. `peak_bytes` also counts memory that was only needed while filling, such as the old bucket
+lists of a HashMap that resized.
+
+- `gc_tracked_per_element` is the number of objects the cyclic garbage collector has to visit on every full
+collection. Every linked node is one such object; the array-backed and list-based structures keep their values in
+a few large arrays or lists, so they add almost nothing, whatever their size.
+
+- Slotted nodes take 48 bytes (56 for `DoublyLinkedList`, which has one more link), six times the 8 bytes per value
+of a Python list or `deque`. `UnrolledLinkedList` and `ArrayLinkedList` come close to the list because they store
+many values per object, or the links in typed arrays.
+
+- `ArrayDoublyLinkedList` keeps the links of a doubly linked list as slot numbers in two `array("q")` columns, plus
+a third column of slot generations that makes stale handles fail: 32.8 bytes per value and no tracked object per
+value, against 56 bytes and one node for `DoublyLinkedList`. There are no reference cycles either, so a dropped list
+is freed at once (see `gc_benchmark.py` of the doubly linked list).
+
+- `BlockDeque` keeps the doubly linked design but links blocks of 64 values instead of single values: 9.9 bytes and
+0.03 tracked objects per value, close to `collections.deque`, whose block layout it copies.
+
+- `RingBufferQueue` takes 13.2 bytes per value: its buffer doubles, so 10,000 values sit in 16,384 slots. Its peak is
+2.5 times that, because `_resize` holds the old buffer, the slices of it and the new buffer at the same time.
+
+- `LinkedList(indexed=True)` costs 107 bytes per value with distinct values: one `value_index` entry and one
+`prev_nodes` entry per node on top of the 48-byte node. A value stores its node directly and only gets a `deque` once
+it is repeated, because even a `deque` holding one node takes 760 bytes; a `deque` per value would cost about 870
+bytes per value.
+
+- The nodes of `PersistentLinkedList`, `SkipList` and `ConcurrentLinkedList` have no `__slots__`, so each keeps a
+`__dict__` (88 bytes per node). On top of that, every `SkipList` node has a list of forward links and every
+`ConcurrentLinkedList` node a `threading.Lock`, which makes them three to four times the size of a slotted node.
+
+- The optimized `HashMap` takes almost three times the memory of the basic one: it keeps the load factor under 0.7
+by adding buckets, and every bucket is a list of its own, even when it is empty. The basic version keeps 10 buckets
+whatever the number of keys, which is small but makes every lookup O(n).
+
+- The `MappedLinkedList` is not in the report: its records live in a memory-mapped file, which `tracemalloc` does not
+see.
+"""